@@ -0,0 +1,18 @@
+from sympy_client.grammar.LatexParser import LatexParser
+
+import glob
+import os
+
+# Builds the parser of the default grammar, and stores it next to the grammar, see LatexParser.
+# This is run before packaging the sympy client, so the built parser can be shipped along with the grammar.
+if __name__ == "__main__":
+    parser_cache_file = LatexParser.get_parser_cache_file(LatexParser.DEFAULT_GRAMMAR_FILE)
+
+    # remove parsers built from previous versions of the grammar, so only the current one is shipped.
+    for stale_cache_file in glob.glob(os.path.join(os.path.dirname(parser_cache_file), "*.lark_cache")):
+        if stale_cache_file != parser_cache_file:
+            os.remove(stale_cache_file)
+
+    LatexParser()
+
+    print(f"Built parser at {parser_cache_file}")
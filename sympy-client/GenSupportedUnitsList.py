@@ -1,4 +1,5 @@
-from sympy_client.UnitsUtils import UNIT_ALIAS_MAP
+from sympy_client.UnitAliases import UNIT_ALIASES
+from sympy_client.UnitsUtils import resolve_unit
 from sympy.physics.units.quantities import Quantity, PhysicalConstant
 import pandas as pd
 
@@ -6,7 +7,8 @@ unit_aliases: dict[Quantity, set[str]] = dict()
 constant_aliases: dict[Quantity, set[str]] = dict()
 
 # Loop through all exported things in unit_definitions
-for alias, unit in UNIT_ALIAS_MAP.items():
+for alias, unit_source in UNIT_ALIASES.items():
+    unit = resolve_unit(*unit_source)
     
     if unit.is_prefixed:
         continue
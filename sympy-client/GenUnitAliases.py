@@ -0,0 +1,81 @@
+import sympy.physics.units as u
+import sympy.physics.units.definitions.unit_definitions as unit_definitions
+from sympy.physics.units.quantities import PhysicalConstant, Quantity
+from sympy.physics.units.systems import SI
+
+import os
+
+UNIT_ALIASES_FILE = os.path.join(os.path.dirname(__file__), "sympy_client", "UnitAliases.py")
+
+# Where a unit can be found, either as an attribute of the unit_definitions module,
+# or as one of the units of the SI unit system, which is where the prefixed units are defined.
+def get_unit_source(unit: Quantity, defined_units_quantities: dict[str, Quantity]) -> tuple[str, str]:
+    unit_attributes = [ unit_name for unit_name, defined_unit in defined_units_quantities.items() if defined_unit is unit ]
+    
+    if len(unit_attributes) > 0:
+        # prefer the attribute named after the unit itself.
+        return ("unit_definitions", str(unit) if str(unit) in unit_attributes else unit_attributes[0])
+    
+    if any(si_unit is unit for si_unit in SI._units):
+        return ("SI", str(unit))
+    
+    raise ValueError(f"Unit {unit} can neither be found in unit_definitions nor in the SI unit system")
+
+# Scan sympy for units, and map each of their aliases to where the unit can be found, see get_unit_source.
+# Aliases are added in order of priority, that is an alias is never overwritten by a later unit with the same alias.
+def build_unit_aliases() -> dict[str, tuple[str, str]]:
+    unit_aliases: dict[str, tuple[str, str]] = {}
+    
+    defined_units_quantities = { unit_name: getattr(unit_definitions, unit_name) for unit_name in dir(unit_definitions) if isinstance(getattr(unit_definitions, unit_name), Quantity) }
+    
+    def add_unit_aliases(str_units):
+        for alias, unit in str_units:
+            if alias not in unit_aliases:
+                unit_aliases[alias] = get_unit_source(unit, defined_units_quantities)
+    
+    # add SI units
+    add_unit_aliases(( (str(unit), unit) for unit in SI._units))
+    add_unit_aliases(( (str(unit.abbrev), unit) for unit in SI._units))
+
+    # add units specified in the defined_units module
+    add_unit_aliases(((key, unit)
+                    for key, unit in defined_units_quantities.items()
+                    if not isinstance(unit, PhysicalConstant)))
+
+    add_unit_aliases(((str(unit.abbrev), unit)
+                    for unit in defined_units_quantities.values()
+                    if not isinstance(unit, PhysicalConstant)))
+
+    add_unit_aliases(((key, unit)
+                    for key, unit in defined_units_quantities.items()
+                    if isinstance(unit, PhysicalConstant)))
+
+    add_unit_aliases(((str(unit.abbrev), unit)
+                    for unit in defined_units_quantities.values()
+                    if isinstance(unit, PhysicalConstant)))
+
+    # add LaTeX Math specific unit aliases.
+    add_unit_aliases([ ( 'min', u.minute ), ( 'sec', u.second ) ])
+    
+    # sort the aliases, so the generated module does not depend on the iteration order of the SI units.
+    return dict(sorted(unit_aliases.items()))
+
+def format_unit_aliases_module(unit_aliases: dict[str, tuple[str, str]]) -> str:
+    alias_lines = "".join(f"    {alias!r}: {unit_source!r},\n" for alias, unit_source in unit_aliases.items())
+    
+    return (
+        "# This file is generated by GenUnitAliases.py, do not edit it by hand.\n"
+        "\n"
+        "# Maps an alias to where its corresponding Quantity is found, that is either\n"
+        "# ('unit_definitions', attribute name) or ('SI', name of the unit in the SI unit system), see UnitsUtils.str_to_unit.\n"
+        "UNIT_ALIASES: dict[str, tuple[str, str]] = {\n"
+        f"{alias_lines}"
+        "}\n"
+    )
+
+# Regenerates the UnitAliases module, this should be rerun after upgrading sympy.
+if __name__ == "__main__":
+    with open(UNIT_ALIASES_FILE, "w", encoding="utf-8", newline="\n") as f:
+        f.write(format_unit_aliases_module(build_unit_aliases()))
+    
+    print(f"Generated {UNIT_ALIASES_FILE}")
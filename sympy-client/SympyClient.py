@@ -1,40 +1,62 @@
 from sympy_client.LatexMathClient import LatexMathClient
-from sympy_client.grammar.LatexParser import LatexParser
-from sympy_client.command_handlers.EvalHandler import EvalHandler
-from sympy_client.command_handlers.EvalfHandler import EvalfHandler
-from sympy_client.command_handlers.ExpandHandler import ExpandHandler
-from sympy_client.command_handlers.FactorHandler import FactorHandler
-from sympy_client.command_handlers.ApartHandler import ApartHandler
-from sympy_client.command_handlers.SolveHandler import SolveHandler
-from sympy_client.command_handlers.SymbolSetHandler import SymbolSetHandler
-from sympy_client.command_handlers.ConvertSympyHandler import ConvertSympyHandler
-from sympy_client.command_handlers.ConvertUnitsHandler import ConvertUnitsHandler
+from sympy_client.WorkerPool import WorkerPool
+from sympy_client.HandlerFactories import CACHED_HANDLER_KEYS, create_handlers
+from sympy_client.Warmup import DEFAULT_WARMUP_MESSAGES, load_warmup_messages
 
+import argparse
 import asyncio
-import sys
-
-if len(sys.argv) < 2:
-    print("Usage: python sympy_evaluator.py <port>")
-    sys.exit(1)
-
-port = int(sys.argv[1])
-
-latex_parser = LatexParser()
-
-client = LatexMathClient()
-
-client.register_handler("eval", EvalHandler(latex_parser))
-client.register_handler("evalf", EvalfHandler(latex_parser))
-client.register_handler("expand", ExpandHandler(latex_parser))
-client.register_handler("factor", FactorHandler(latex_parser))
-client.register_handler("apart", ApartHandler(latex_parser))
-client.register_handler("solve", SolveHandler(latex_parser))
-client.register_handler("symbolsets", SymbolSetHandler(latex_parser))
-client.register_handler("convert-sympy", ConvertSympyHandler(latex_parser))
-client.register_handler("convert-units", ConvertUnitsHandler(latex_parser))
-
-async def main():
-    await client.connect(port)
-    await client.run_message_loop()
-
-asyncio.run(main())
+import multiprocessing
+
+# Only the client itself is imported here, the handlers and sympy are imported by the worker processes,
+# so the client connects to the plugin without waiting on them.
+async def main(args: argparse.Namespace):
+    if args.no_warmup:
+        warmup_messages = []
+    elif args.warmup is not None:
+        warmup_messages = load_warmup_messages(args.warmup)
+    else:
+        warmup_messages = DEFAULT_WARMUP_MESSAGES
+
+    worker_pool = WorkerPool(
+        create_handlers,
+        worker_count=args.workers,
+        max_tasks_per_worker=args.max_tasks_per_worker,
+        preload_modules=[ "sympy_client.WorkerPreload" ],
+        warmup_messages=warmup_messages
+    )
+    result_cache = None
+
+    if args.result_cache is not None:
+        from sympy_client.ResultCache import ResultCache
+        result_cache = ResultCache(args.result_cache, CACHED_HANDLER_KEYS, max_bytes=args.result_cache_size * 1024 * 1024)
+
+    client = LatexMathClient(worker_pool=worker_pool, result_cache=result_cache)
+
+    try:
+        await client.connect(args.port)
+        # the workers warm up in the background, so the first command of the plugin does not pay for cold sympy caches.
+        worker_pool.start_warmup()
+        await client.run_message_loop()
+    finally:
+        worker_pool.shutdown()
+
+        if result_cache is not None:
+            result_cache.close()
+
+if __name__ == "__main__":
+    # required for worker processes to start in the pyinstaller executable.
+    multiprocessing.freeze_support()
+
+    arg_parser = argparse.ArgumentParser(description="Sympy client for the LaTeX Math obsidian plugin.")
+    arg_parser.add_argument("port", type=int, help="port of the websocket server hosted by the plugin.")
+    # more than one worker lets short commands finish while a long one is running.
+    arg_parser.add_argument("--workers", type=int, default=2, help="number of worker processes handling commands in parallel.")
+    arg_parser.add_argument("--max-tasks-per-worker", type=int, default=None, help="replace a worker process after it has handled this many commands, by default workers are never replaced.")
+
+    arg_parser.add_argument("--warmup", type=str, default=None, help="json file with a list of [ handler_key, message ] pairs, handled by the workers in the background after connecting, instead of the default warmup.")
+    arg_parser.add_argument("--no-warmup", action="store_true", help="do not warm up the workers after connecting.")
+
+    arg_parser.add_argument("--result-cache", type=str, default=None, help="sqlite database file storing the results of commands across restarts, by default results are not stored.")
+    arg_parser.add_argument("--result-cache-size", type=int, default=64, help="maximum size in MiB of the results stored in the result cache.")
+
+    asyncio.run(main(arg_parser.parse_args()))
@@ -0,0 +1,70 @@
+# Micro benchmark of the cost of encoding and decoding evaluate messages, with environments of increasing size.
+# Run from the sympy-client directory with: python -m benchmarks.Codec_bench
+
+import json
+import timeit
+
+import pandas as pd
+from sympy_client import MessageCodec
+from sympy_client.command_handlers.EvalHandlerBase import EvaluateMessage
+
+try:
+    import jsonpickle
+except ImportError:
+    jsonpickle = None
+
+DEFINITION_COUNTS = [ 10, 100, 1000 ]
+REPEATS = 5
+
+# Construct an evaluate message, whose environment has the given number of definitions,
+# split evenly between symbols, variables and functions, similar to what a long note produces.
+def create_message(definition_count: int) -> dict:
+    count = max(1, definition_count // 3)
+
+    return {
+        "expression": r"\frac{a_{0} + b_{1}}{f_{2}(x, y)}",
+        "environment": {
+            "symbols": { f"a_{{{i}}}": [ "real", "positive" ] for i in range(count) },
+            "variables": { f"b_{{{i}}}": rf"\frac{{a_{{{i}}}}}{{2}} + \sqrt{{{i}}} \cdot {{m}}" for i in range(count) },
+            "functions": { f"f_{{{i}}}": { "args": [ "x", "y" ], "expr": rf"x^{{{i}}} + \sin(y) \cdot b_{{{i}}}" } for i in range(definition_count - 2 * count) },
+            "unit_system": "SI",
+            "domain": "",
+        },
+    }
+
+# Time the given function, returns the best average time of a call in microseconds.
+def time_us(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=REPEATS)) / number * 1e6
+
+def main():
+    rows = []
+
+    for definition_count in DEFINITION_COUNTS:
+        message = create_message(definition_count)
+        payload = json.dumps(message)
+        number = max(10, 10000 // definition_count)
+
+        codecs = {
+            "json": (lambda: json.dumps(message), lambda: json.loads(payload)),
+            "MessageCodec": (lambda: MessageCodec.encode(message), lambda: MessageCodec.decode(payload)),
+            "MessageCodec + validation": (lambda: MessageCodec.encode(message), lambda: MessageCodec.decode(payload, EvaluateMessage)),
+        }
+
+        if jsonpickle is not None:
+            codecs["jsonpickle"] = (lambda: jsonpickle.encode(message), lambda: jsonpickle.decode(payload))
+
+        for codec_name, (encode, decode) in codecs.items():
+            rows.append({
+                "Definitions": definition_count,
+                "Payload (KiB)": round(len(payload) / 1024, 1),
+                "Codec": codec_name,
+                "Encode (us)": round(time_us(encode, number), 1),
+                "Decode (us)": round(time_us(decode, number), 1),
+            })
+
+    backend = "orjson" if MessageCodec.orjson is not None else "json"
+    print(f"\n### Codec Benchmark (MessageCodec backend: {backend})\n")
+    print(pd.DataFrame(rows).to_markdown(index=False))
+
+if __name__ == "__main__":
+    main()
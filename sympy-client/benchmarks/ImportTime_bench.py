@@ -0,0 +1,29 @@
+# Benchmark of the cold start of SympyClient.py, that is the time it takes to import it before it can connect to the plugin.
+# Import times depend on the load of the machine, so they are also reported relative to importing sympy, which the workers pay for instead.
+# Run from the sympy-client directory with: python -m benchmarks.ImportTime_bench
+
+import pandas as pd
+from tests.ImportTime_test import measure_import_time
+
+MODULES = [ "SympyClient", "sympy_client.LatexMathClient", "sympy" ]
+BASELINE_MODULE = "sympy"
+REPEATS = 5
+
+def main():
+    # the fastest of a few runs, so a single slow run on a busy machine does not skew the results.
+    import_times_us = { module_name: min(measure_import_time(module_name) for _ in range(REPEATS)) for module_name in MODULES }
+
+    rows = [
+        {
+            "Module": module_name,
+            "Import time (ms)": round(import_time_us / 1000, 1),
+            f"Relative to {BASELINE_MODULE}": round(import_time_us / import_times_us[BASELINE_MODULE], 3),
+        }
+        for module_name, import_time_us in import_times_us.items()
+    ]
+
+    print("\n### Import Time Benchmark\n")
+    print(pd.DataFrame(rows).to_markdown(index=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Micro benchmark of the throughput of the ScopePostLexer, compared to the time spent parsing the same expressions,
+# for long expressions containing many scopes, that is fractions, absolute values, parentheses, integrals and matrices.
+# Also measures the post lexer time per token of deeply nested scopes, which should not grow with the nesting depth.
+# Run from the sympy-client directory with: python -m benchmarks.PostLexer_bench
+
+import timeit
+
+import pandas as pd
+from sympy_client.grammar.LatexParser import LatexParser
+
+TERM_COUNTS = [ 10, 100, 1000 ]
+NESTING_DEPTHS = [ 10, 50, 100, 200 ]
+REPEATS = 5
+
+# Construct an expression of the given number of terms, cycling through terms which open different scopes.
+def create_expression(term_count: int) -> str:
+    terms = [
+        r"\frac{{a_{{{i}}}}}{{|x - {i}|}}",
+        r"\left( y + {i} \right) \cdot \sin(x)",
+        r"\int_{{0}}^{{{i}}} t^2 d t",
+        r"\begin{{bmatrix}} {i} & x \\ y & {i} \end{{bmatrix}}",
+        r"\frac{{d}}{{d x}} x^{{{i}}}",
+    ]
+
+    return " + ".join(terms[i % len(terms)].format(i=i) for i in range(term_count))
+
+# Construct an expression of the given kind, whose scopes are nested depth times.
+def create_nested_expression(kind: str, depth: int) -> str:
+    expression = "x"
+
+    for i in range(depth):
+        match kind:
+            case "fraction":
+                expression = rf"\frac{{{i}}}{{1 + {expression}}}"
+            case "parentheses":
+                expression = rf"\left( {i} + {expression} \right)"
+            case "abs":
+                # a bar inside an absolute value closes it, so nested absolute values are separated by parentheses.
+                expression = rf"|{i} + ({expression})|"
+            case "matrix":
+                expression = rf"\begin{{bmatrix}} {i} & {expression} \end{{bmatrix}}"
+
+    return expression
+
+# Parse the given expression, and return the tokens passed to the post lexer by the lexer,
+# so the post lexer can be timed on its own.
+def record_lexer_tokens(parser: LatexParser, expression: str) -> list:
+    post_lexer = parser.parser.options.postlex
+    process = post_lexer.process
+    lexer_tokens = []
+
+    def record_tokens(stream):
+        for token in stream:
+            lexer_tokens.append(token)
+            yield token
+
+    post_lexer.process = lambda stream: process(record_tokens(stream))
+
+    try:
+        parser.parser.parse(expression)
+    finally:
+        del post_lexer.process
+
+    return lexer_tokens
+
+# Time the given function, returns the best average time of a call in seconds.
+def time_s(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=REPEATS)) / number
+
+def main():
+    parser = LatexParser()
+    post_lexer = parser.parser.options.postlex
+
+    rows = []
+
+    for term_count in TERM_COUNTS:
+        expression = create_expression(term_count)
+        number = max(1, 1000 // term_count)
+
+        lexer_tokens = record_lexer_tokens(parser, expression)
+
+        post_lex_time = time_s(lambda: list(post_lexer.process(iter(lexer_tokens))), number)
+        parse_time = time_s(lambda: parser.parser.parse(expression), number)
+
+        rows.append({
+            "Terms": term_count,
+            "Tokens": len(lexer_tokens),
+            "Post lexer (tokens/s)": round(len(lexer_tokens) / post_lex_time),
+            "Post lexer (ms)": round(post_lex_time * 1000, 2),
+            "Parse (ms)": round(parse_time * 1000, 2),
+            "Post lexer share of parse": f"{post_lex_time / parse_time:.0%}",
+        })
+
+    print("\n### Post Lexer Benchmark\n")
+    print(pd.DataFrame(rows).to_markdown(index=False))
+
+    nested_rows = []
+
+    for kind in [ "fraction", "parentheses", "abs", "matrix" ]:
+        for depth in NESTING_DEPTHS:
+            lexer_tokens = record_lexer_tokens(parser, create_nested_expression(kind, depth))
+            post_lex_time = time_s(lambda: list(post_lexer.process(iter(lexer_tokens))), max(1, 2000 // depth))
+
+            nested_rows.append({
+                "Nesting": kind,
+                "Depth": depth,
+                "Tokens": len(lexer_tokens),
+                "Post lexer (ms)": round(post_lex_time * 1000, 2),
+                "Post lexer (us/token)": round(post_lex_time / len(lexer_tokens) * 1e6, 2),
+            })
+
+    print("\n### Nested Post Lexer Benchmark\n")
+    print(pd.DataFrame(nested_rows).to_markdown(index=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Micro benchmark of deserializing symbols in an LmatEnvDefStore, which happens for every identifier parsed in a note.
+# The interned symbol table is compared to the previous implementation, which copied the cached symbol, or constructed a new one, on every lookup.
+#
+# Symbols are also compared after sympy's cache has been cleared, e.g. by a long session evicting them,
+# where the previous implementation constructs new, equal but distinct, symbols in every store,
+# which affects the expressions simplify and solveset are called with in later commands.
+# Run from the sympy-client directory with: python -m benchmarks.SymbolTable_bench
+
+import timeit
+import tracemalloc
+from copy import copy
+
+import pandas as pd
+from sympy import Symbol, S, simplify, solveset
+from sympy.core.cache import clear_cache
+from sympy_client.grammar.LatexParser import LatexParser
+from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy_client.grammar.transformers.LatexTransformer import LatexTransformer
+
+SYMBOL_COUNT = 50
+TOKEN_COUNTS = [ 100, 1000, 5000 ]
+REPEATS = 5
+
+ENVIRONMENT = { "symbols": { f"x_{{{i}}}": [ "real" ] for i in range(0, SYMBOL_COUNT, 2) } }
+
+# The deserialize_symbol implementation before the symbol table was interned.
+class CopyingDefStore(LmatEnvDefStore):
+    def deserialize_symbol(self, symbol_latex: str):
+        return copy(self._cached_symbols.get(symbol_latex, Symbol(symbol_latex)))
+
+# The names of the given number of symbol tokens, cycling through the symbols of the environment, and as many symbols without assumptions.
+def create_tokens(token_count: int) -> list[str]:
+    return [ f"x_{{{i % SYMBOL_COUNT}}}" for i in range(token_count) ]
+
+# Time the given function, returns the best average time of a call in seconds.
+def time_s(func, number: int, repeat: int = REPEATS) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+# The peak memory in bytes allocated while calling the given function.
+def peak_allocated_bytes(func) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+def main():
+    parser = LatexParser(parse_cache_size=0)
+    rows = []
+
+    for token_count in TOKEN_COUNTS:
+        tokens = create_tokens(token_count)
+        parse_tree = parser.parser.parse(" + ".join(tokens))
+        number = max(1, 2000 // token_count)
+
+        for name, store_type in [ ("copy", CopyingDefStore), ("interned", LmatEnvDefStore) ]:
+            definitions_store = store_type(parser, ENVIRONMENT)
+            deserialize = lambda: [ definitions_store.deserialize_symbol(token) for token in tokens ]
+            transform = lambda: LatexTransformer(definitions_store).transform(parse_tree)
+            transform()
+
+            rows.append({
+                "Symbols": name,
+                "Tokens": token_count,
+                "Deserialize (us/token)": round(time_s(deserialize, number) / token_count * 1e6, 3),
+                "Deserialize peak memory (KiB)": round(peak_allocated_bytes(deserialize) / 1024, 1),
+                "Transform (ms)": round(time_s(transform, number) * 1000, 3),
+            })
+
+    print("\n### Symbol Deserialization Benchmark\n")
+    print(pd.DataFrame(rows).to_markdown(index=False))
+
+    rows = []
+    expression = r"\frac{x_{0}^2 - x_{1}^2}{x_{0} - x_{1}} + x_{2} x_{3} - x_{3} x_{2}"
+    equation = r"x_{0}^2 - 2 x_{0} x_{1} + x_{1}^2"
+
+    for name, store_type in [ ("copy", CopyingDefStore), ("interned", LmatEnvDefStore) ]:
+        clear_cache()
+        # the first command builds its symbols, and caches the results of simplify and solveset.
+        first_store = store_type(parser, ENVIRONMENT)
+        first_symbol = first_store.deserialize_symbol("x_{1}")
+        simplify(parser.parse(expression, first_store))
+        solveset(parser.parse(equation, first_store), first_symbol, S.Reals)
+
+        # every later command deserializes its symbols in a new store, after sympy's cache has evicted them.
+        def later_command():
+            clear_cache()
+            later_store = store_type(parser, ENVIRONMENT)
+            symbol = later_store.deserialize_symbol("x_{1}")
+            simplify(parser.parse(expression, later_store))
+            solveset(parser.parse(equation, later_store), symbol, S.Reals)
+
+            return symbol
+
+        rows.append({
+            "Symbols": name,
+            "Same instance across stores": later_command() is first_symbol,
+            "Simplify + solveset (ms)": round(time_s(later_command, 5) * 1000, 3),
+        })
+
+    print("\n### Downstream Benchmark\n")
+    print(pd.DataFrame(rows).to_markdown(index=False))
+
+if __name__ == "__main__":
+    main()
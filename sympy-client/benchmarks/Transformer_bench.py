@@ -0,0 +1,79 @@
+# Micro benchmark of the time spent by the LatexTransformer constructing long sums and products,
+# e.g. expanded polynomials pasted from other tools, which should grow linearly with the number of terms.
+# The transform time is compared to adding / multiplying the same terms one at a time, which is quadratic in the number of terms.
+# Run from the sympy-client directory with: python -m benchmarks.Transformer_bench
+
+import functools
+import operator
+import random
+import timeit
+
+import pandas as pd
+from sympy import Add, Mul
+from sympy_client.grammar.LatexParser import LatexParser
+from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy_client.grammar.transformers.LatexTransformer import LatexTransformer
+
+TERM_COUNTS = [ 10, 100, 1000, 5000 ]
+# adding terms one at a time takes seconds for a thousand terms, so it is only timed once, and not for larger expressions.
+SEQUENTIAL_MAX_TERMS = 1000
+REPEATS = 3
+
+# Construct an expanded polynomial in x, y and z of the given number of terms, with random integer and float coefficients.
+def create_polynomial(term_count: int) -> str:
+    rng = random.Random(term_count)
+    terms = []
+
+    for i in range(term_count):
+        coefficient = rng.choice([ str(rng.randint(1, 99)), f"{rng.uniform(0, 10):.3f}" ])
+        terms.append(rf"{coefficient} x^{{{i % 13}}} y^{{{i % 7}}} z^{{{i // 91}}}")
+
+    return " + ".join(terms)
+
+# Construct a product of the given number of factors, alternating between multiplication, division and implicit multiplication.
+def create_product(factor_count: int) -> str:
+    operators = [ r" \cdot ", " / ", " " ]
+    expression = "a_{0}"
+
+    for i in range(1, factor_count):
+        expression += operators[i % len(operators)] + f"a_{{{i}}}^{{{i % 5 + 1}}}"
+
+    return expression
+
+# Time the given function, returns the best average time of a call in seconds.
+def time_s(func, number: int, repeat: int = REPEATS) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+def main():
+    parser = LatexParser(parse_cache_size=0)
+    definitions_store = LmatEnvDefStore(parser, {})
+
+    rows = []
+
+    for kind, create_expression, operation, sequential_operator in [
+        ("sum", create_polynomial, Add, operator.add),
+        ("product", create_product, Mul, operator.mul),
+    ]:
+        for term_count in TERM_COUNTS:
+            parse_tree = parser.parser.parse(create_expression(term_count))
+            number = max(1, 200 // term_count)
+
+            result = LatexTransformer(definitions_store).transform(parse_tree)
+            operands = list(result.args) if isinstance(result, operation) else [ result ]
+
+            transform_time = time_s(lambda: LatexTransformer(definitions_store).transform(parse_tree), number)
+            sequential_time = time_s(lambda: functools.reduce(sequential_operator, operands), 1, 1) if term_count <= SEQUENTIAL_MAX_TERMS else None
+
+            rows.append({
+                "Expression": kind,
+                "Terms": term_count,
+                "Transform (ms)": round(transform_time * 1000, 2),
+                "Transform (us/term)": round(transform_time / term_count * 1e6, 2),
+                "One at a time (ms)": round(sequential_time * 1000, 2) if sequential_time is not None else None,
+            })
+
+    print("\n### Transformer Benchmark\n")
+    print(pd.DataFrame(rows).to_markdown(index=False))
+
+if __name__ == "__main__":
+    main()
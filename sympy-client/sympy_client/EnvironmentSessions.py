@@ -0,0 +1,180 @@
+import itertools
+import threading
+from typing import Any, Callable, NamedTuple
+
+from .LmatEnvironment import LmatEnvironment, LmatEnvironmentDelta
+
+# Raised when a message refers to a session which is not open.
+class UnknownSessionError(LookupError):
+    def __init__(self, session_id: str):
+        super().__init__(f"Unknown environment session: {session_id}")
+        self.session_id = session_id
+
+# The tables of an environment, which are changed entry by entry by a delta.
+ENVIRONMENT_TABLES = ('symbols', 'variables', 'functions')
+# The entries of an environment, which are replaced as a whole by a delta.
+ENVIRONMENT_SETTINGS = ('unit_system', 'domain')
+
+# The number of deltas kept for each session, a process which is further behind receives the entire environment instead.
+SESSION_DELTA_HISTORY = 16
+
+# Functions evicting anything a process keeps for a session, e.g. its definitions store, mapped to by their names.
+# They are called with the id of each session closed in the process.
+_session_evictors: dict[str, Callable[[str], None]] = {}
+
+# Call evict_session with the id of every session closed in the current process, see EnvironmentSessions.close.
+def register_session_evictor(evictor_name: str, evict_session: Callable[[str], None]):
+    _session_evictors[evictor_name] = evict_session
+
+# The changes bringing a process from the version of a session it knows, to a newer version, see SessionState.get_sync.
+class SessionSync(NamedTuple):
+    session_id: str
+    version: int
+    # the entire environment of the version, if the process does not know a version the deltas can be applied to.
+    environment: LmatEnvironment | None
+    # the deltas leading up to the version, as pairs of the version each delta is applied to and the delta.
+    deltas: tuple[tuple[int, LmatEnvironmentDelta], ...]
+
+# A snapshot of a session, each update of the session results in a new state with a new version.
+class SessionState(NamedTuple):
+    session_id: str
+    version: int
+    environment: LmatEnvironment
+    # the last SESSION_DELTA_HISTORY deltas leading up to the version, see SessionSync.deltas.
+    deltas: tuple[tuple[int, LmatEnvironmentDelta], ...]
+
+    # Get the sync bringing a process knowing the given version of the session, if any, to this version.
+    def get_sync(self, known_version: int | None) -> SessionSync:
+        if known_version == self.version:
+            return SessionSync(self.session_id, self.version, None, ())
+
+        for i, (delta_version, _) in enumerate(self.deltas):
+            if delta_version == known_version:
+                return SessionSync(self.session_id, self.version, None, self.deltas[i:])
+
+        return SessionSync(self.session_id, self.version, self.environment, ())
+
+#
+# The EnvironmentSessions keep the environments of the notes open in the plugin, see the env-open, env-update and env-close handlers.
+# Instead of sending the entire environment of a note with every message, the plugin sends it once when the session is opened,
+# and afterwards only the entries which changed, while messages refer to the environment by the id of its session.
+#
+# Sessions live in the client process, which fills in the environment of a message referring to a session,
+# before it is handled by a handler registered on the client itself.
+# Worker processes keep their own EnvironmentSessions, which the client brings up to date with each message it sends them,
+# by the deltas since the version of the session the worker knows, so only the changed entries are sent, see SessionState.get_sync.
+# Workers keep a definitions store for each session, which is updated to the environment of the next message in the session,
+# so only the definitions depending on the changed entries are resolved again, see LmatEnvDefStoreCache.
+#
+# Every state of every session has a distinct version, also across sessions reopened with the same id.
+#
+class EnvironmentSessions:
+    def __init__(self, on_close: Callable[[str], None] | None = None):
+        self._sessions: dict[str, SessionState] = {}
+        self._versions = itertools.count(1)
+        self._on_close = on_close
+        # sessions are changed by handlers running on the executor, while messages are resolved on the event loop.
+        self._lock = threading.Lock()
+
+    # Open a session with the given environment, replacing the session with the same id, if any.
+    def open(self, session_id: str, environment: LmatEnvironment, version: int | None = None):
+        with self._lock:
+            self._sessions[session_id] = SessionState(session_id, self._next_version(version), environment, ())
+
+    # Apply the given delta to the environment of the session, and return the resulting environment.
+    def update(self, session_id: str, delta: LmatEnvironmentDelta, version: int | None = None) -> LmatEnvironment:
+        with self._lock:
+            state = self._get_state(session_id)
+
+            self._sessions[session_id] = SessionState(
+                session_id,
+                self._next_version(version),
+                apply_delta(state.environment, delta),
+                (*state.deltas, (state.version, delta))[-SESSION_DELTA_HISTORY:]
+            )
+
+            return self._sessions[session_id].environment
+
+    # Close the session, returns whether it was open.
+    def close(self, session_id: str) -> bool:
+        with self._lock:
+            was_open = self._sessions.pop(session_id, None) is not None
+
+        for evict_session in _session_evictors.values():
+            evict_session(session_id)
+
+        if self._on_close is not None:
+            self._on_close(session_id)
+
+        return was_open
+
+    # Bring the session to the version of the given sync, see SessionState.get_sync.
+    def apply_sync(self, sync: SessionSync):
+        if sync.environment is not None:
+            self.open(sync.session_id, sync.environment, sync.version)
+            return
+
+        delta_versions = [ delta_version for delta_version, _ in sync.deltas[1:] ] + [ sync.version ]
+
+        for (_, delta), delta_version in zip(sync.deltas, delta_versions):
+            self.update(sync.session_id, delta, delta_version)
+
+    def get_state(self, session_id: str) -> SessionState:
+        with self._lock:
+            return self._get_state(session_id)
+
+    # Get the state of the session the given message refers to, None if it refers to none, or has an environment of its own.
+    def get_message_state(self, message: Any) -> SessionState | None:
+        if not isinstance(message, dict) or 'session_id' not in message or 'environment' in message:
+            return None
+
+        return self.get_state(message['session_id'])
+
+    # Get the given message with the environment of the session it refers to, if it refers to one and has no environment of its own.
+    def resolve_message(self, message: Any) -> Any:
+        state = self.get_message_state(message)
+
+        if state is None:
+            return message
+
+        return dict(message, environment=state.environment)
+
+    def _get_state(self, session_id: str) -> SessionState:
+        if session_id not in self._sessions:
+            raise UnknownSessionError(session_id)
+
+        return self._sessions[session_id]
+
+    # versions are given when mirroring the sessions of another process.
+    def _next_version(self, version: int | None) -> int:
+        return next(self._versions) if version is None else version
+
+# Get the environment resulting from applying the given delta to the given environment.
+# The environment is not modified, as it may be in use by messages which are being handled.
+def apply_delta(environment: LmatEnvironment, delta: LmatEnvironmentDelta) -> LmatEnvironment:
+    environment = dict(environment)
+
+    for table_name in ENVIRONMENT_TABLES:
+        if table_name not in delta:
+            continue
+
+        table = dict(environment.get(table_name, {}))
+
+        for entry_name, entry in delta[table_name].items():
+            if entry is None:
+                table.pop(entry_name, None)
+            else:
+                table[entry_name] = entry
+
+        environment[table_name] = table
+
+    for setting_name in ENVIRONMENT_SETTINGS:
+        if setting_name not in delta:
+            continue
+
+        if delta[setting_name] is None:
+            environment.pop(setting_name, None)
+        else:
+            environment[setting_name] = delta[setting_name]
+
+    return environment
@@ -0,0 +1,128 @@
+from functools import cache
+from typing import TYPE_CHECKING
+
+from .command_handlers.CommandHandler import CommandHandler
+from .EnvironmentSessions import register_session_evictor
+from .Metrics import register_cache_stats
+
+if TYPE_CHECKING:
+    from .grammar.LatexParser import LatexParser
+    from .grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
+    from .SimplifyCache import SimplifyCache
+
+#
+# Factories of the command handlers served by SympyClient.py.
+# The handlers are registered by the path of their factory, see HandlerRegistry,
+# so each handler module, and sympy itself, is only imported once a handler is first used.
+#
+# The imports are kept inside the factories, as opposed to being resolved from strings,
+# so they are still found by pyinstaller.
+#
+
+# The handlers registered in every worker process.
+def create_handlers() -> dict[str, CommandHandler | str]:
+    return {
+        "eval": "sympy_client.HandlerFactories:create_eval_handler",
+        "evalf": "sympy_client.HandlerFactories:create_evalf_handler",
+        "expand": "sympy_client.HandlerFactories:create_expand_handler",
+        "factor": "sympy_client.HandlerFactories:create_factor_handler",
+        "apart": "sympy_client.HandlerFactories:create_apart_handler",
+        "convert-units": "sympy_client.HandlerFactories:create_convert_units_handler",
+        "solve": "sympy_client.HandlerFactories:create_solve_handler",
+        "symbolsets": "sympy_client.HandlerFactories:create_symbol_set_handler",
+        "convert-sympy": "sympy_client.HandlerFactories:create_convert_sympy_handler",
+        "batch": "sympy_client.HandlerFactories:create_batch_handler",
+    }
+
+# The handlers whose results only depend on their message, and can be stored in a ResultCache.
+# Batch results are streamed in parts, which a stored result would not replay.
+CACHED_HANDLER_KEYS = [ "eval", "evalf", "expand", "factor", "apart", "convert-units", "solve", "symbolsets", "convert-sympy" ]
+
+# The parser shared between all handlers.
+# It is constructed by sympy_client.WorkerPreload, if workers are forked from a forkserver.
+@cache
+def latex_parser() -> 'LatexParser':
+    from .grammar.LatexParser import LatexParser
+
+    parser = LatexParser()
+    register_cache_stats('parse_tree', parser.get_parse_cache_stats)
+
+    return parser
+
+# The definition stores of recently used environments, shared between all handlers,
+# so e.g. factoring an expression after evaluating it does not set up the environment of the note again.
+@cache
+def definitions_stores() -> 'LmatEnvDefStoreCache':
+    from .grammar.LmatEnvDefStore import intern_symbol
+    from .grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
+
+    store_cache = LmatEnvDefStoreCache(latex_parser())
+    register_cache_stats('definitions_store', store_cache.get_stats)
+
+    def symbol_table_stats():
+        cache_info = intern_symbol.cache_info()
+        return dict(size=cache_info.currsize, max_size=cache_info.maxsize, hits=cache_info.hits, misses=cache_info.misses)
+
+    register_cache_stats('symbols', symbol_table_stats)
+    register_session_evictor('definitions_store', store_cache.evict_session)
+
+    return store_cache
+
+# The simplified expressions shared between the eval, expand, factor and apart handlers,
+# so e.g. factoring an expression after evaluating it does not simplify it again.
+@cache
+def simplified_exprs() -> 'SimplifyCache':
+    from .SimplifyCache import SimplifyCache
+
+    simplify_cache = SimplifyCache()
+    register_cache_stats('simplify', simplify_cache.get_stats)
+
+    return simplify_cache
+
+def create_eval_handler():
+    from .command_handlers.EvalHandler import EvalHandler
+    return EvalHandler(latex_parser(), definitions_stores(), simplified_exprs())
+
+def create_evalf_handler():
+    from .command_handlers.EvalfHandler import EvalfHandler
+    return EvalfHandler(latex_parser(), definitions_stores())
+
+def create_expand_handler():
+    from .command_handlers.ExpandHandler import ExpandHandler
+    return ExpandHandler(latex_parser(), definitions_stores(), simplified_exprs())
+
+def create_factor_handler():
+    from .command_handlers.FactorHandler import FactorHandler
+    return FactorHandler(latex_parser(), definitions_stores(), simplified_exprs())
+
+def create_apart_handler():
+    from .command_handlers.ApartHandler import ApartHandler
+    return ApartHandler(latex_parser(), definitions_stores(), simplified_exprs())
+
+def create_convert_units_handler():
+    from .command_handlers.ConvertUnitsHandler import ConvertUnitsHandler
+    return ConvertUnitsHandler(latex_parser(), definitions_stores())
+
+def create_solve_handler():
+    from .command_handlers.SolveHandler import SolveHandler
+    return SolveHandler(latex_parser(), definitions_stores())
+
+def create_symbol_set_handler():
+    from .command_handlers.SymbolSetHandler import SymbolSetHandler
+    return SymbolSetHandler(latex_parser(), definitions_stores())
+
+def create_convert_sympy_handler():
+    from .command_handlers.ConvertSympyHandler import ConvertSympyHandler
+    return ConvertSympyHandler(latex_parser(), definitions_stores())
+
+def create_batch_handler():
+    from .command_handlers.BatchHandler import BatchHandler
+
+    return BatchHandler(latex_parser(), {
+        "eval": create_eval_handler(),
+        "evalf": create_evalf_handler(),
+        "expand": create_expand_handler(),
+        "factor": create_factor_handler(),
+        "apart": create_apart_handler(),
+        "convert-units": create_convert_units_handler(),
+    }, definitions_stores())
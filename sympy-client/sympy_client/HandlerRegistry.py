@@ -0,0 +1,50 @@
+import importlib
+import threading
+
+from .command_handlers.CommandHandler import CommandHandler
+
+#
+# The HandlerRegistry maps handler keys to the command handlers registered for them.
+# A handler is either registered directly, or lazily by the path of a function constructing it,
+# written as 'package.module:function', e.g. 'sympy_client.HandlerFactories:create_eval_handler'.
+#
+# Lazily registered handlers are imported and constructed the first time they are used,
+# so a process never waits on importing handlers it does not use,
+# and the handler keys are known without importing anything.
+#
+class HandlerRegistry:
+    def __init__(self, handlers: dict[str, CommandHandler | str] = {}):
+        self._handlers: dict[str, CommandHandler | str] = dict(handlers)
+        # handlers may be resolved from several executor threads at once.
+        self._resolve_lock = threading.Lock()
+
+    def register_handler(self, handler_key: str, handler: CommandHandler | str):
+        self._handlers[handler_key] = handler
+
+    def keys(self) -> list[str]:
+        return list(self._handlers.keys())
+
+    def __contains__(self, handler_key: str) -> bool:
+        return handler_key in self._handlers
+
+    # Get the handler registered at handler_key, importing and constructing it if it was registered by path.
+    def get_handler(self, handler_key: str) -> CommandHandler:
+        handler = self._handlers[handler_key]
+
+        if isinstance(handler, str):
+            with self._resolve_lock:
+                handler = self._handlers[handler_key]
+
+                if isinstance(handler, str):
+                    handler = self._handlers[handler_key] = HandlerRegistry._construct_handler(handler)
+
+        return handler
+
+    @staticmethod
+    def _construct_handler(factory_path: str) -> CommandHandler:
+        module_path, separator, factory_name = factory_path.partition(':')
+
+        if separator == "":
+            raise ValueError(f"Handler path '{factory_path}' is not of the form 'package.module:function'")
+
+        return getattr(importlib.import_module(module_path), factory_name)()
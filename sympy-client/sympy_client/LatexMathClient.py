@@ -1,52 +1,291 @@
-from .command_handlers.CommandHandler import CommandHandler
+from .command_handlers.CommandHandler import CommandHandler, CommandResult, CancelledResult, TimeoutResult, handle_message
+from .command_handlers.CacheClearHandler import CacheClearHandler
+from .command_handlers.EnvironmentSessionHandlers import EnvCloseHandler, EnvOpenHandler, EnvUpdateHandler
+from .command_handlers.StatsHandler import StatsHandler
+from .EnvironmentSessions import EnvironmentSessions, UnknownSessionError
+from .HandlerRegistry import HandlerRegistry
+from .Metrics import MetricsRegistry, register_cache_stats
+from .WorkerPool import WorkerPool, WorkerError
+from . import MessageCodec
 
+import asyncio
+import itertools
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import *
+
+if TYPE_CHECKING:
+    from .ResultCache import ResultCache
 import websockets
 import traceback
 
-import jsonpickle
+# Handler keys of the built in session handlers, whose session_id refers to the session they change, instead of the environment of the message.
+ENVIRONMENT_SESSION_HANDLER_KEYS = ("env-open", "env-update", "env-close")
+
+class CancelMessage(TypedDict):
+    target_request_id: Any
 
 #
 # The LatexMathClient class manages a connection and message parsing + encoding between an active Latex Math plugin.
 # The connection works based on 'handle keys', which act like message types.
 # A handle key is simply a string indicating what sort of data is sent as the payload, and how it should be handled.
-# The payload is always a json object decoded into a python object.
+# The payload is always a json object decoded into a python object, see MessageCodec.
 #
 # Each handle key has a handler registered, which is called with the received payload.
+# Handlers are either registered on the client, directly or lazily by path, see HandlerRegistry, or constructed in the processes of a WorkerPool.
+#
+# Messages are framed as 'handler_key|payload'.
+# If the payload contains a 'request_id' key, the message follows the versioned protocol:
+# it is handled concurrently with any other in flight request, and its reply echoes the request_id.
+# Replies to versioned messages may therefore arrive in a different order than the messages were sent.
+# Messages without a request_id are handled one at a time in the order they are received, which older plugin builds rely on.
+#
+# Any message may contain a 'deadline_ms' key, if its handler has not finished within this many milliseconds,
+# a result with status 'timeout' is sent instead. Versioned messages can also be stopped with a 'cancel' message,
+# whose 'target_request_id' is the id of the request to stop, which results in a reply with status 'cancelled'.
+# If the handler runs in a WorkerPool, its worker process is killed, so the cpu time is actually freed.
+# An 'exit' message cancels every pending request, versioned or not, before it is replied to.
+#
+# Messages may refer to the environment of a session with a 'session_id' key, instead of containing an 'environment' key.
+# Sessions are opened, changed and closed by the built in 'env-open', 'env-update' and 'env-close' handlers, see EnvironmentSessions.
+# Workers only receive the changes to a session since the last message they handled in it.
+#
+# If the client has a ResultCache, successful results of the handler keys it caches are stored in it,
+# and answered from it when the same message, in the same environment, is received again, even after a restart.
+# The built in 'cache-clear' handler deletes the stored results.
+#
+# Handlers returning a StreamedResult send each of its parts as a 'partial' message, before the final 'result' message.
+#
+# Any message may contain a truthy 'timing' key, which adds the wall and cpu time spent in each phase of handling it,
+# e.g. parsing, evaluating and printing, to the 'timing' key of the result metadata, see PhaseTimer.
+#
+# Handlers are always run off the event loop, on the given executor, so the connection stays responsive during long evaluations.
+#
+# The outcome and latency of every request is recorded in the clients MetricsRegistry,
+# which is served together with the memory and cache usage of the client and its workers by the built in 'stats' handler.
 #
 class LatexMathClient:
-    def __init__(self):
-        self.handlers: dict[str, CommandHandler] = {}
+    def __init__(self, executor: Executor | None = None, worker_pool: WorkerPool | None = None, result_cache: 'ResultCache | None' = None):
+        self.handlers = HandlerRegistry()
         self.connection = None
+        self.executor = executor if executor is not None else ThreadPoolExecutor(thread_name_prefix="LatexMathHandler")
+        self.worker_pool = worker_pool
+        # maps the request id of each in flight versioned request to an event which cancels it when set.
+        self._in_flight_requests: dict[Any, asyncio.Event] = {}
+        # the cancel events of every pending request, both versioned and legacy ones, which are set on exit.
+        self._cancel_events: set[asyncio.Event] = set()
+        self._request_tasks: set[asyncio.Task] = set()
+        # the last legacy request, which the next legacy request waits for, so they are still handled one at a time.
+        self._last_legacy_task: asyncio.Task | None = None
+        # identifies a request in the worker pool, as legacy messages have no request id.
+        self._request_keys = itertools.count()
+        self.metrics = MetricsRegistry()
+
+        # closed sessions are also closed in the workers, so they evict the definitions stores of them.
+        self.sessions = EnvironmentSessions(on_close=worker_pool.close_session if worker_pool is not None else None)
+        self.result_cache = result_cache
+
+        if result_cache is not None:
+            register_cache_stats('results', result_cache.get_stats)
+
+        self.register_handler("stats", StatsHandler(self.metrics, worker_pool))
+        self.register_handler("env-open", EnvOpenHandler(self.sessions))
+        self.register_handler("env-update", EnvUpdateHandler(self.sessions))
+        self.register_handler("env-close", EnvCloseHandler(self.sessions))
+        self.register_handler("cache-clear", CacheClearHandler(result_cache))
 
     # Connect to a Latex Math plugin currently hosting on the local host at the given port.
+    # This does not wait for the worker pool, if any, so its workers start up while the connection is established.
     async def connect(self, port: int):
         self.connection = await websockets.connect(f"ws://localhost:{port}")
 
-    # Register a message handler.
-    def register_handler(self, handler_key: str, handler_factory: CommandHandler):
-        self.handlers[handler_key] = handler_factory
-    
+    # Register a message handler, either directly or by the path of a function constructing it, see HandlerRegistry.
+    def register_handler(self, handler_key: str, handler: CommandHandler | str):
+        self.handlers.register_handler(handler_key, handler)
+
     # Send the given json dumpable object back to the plugin.
-    async def send(self, handler_key: str, message: dict):
-        await self.connection.send(f"{handler_key}|{jsonpickle.encode(message)}")
+    # If a request_id is given, it is included in the message, so the plugin can match it with its request.
+    async def send(self, handler_key: str, message: dict, request_id: Any = None):
+        if request_id is not None:
+            message = dict(message, request_id=request_id)
+
+        await self.connection.send(f"{handler_key}|{MessageCodec.encode(message)}")
 
     # Start the message loop, this is required to run, before any handlers will be called.
     async def run_message_loop(self):
         while True:
             message = await self.connection.recv()
-            handler_key, payload = message.split("|", 1)
+
+            try:
+                handler_key, payload = message.split("|", 1)
+                loaded_payload = MessageCodec.decode(payload)
+            except Exception as e:
+                await self.send("error", dict(message=str(e) + "\n" + traceback.format_exc()))
+                continue
+
+            request_id = None
+            deadline_ms = None
+
+            if isinstance(loaded_payload, dict):
+                request_id = loaded_payload.pop('request_id', None)
+                deadline_ms = loaded_payload.pop('deadline_ms', None)
 
             if handler_key == "exit":
-                await self.send("exit", {})
+                # pending requests are cancelled, so a runaway request cannot hold up the exit,
+                # they still reply before the exit is acknowledged, so the exit reply is always the last message sent.
+                for cancel_event in self._cancel_events:
+                    cancel_event.set()
+
+                await asyncio.gather(*self._request_tasks)
+                await self.send("exit", {}, request_id)
                 break
-            
-            if handler_key in self.handlers:
+
+            if handler_key == "cancel":
                 try:
-                    loaded_payload = jsonpickle.decode(payload)
-                    command_result = self.handlers[handler_key].handle(loaded_payload)
-                    await self.send('result', command_result.getPayload())
-                except Exception as e:
-                    await self.send("error", dict(message=str(e) + "\n" + traceback.format_exc()))
+                    MessageCodec.validate(loaded_payload, CancelMessage)
+                except MessageCodec.MessageValidationError as e:
+                    await self.send("error", dict(message=str(e)), request_id)
+                    continue
+
+                cancelled = self._cancel(loaded_payload['target_request_id'])
+                await self.send('result', CommandResult.result(dict(cancelled=cancelled)), request_id)
+                continue
+
+            cancel_event = asyncio.Event()
+            self._cancel_events.add(cancel_event)
+
+            if request_id is None:
+                # legacy requests are also handled in a task, so messages, e.g. exit, are still received while they run.
+                request_task = asyncio.create_task(self._handle_legacy_message(self._last_legacy_task, handler_key, loaded_payload, deadline_ms, cancel_event))
+                self._last_legacy_task = request_task
+            else:
+                self._in_flight_requests[request_id] = cancel_event
+                request_task = asyncio.create_task(self._handle_message(handler_key, loaded_payload, request_id, deadline_ms, cancel_event))
+
+            self._request_tasks.add(request_task)
+            request_task.add_done_callback(self._request_tasks.discard)
+
+    # Handle a legacy message once the previous legacy message, if any, has been replied to.
+    async def _handle_legacy_message(self, previous_task: asyncio.Task | None, handler_key: str, payload: Any, deadline_ms: float | None, cancel_event: asyncio.Event):
+        if previous_task is not None:
+            await asyncio.wait([ previous_task ])
+
+        await self._handle_message(handler_key, payload, None, deadline_ms, cancel_event)
+
+    # Run the handler registered for handler_key on the executor, send its result back to the plugin, and record its outcome in the metrics.
+    async def _handle_message(self, handler_key: str, payload: Any, request_id: Any, deadline_ms: float | None, cancel_event: asyncio.Event):
+        start_time = time.perf_counter()
+        status = 'error'
+
+        try:
+            status = await self._run_handler(handler_key, payload, request_id, deadline_ms, cancel_event)
+        finally:
+            self._in_flight_requests.pop(request_id, None)
+            self._cancel_events.discard(cancel_event)
+            self.metrics.record(handler_key, status, time.perf_counter() - start_time)
+
+    # Returns the status of the reply sent to the plugin.
+    async def _run_handler(self, handler_key: str, payload: Any, request_id: Any, deadline_ms: float | None, cancel_event: asyncio.Event) -> str:
+        request_key = next(self._request_keys)
+        loop = asyncio.get_running_loop()
+
+        # partial results are sent from the executor thread,
+        # it waits for each of them to be sent, so they are guaranteed to arrive before the final result.
+        def send_partial(partial_payload: dict):
+            asyncio.run_coroutine_threadsafe(self.send('partial', partial_payload, request_id), loop).result()
+
+        # e.g. a legacy request waiting for the previous one, when the client exits.
+        if cancel_event.is_set():
+            result_payload = CancelledResult().getPayload()
+            await self.send('result', result_payload, request_id)
+            return result_payload['status']
+
+        session = None
+
+        if handler_key not in ENVIRONMENT_SESSION_HANDLER_KEYS:
+            try:
+                session = self.sessions.get_message_state(payload)
+            except UnknownSessionError as e:
+                await self.send("error", dict(message=str(e)), request_id)
+                return 'error'
+
+        # workers receive the message as is, together with the state of its session, which they are synced to by deltas instead.
+        resolved_payload = payload if session is None else dict(payload, environment=session.environment)
+
+        result_key = self.result_cache.get_key(handler_key, resolved_payload) if self.result_cache is not None else None
+
+        if result_key is not None:
+            cached_payload = await loop.run_in_executor(self.executor, self.result_cache.get, result_key)
+
+            if cached_payload is not None:
+                await self.send('result', cached_payload, request_id)
+                return cached_payload.get('status', 'success')
+
+        # the payload is also produced off the event loop, as printing the result can be just as expensive as computing it.
+        # so is the handler itself, as it may have to be imported first.
+        if handler_key in self.handlers:
+            run_handler = lambda: handle_message(self.handlers.get_handler(handler_key), resolved_payload, send_partial)
+        elif self.worker_pool is not None and handler_key in self.worker_pool.handler_keys:
+            run_handler = lambda: self.worker_pool.run(request_key, handler_key, payload, send_partial, session)
+        else:
+            await self.send("error", dict(message=handler_key), request_id)
+            return 'error'
+
+        result_future = loop.run_in_executor(self.executor, run_handler)
+        cancel_task = asyncio.create_task(cancel_event.wait())
+
+        await asyncio.wait(
+            [ result_future, cancel_task ],
+            timeout=None if deadline_ms is None else deadline_ms / 1000,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+
+        cancel_task.cancel()
+
+        if not result_future.done():
+            self._stop_worker(request_key)
+            # the result is no longer needed, cancelling it also discards the error raised by the stopped worker.
+            result_future.cancel()
+
+            if cancel_event.is_set():
+                result_payload = CancelledResult().getPayload()
             else:
-                await self.send("error", dict(message=handler_key))
+                result_payload = TimeoutResult(deadline_ms).getPayload()
+
+            await self.send('result', result_payload, request_id)
+            return result_payload['status']
+
+        try:
+            result_payload = result_future.result()
+        except WorkerError as e:
+            await self.send("error", dict(message=str(e)), request_id)
+            return 'error'
+        except Exception as e:
+            await self.send("error", dict(message=str(e) + "\n" + traceback.format_exc()), request_id)
+            return 'error'
+
+        await self.send('result', result_payload, request_id)
+
+        status = result_payload.get('status', 'success')
+
+        # stored after replying, so the reply is not delayed by writing to the cache.
+        if result_key is not None and status == 'success':
+            await loop.run_in_executor(self.executor, self.result_cache.put, result_key, result_payload)
+
+        return status
+
+    # Cancel the in flight request with the given request id, returns whether such a request was found.
+    def _cancel(self, request_id: Any) -> bool:
+        cancel_event = self._in_flight_requests.get(request_id)
+
+        if cancel_event is None:
+            return False
+
+        cancel_event.set()
+        return True
+
+    # Free the cpu time of a stopped request, if it is running in the worker pool.
+    # Handlers registered directly on the client cannot be interrupted, their results are simply discarded.
+    def _stop_worker(self, request_key: int):
+        if self.worker_pool is not None:
+            self.worker_pool.cancel(request_key)
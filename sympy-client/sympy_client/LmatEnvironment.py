@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 class FunctionDef(TypedDict):
     args: list[str]
@@ -7,10 +7,23 @@ class FunctionDef(TypedDict):
 ## The LmatEnvironment type represents a dictionary
 ## parsed from a json encoded LmatEnvironment typescript class.
 class LmatEnvironment(TypedDict):
-    symbols: dict[str, list[str]]
-    variables: dict[str, str]
-    functions: dict[str, FunctionDef]
+    symbols: NotRequired[dict[str, list[str]]]
+    variables: NotRequired[dict[str, str]]
+    functions: NotRequired[dict[str, FunctionDef]]
 
-    unit_system: str
+    # null is the same as leaving the setting out.
+    unit_system: NotRequired[str | None]
 
-    domain: str
+    domain: NotRequired[str | None]
+
+## The LmatEnvironmentDelta type represents a change to an LmatEnvironment, see EnvironmentSessions.
+## Each table maps the entries which were added or changed to their new value, and the entries which were removed to None.
+## unit_system and domain are replaced by their given value, or removed if it is None.
+class LmatEnvironmentDelta(TypedDict):
+    symbols: NotRequired[dict[str, list[str] | None]]
+    variables: NotRequired[dict[str, str | None]]
+    functions: NotRequired[dict[str, FunctionDef | None]]
+
+    unit_system: NotRequired[str | None]
+
+    domain: NotRequired[str | None]
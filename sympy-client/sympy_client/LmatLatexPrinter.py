@@ -1,7 +1,7 @@
 import re as regex
 from functools import reduce
 
-from sympy import *
+from sympy import Expr, Mul, Pow, S, fraction, sift
 from sympy.physics.units import Quantity
 from sympy.printing.latex import LatexPrinter
 
@@ -0,0 +1,149 @@
+import json
+import types
+from functools import cache
+from typing import (Any, Callable, Union, get_args, get_origin,
+                    get_type_hints, is_typeddict)
+
+# orjson is a considerably faster json implementation, which is used if it is installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#
+# The MessageCodec module encodes and decodes the payloads sent between the Latex Math plugin and the LatexMathClient.
+# Payloads are plain json, and can optionally be validated against a TypedDict describing the expected message.
+#
+
+# Raised when a decoded message does not match its expected type.
+class MessageValidationError(ValueError):
+    pass
+
+# Encode the given json dumpable object into a json string.
+def encode(message: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+
+    return json.dumps(message)
+
+# Decode the given json string, and validate it against message_type if given.
+def decode(payload: str, message_type: type | None = None) -> Any:
+    if orjson is not None:
+        message = orjson.loads(payload)
+    else:
+        message = json.loads(payload)
+
+    if message_type is not None:
+        validate(message, message_type)
+
+    return message
+
+# Check that the given decoded json value matches expected_type, raises a MessageValidationError if it does not.
+# Supports TypedDicts, dict, list, unions and the json scalar types.
+# Keys not present in a TypedDict are allowed, so older clients can receive messages from newer plugins.
+def validate(value: Any, expected_type: Any) -> Any:
+    try:
+        _compile_validator(expected_type)(value)
+    except _InvalidValue as e:
+        path = "message" + "".join(f"[{key}]" if isinstance(key, int) else f".{key}" for key in reversed(e.reversed_path))
+        raise MessageValidationError(f"{path}: {e.reason}") from None
+
+    return value
+
+# Raised by compiled validators, the path to the invalid value is collected in reverse, while the error propagates up.
+class _InvalidValue(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+        self.reversed_path: list[str | int] = []
+
+# Compile expected_type into a function which raises _InvalidValue if its argument does not match the type.
+# Messages are validated on every request, so the type is only inspected once here, instead of on every validation.
+@cache
+def _compile_validator(expected_type: Any) -> Callable[[Any], None]:
+    origin = get_origin(expected_type)
+
+    if expected_type is Any:
+        return lambda _value: None
+
+    if is_typeddict(expected_type):
+        key_validators = [ (key, key in expected_type.__required_keys__, _compile_validator(key_type)) for key, key_type in get_type_hints(expected_type).items() ]
+
+        def validate_typeddict(value):
+            if not isinstance(value, dict):
+                raise _InvalidValue(f"expected object, got {type(value).__name__}")
+
+            for key, is_required, validate_key in key_validators:
+                if key not in value:
+                    if is_required:
+                        raise _InvalidValue(f"missing required key '{key}'")
+                    continue
+
+                try:
+                    validate_key(value[key])
+                except _InvalidValue as e:
+                    e.reversed_path.append(key)
+                    raise
+
+        return validate_typeddict
+
+    if origin in (Union, types.UnionType):
+        union_validators = [ _compile_validator(union_type) for union_type in get_args(expected_type) ]
+
+        def validate_union(value):
+            for validate_union_type in union_validators:
+                try:
+                    return validate_union_type(value)
+                except _InvalidValue:
+                    pass
+
+            raise _InvalidValue(f"{value!r} does not match {expected_type}")
+
+        return validate_union
+
+    if origin is list or expected_type is list:
+        validate_item = _compile_validator((get_args(expected_type) or (Any,))[0])
+
+        def validate_list(value):
+            if not isinstance(value, list):
+                raise _InvalidValue(f"expected array, got {type(value).__name__}")
+
+            for i, item in enumerate(value):
+                try:
+                    validate_item(item)
+                except _InvalidValue as e:
+                    e.reversed_path.append(i)
+                    raise
+
+        return validate_list
+
+    if origin is dict or expected_type is dict:
+        validate_item = _compile_validator((get_args(expected_type) or (str, Any))[1])
+
+        def validate_dict(value):
+            if not isinstance(value, dict):
+                raise _InvalidValue(f"expected object, got {type(value).__name__}")
+
+            for key, item in value.items():
+                try:
+                    validate_item(item)
+                except _InvalidValue as e:
+                    e.reversed_path.append(key)
+                    raise
+
+        return validate_dict
+
+    if expected_type is None or expected_type is type(None):
+        expected_type = type(None)
+
+    # json does not distinguish between integers and floats.
+    accepted_types = (int, float) if expected_type is float else (expected_type,)
+    # bool is a subclass of int, but they are distinct json types.
+    accepts_bool = bool in accepted_types
+    type_name = " or ".join(t.__name__ for t in accepted_types)
+
+    def validate_scalar(value):
+        if not isinstance(value, accepted_types) or (not accepts_bool and isinstance(value, bool)):
+            raise _InvalidValue(f"expected {type_name}, got {type(value).__name__}")
+
+    return validate_scalar
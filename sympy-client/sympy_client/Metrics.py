@@ -0,0 +1,158 @@
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+#
+# The Metrics module keeps a record of the performance of the sympy client,
+# so regressions and pathological notes can be spotted during daily use, through the 'stats' handler.
+#
+# The MetricsRegistry records the outcome and latency of every request handled by the LatexMathClient,
+# while process_stats reports the memory and cache usage of the process it is called in.
+#
+
+# Records request counts, error counts and a rolling window of latencies for each handler key.
+# Latency percentiles are computed from the last window_size requests of each handler key,
+# so they follow the current performance of the client, instead of being dominated by its entire history.
+class MetricsRegistry:
+    def __init__(self, window_size: int = 1000):
+        self._window_size = window_size
+        self._handler_metrics: dict[str, _HandlerMetrics] = {}
+        # requests are recorded on the event loop, while stats are read from the executor.
+        self._lock = threading.Lock()
+
+    # Record that a request for handler_key finished with the given result status, after latency seconds.
+    def record(self, handler_key: str, status: str, latency: float):
+        with self._lock:
+            handler_metrics = self._handler_metrics.get(handler_key)
+
+            if handler_metrics is None:
+                handler_metrics = self._handler_metrics[handler_key] = _HandlerMetrics(self._window_size)
+
+            handler_metrics.record(status, latency)
+
+    # The recorded metrics as json dumpable object, mapping each handler key to its counts and latency percentiles.
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return { handler_key: handler_metrics.get_stats() for handler_key, handler_metrics in self._handler_metrics.items() }
+
+class _HandlerMetrics:
+    def __init__(self, window_size: int):
+        self.count = 0
+        self.status_counts: dict[str, int] = {}
+        self.latencies: deque[float] = deque(maxlen=window_size)
+
+    def record(self, status: str, latency: float):
+        self.count += 1
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self.latencies.append(latency)
+
+    def get_stats(self) -> dict[str, Any]:
+        sorted_latencies = sorted(self.latencies)
+
+        return dict(
+            count=self.count,
+            error_count=self.status_counts.get('error', 0),
+            status_counts=dict(self.status_counts),
+            latency_ms=dict(
+                p50=_percentile_ms(sorted_latencies, 50),
+                p95=_percentile_ms(sorted_latencies, 95),
+                p99=_percentile_ms(sorted_latencies, 99),
+                max=_percentile_ms(sorted_latencies, 100),
+                samples=len(sorted_latencies),
+            ),
+        )
+
+# Nearest rank percentile of the given sorted latencies in milliseconds, None if there are no latencies.
+def _percentile_ms(sorted_latencies: list[float], percentile: float) -> float | None:
+    if len(sorted_latencies) == 0:
+        return None
+
+    rank = max(math.ceil(len(sorted_latencies) * percentile / 100), 1)
+
+    return round(sorted_latencies[rank - 1] * 1000, 3)
+
+# Additional caches reported by process_stats, mapping their names to a function returning their stats.
+_cache_stats_providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+# Report the stats of a cache in process_stats under the given name.
+# stats_provider is called every time the stats are collected, and should return a json dumpable dict, e.g. its size, hits and misses.
+def register_cache_stats(cache_name: str, stats_provider: Callable[[], dict[str, Any]]):
+    _cache_stats_providers[cache_name] = stats_provider
+
+# Memory and cache usage of the current process as a json dumpable object.
+def process_stats() -> dict[str, Any]:
+    return dict(
+        pid=os.getpid(),
+        rss_bytes=_get_rss_bytes(),
+        caches={
+            **_sympy_cache_stats(),
+            **{ cache_name: stats_provider() for cache_name, stats_provider in _cache_stats_providers.items() }
+        },
+        # busy workers report the stats of the last time they were collected, so this tells how recent they are.
+        collected_at=time.time(),
+    )
+
+# Sum of the sizes, hits and misses of the lru caches used by sympy's cacheit decorator, under the 'sympy' key.
+# Processes which have not imported sympy, e.g. the client process, report no sympy caches, instead of importing it.
+def _sympy_cache_stats() -> dict[str, dict[str, int]]:
+    if 'sympy' not in sys.modules:
+        return {}
+
+    from sympy.core.cache import CACHE
+
+    cache_infos = [ cached_function.cache_info() for cached_function in CACHE ]
+
+    return dict(sympy=dict(
+        size=sum(cache_info.currsize for cache_info in cache_infos),
+        hits=sum(cache_info.hits for cache_info in cache_infos),
+        misses=sum(cache_info.misses for cache_info in cache_infos),
+    ))
+
+# Resident set size of the current process in bytes, None if it cannot be determined on this platform.
+def _get_rss_bytes() -> int | None:
+    try:
+        if sys.platform == 'win32':
+            return _get_windows_rss_bytes()
+
+        if os.path.exists('/proc/self/statm'):
+            with open('/proc/self/statm') as statm:
+                return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+        # other unix systems only report the peak resident set size, which is in bytes on macos.
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (OSError, ValueError, ImportError):
+        return None
+
+def _get_windows_rss_bytes() -> int | None:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ('cb', wintypes.DWORD),
+            ('PageFaultCount', wintypes.DWORD),
+            ('PeakWorkingSetSize', ctypes.c_size_t),
+            ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t),
+            ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+
+    get_process_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+    get_process_memory_info.argtypes = [ wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD ]
+
+    if not get_process_memory_info(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+        return None
+
+    return counters.WorkingSetSize
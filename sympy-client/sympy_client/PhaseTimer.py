@@ -0,0 +1,71 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+#
+# Lightweight instrumentation for attributing the time spent handling a request to its phases,
+# e.g. parsing, transforming, evaluating and printing.
+#
+# Code marks its phases with the timed_phase context manager, which does nothing unless a PhaseTimer is active,
+# so instrumented code pays next to nothing for requests which do not ask for timing.
+#
+# Phases can be nested, e.g. definitions are parsed while transforming an expression.
+# Only the outermost phase is recorded, so the recorded phases never overlap, and their sum never exceeds the total time.
+#
+class PhaseTimer:
+    def __init__(self):
+        self._phases: dict[str, list[float]] = {}
+        self._active_phase: str | None = None
+
+    # Make this the active timer for the current context, and time everything done while it is active as the 'total' phase.
+    @contextmanager
+    def activate(self) -> Iterator['PhaseTimer']:
+        token = _active_timer.set(self)
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+
+        try:
+            yield self
+        finally:
+            self._add_time('total', time.perf_counter() - start_wall, time.thread_time() - start_cpu)
+            _active_timer.reset(token)
+
+    @contextmanager
+    def phase(self, phase_name: str) -> Iterator[None]:
+        if self._active_phase is not None:
+            yield
+            return
+
+        self._active_phase = phase_name
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+
+        try:
+            yield
+        finally:
+            self._add_time(phase_name, time.perf_counter() - start_wall, time.thread_time() - start_cpu)
+            self._active_phase = None
+
+    # The recorded phases as json dumpable metadata, with wall and cpu time in milliseconds.
+    def get_metadata(self) -> dict[str, dict[str, float]]:
+        return {
+            phase_name: dict(wall_ms=round(wall * 1000, 3), cpu_ms=round(cpu * 1000, 3))
+            for phase_name, (wall, cpu) in self._phases.items()
+        }
+
+    def _add_time(self, phase_name: str, wall: float, cpu: float):
+        phase_times = self._phases.setdefault(phase_name, [ 0.0, 0.0 ])
+        phase_times[0] += wall
+        phase_times[1] += cpu
+
+_active_timer: ContextVar[PhaseTimer | None] = ContextVar('active_timer', default=None)
+
+# Time the code run inside this context manager as the given phase, if a PhaseTimer is active.
+@contextmanager
+def timed_phase(phase_name: str) -> Iterator[None]:
+    timer = _active_timer.get()
+
+    if timer is None:
+        yield
+    else:
+        with timer.phase(phase_name):
+            yield
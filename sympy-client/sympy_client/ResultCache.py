@@ -0,0 +1,174 @@
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable
+
+# Bumped whenever the format of the stored results changes.
+RESULT_CACHE_VERSION = 1
+
+# The sources of the client, which are hashed into the version stamp, so results computed by older clients are not served by newer ones.
+SOURCE_DIR = os.path.dirname(__file__)
+SOURCE_PATTERNS = ("**/*.py", "**/*.lark")
+
+# Message keys which do not change the result of a message.
+# The session id is left out, as the environment of the session is filled in before the message is cached.
+IGNORED_MESSAGE_KEYS = ('session_id',)
+
+#
+# The ResultCache stores the payloads of handled messages in an SQLite database, so they survive restarts of the client,
+# e.g. solving an equation of a note, which was solved the day before, is answered without solving it again.
+#
+# Payloads are keyed by a hash of the handler key, the canonical json of the message, including its environment,
+# and a version stamp of sympy, the client sources including the grammar, and the cache itself, see get_version_stamp.
+# Results of other versions are deleted when the cache is opened.
+# Entries are evicted least recently used first, when the size of the stored payloads exceeds max_bytes.
+#
+# The database is in write-ahead logging mode, and waits for locks held by other connections,
+# so several processes, e.g. clients of different vaults, can use the same cache file at once.
+# The cache is an optimization, so a database error results in a cache miss, instead of failing the request.
+#
+class ResultCache:
+    def __init__(self, database_file: str, handler_keys: Iterable[str], max_bytes: int = 64 * 1024 * 1024, timeout: float = 5.0):
+        self._handler_keys = frozenset(handler_keys)
+        self._max_bytes = max_bytes
+        self._version_stamp = ResultCache.get_version_stamp()
+
+        self._hits = 0
+        self._misses = 0
+
+        # requests are handled on several executor threads, which share the connection.
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(database_file, timeout=timeout, check_same_thread=False, isolation_level=None)
+
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    version_stamp TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+            self._connection.execute("DELETE FROM results WHERE version_stamp != ?", (self._version_stamp,))
+
+    # The key of the result of the given message, None if its result should not be cached,
+    # either because its handler is not cached, or because its result depends on more than the message, e.g. timing.
+    def get_key(self, handler_key: str, message: Any) -> str | None:
+        if handler_key not in self._handler_keys or not isinstance(message, dict) or message.get('timing', False):
+            return None
+
+        cached_message = { key: value for key, value in message.items() if key not in IGNORED_MESSAGE_KEYS }
+        canonical_message = json.dumps(cached_message, sort_keys=True, separators=(',', ':'))
+
+        return hashlib.sha256(f"{handler_key}|{self._version_stamp}|{canonical_message}".encode()).hexdigest()
+
+    # The payload stored for the given key, None if there is none.
+    def get(self, key: str) -> dict | None:
+        try:
+            with self._lock:
+                row = self._connection.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+
+                if row is None:
+                    self._misses += 1
+                    return None
+
+                self._connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+                self._hits += 1
+        except sqlite3.Error:
+            return None
+
+        return json.loads(row[0])
+
+    # Store the payload of the given key, evicting the least recently used payloads if the cache grows too large.
+    def put(self, key: str, payload: dict):
+        serialized_payload = json.dumps(payload)
+        size = len(serialized_payload)
+
+        if size > self._max_bytes:
+            return
+
+        try:
+            with self._lock:
+                self._connection.execute("BEGIN IMMEDIATE")
+
+                try:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO results (key, version_stamp, payload, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                        (key, self._version_stamp, serialized_payload, size, time.time())
+                    )
+                    self._evict()
+                    self._connection.execute("COMMIT")
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error:
+            pass
+
+    # Delete every stored payload, returns the number of deleted payloads.
+    def clear(self) -> int:
+        with self._lock:
+            deleted_count = self._connection.execute("DELETE FROM results").rowcount
+            self._hits = 0
+            self._misses = 0
+
+        return deleted_count
+
+    # The size, hits and misses of the cache, see Metrics.register_cache_stats.
+    def get_stats(self) -> dict[str, Any]:
+        try:
+            with self._lock:
+                size, size_bytes = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+                return dict(size=size, bytes=size_bytes, max_bytes=self._max_bytes, hits=self._hits, misses=self._misses)
+        except sqlite3.Error:
+            return dict(max_bytes=self._max_bytes, hits=self._hits, misses=self._misses)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    # Stamp of the versions of everything the cached results depend on, that is sympy, the client sources and the cache itself.
+    # The sympy version is read from its package metadata, as the client process never imports sympy.
+    @staticmethod
+    def get_version_stamp() -> str:
+        from importlib import metadata
+
+        try:
+            sympy_version = metadata.version("sympy")
+        except metadata.PackageNotFoundError:
+            sympy_version = "unknown"
+
+        source_files = { source_file for pattern in SOURCE_PATTERNS for source_file in glob.glob(os.path.join(SOURCE_DIR, pattern), recursive=True) }
+        source_hash = hashlib.sha256()
+
+        for source_file in sorted(source_files):
+            with open(source_file, "rb") as f:
+                source_hash.update(os.path.relpath(source_file, SOURCE_DIR).replace(os.sep, "/").encode())
+                source_hash.update(f.read())
+
+        return f"{RESULT_CACHE_VERSION}|{sympy_version}|{source_hash.hexdigest()[:16]}"
+
+    # Delete the least recently used payloads, until the stored payloads fit in max_bytes.
+    def _evict(self):
+        total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+        if total_size <= self._max_bytes:
+            return
+
+        evicted_keys = []
+
+        for key, size in self._connection.execute("SELECT key, size FROM results ORDER BY last_used, rowid").fetchall():
+            if total_size <= self._max_bytes:
+                break
+
+            evicted_keys.append((key,))
+            total_size -= size
+
+        self._connection.executemany("DELETE FROM results WHERE key = ?", evicted_keys)
@@ -0,0 +1,90 @@
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from sympy import Basic, Expr, preorder_traversal, simplify
+
+#
+# The SimplifyCache keeps the result of simplify(sympy_expr.doit()) for recently evaluated expressions,
+# which is the first, and often the most expensive, step of the eval, expand, factor and apart handlers,
+# so e.g. factoring an expression after evaluating it only pays for the factoring.
+#
+# Expressions are keyed by themselves, that is by their structure, which includes the assumptions of their symbols,
+# as sympy hashes and compares expressions structurally.
+# Entries are evicted least recently used first, when there are more than max_entries,
+# or when the total size of the cached expressions, counted in expression nodes, exceeds max_nodes.
+#
+class SimplifyCache:
+    def __init__(self, max_entries: int = 256, max_nodes: int = 200_000):
+        self._max_entries = max_entries
+        self._max_nodes = max_nodes
+
+        # maps each expression to its simplified form and the size of both.
+        self._entries: OrderedDict[Basic, tuple[Expr, int]] = OrderedDict()
+        self._node_count = 0
+        self._hits = 0
+        self._misses = 0
+
+        self._lock = threading.Lock()
+
+    # Get simplify(sympy_expr.doit()), from the cache if it has been computed before.
+    def simplify(self, sympy_expr: Expr) -> Expr:
+        if self._max_entries <= 0 or not SimplifyCache._is_cacheable(sympy_expr):
+            return simplify(sympy_expr.doit())
+
+        with self._lock:
+            entry = self._entries.get(sympy_expr)
+
+            if entry is not None:
+                self._entries.move_to_end(sympy_expr)
+                self._hits += 1
+                return entry[0]
+
+            self._misses += 1
+
+        simplified_expr = simplify(sympy_expr.doit())
+        entry_nodes = SimplifyCache._count_nodes(sympy_expr) + SimplifyCache._count_nodes(simplified_expr)
+
+        # an expression larger than the entire cache would evict everything else, for a result which is likely never reused.
+        if entry_nodes > self._max_nodes or not SimplifyCache._is_cacheable(simplified_expr):
+            return simplified_expr
+
+        with self._lock:
+            if sympy_expr not in self._entries:
+                self._entries[sympy_expr] = (simplified_expr, entry_nodes)
+                self._node_count += entry_nodes
+
+            while len(self._entries) > self._max_entries or self._node_count > self._max_nodes:
+                _, (_, evicted_nodes) = self._entries.popitem(last=False)
+                self._node_count -= evicted_nodes
+
+        return simplified_expr
+
+    # The size, maximum size, hits and misses of the cache, see Metrics.register_cache_stats.
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return dict(size=len(self._entries), max_size=self._max_entries, nodes=self._node_count, max_nodes=self._max_nodes, hits=self._hits, misses=self._misses)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._node_count = 0
+            self._hits = 0
+            self._misses = 0
+
+    # Mutable matrices cannot be keys, and should not be shared between results, as handlers may modify them.
+    @staticmethod
+    def _is_cacheable(sympy_expr: Any) -> bool:
+        if not isinstance(sympy_expr, Basic):
+            return False
+
+        try:
+            hash(sympy_expr)
+        except TypeError:
+            return False
+
+        return True
+
+    @staticmethod
+    def _count_nodes(sympy_expr: Basic) -> int:
+        return sum(1 for _ in preorder_traversal(sympy_expr))
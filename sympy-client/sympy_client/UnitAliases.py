@@ -0,0 +1,1279 @@
+# This file is generated by GenUnitAliases.py, do not edit it by hand.
+
+# Maps an alias to where its corresponding Quantity is found, that is either
+# ('unit_definitions', attribute name) or ('SI', name of the unit in the SI unit system), see UnitsUtils.str_to_unit.
+UNIT_ALIASES: dict[str, tuple[str, str]] = {
+    'A': ('unit_definitions', 'ampere'),
+    'AU': ('unit_definitions', 'astronomical_unit'),
+    'Bq': ('unit_definitions', 'becquerel'),
+    'C': ('unit_definitions', 'coulomb'),
+    'Ci': ('unit_definitions', 'curie'),
+    'D': ('unit_definitions', 'dioptre'),
+    'Da': ('unit_definitions', 'atomic_mass_constant'),
+    'EA': ('SI', 'exaampere'),
+    'EBq': ('SI', 'exabecquerel'),
+    'EC': ('SI', 'exacoulomb'),
+    'EF': ('SI', 'exafarad'),
+    'EH': ('SI', 'exahenry'),
+    'EHz': ('SI', 'exahertz'),
+    'EJ': ('SI', 'exajoule'),
+    'EK': ('SI', 'exakelvin'),
+    'EN': ('SI', 'exanewton'),
+    'EPa': ('SI', 'exapascal'),
+    'ES': ('SI', 'exasiemens'),
+    'ET': ('SI', 'exatesla'),
+    'EV': ('SI', 'exavolt'),
+    'EW': ('SI', 'exawatt'),
+    'EWb': ('SI', 'exaweber'),
+    'E_P': ('unit_definitions', 'planck_energy'),
+    'Ecd': ('SI', 'exacandela'),
+    'Eg': ('SI', 'exagram'),
+    'Egray': ('SI', 'exagray'),
+    'Ekat': ('SI', 'exakatal'),
+    'Elx': ('SI', 'exalux'),
+    'Em': ('SI', 'exameter'),
+    'Emol': ('SI', 'examole'),
+    'Eohm': ('SI', 'exaohm'),
+    'Es': ('SI', 'exasecond'),
+    'F': ('unit_definitions', 'farad'),
+    'F_P': ('unit_definitions', 'planck_force'),
+    'G': ('unit_definitions', 'gravitational_constant'),
+    'GA': ('SI', 'gigaampere'),
+    'GBq': ('SI', 'gigabecquerel'),
+    'GC': ('SI', 'gigacoulomb'),
+    'GF': ('SI', 'gigafarad'),
+    'GH': ('SI', 'gigahenry'),
+    'GHz': ('SI', 'gigahertz'),
+    'GJ': ('SI', 'gigajoule'),
+    'GK': ('SI', 'gigakelvin'),
+    'GN': ('SI', 'giganewton'),
+    'GPa': ('SI', 'gigapascal'),
+    'GS': ('SI', 'gigasiemens'),
+    'GT': ('SI', 'gigatesla'),
+    'GV': ('SI', 'gigavolt'),
+    'GW': ('SI', 'gigawatt'),
+    'GWb': ('SI', 'gigaweber'),
+    'Gcd': ('SI', 'gigacandela'),
+    'Gg': ('SI', 'gigagram'),
+    'Ggray': ('SI', 'gigagray'),
+    'Gkat': ('SI', 'gigakatal'),
+    'Glx': ('SI', 'gigalux'),
+    'Gm': ('SI', 'gigameter'),
+    'Gmol': ('SI', 'gigamole'),
+    'Gohm': ('SI', 'gigaohm'),
+    'Gs': ('SI', 'gigasecond'),
+    'Gy': ('unit_definitions', 'gray'),
+    'H': ('unit_definitions', 'henry'),
+    'Hz': ('unit_definitions', 'hertz'),
+    'I_P': ('unit_definitions', 'planck_current'),
+    'J': ('unit_definitions', 'joule'),
+    'K': ('unit_definitions', 'kelvin'),
+    'K_j': ('unit_definitions', 'josephson_constant'),
+    'L': ('unit_definitions', 'liter'),
+    'MA': ('SI', 'megaampere'),
+    'MBq': ('SI', 'megabecquerel'),
+    'MC': ('SI', 'megacoulomb'),
+    'MF': ('SI', 'megafarad'),
+    'MH': ('SI', 'megahenry'),
+    'MHz': ('SI', 'megahertz'),
+    'MJ': ('SI', 'megajoule'),
+    'MK': ('SI', 'megakelvin'),
+    'MN': ('SI', 'meganewton'),
+    'MPa': ('SI', 'megapascal'),
+    'MS': ('SI', 'megasiemens'),
+    'MT': ('SI', 'megatesla'),
+    'MV': ('SI', 'megavolt'),
+    'MW': ('SI', 'megawatt'),
+    'MWb': ('SI', 'megaweber'),
+    'Mcd': ('SI', 'megacandela'),
+    'Mg': ('SI', 'megagram'),
+    'Mgray': ('SI', 'megagray'),
+    'Mkat': ('SI', 'megakatal'),
+    'Mlx': ('SI', 'megalux'),
+    'Mm': ('SI', 'megameter'),
+    'Mmol': ('SI', 'megamole'),
+    'Mohm': ('SI', 'megaohm'),
+    'Ms': ('SI', 'megasecond'),
+    'N': ('unit_definitions', 'newton'),
+    'PA': ('SI', 'petaampere'),
+    'PBq': ('SI', 'petabecquerel'),
+    'PC': ('SI', 'petacoulomb'),
+    'PF': ('SI', 'petafarad'),
+    'PH': ('SI', 'petahenry'),
+    'PHz': ('SI', 'petahertz'),
+    'PJ': ('SI', 'petajoule'),
+    'PK': ('SI', 'petakelvin'),
+    'PN': ('SI', 'petanewton'),
+    'PPa': ('SI', 'petapascal'),
+    'PS': ('SI', 'petasiemens'),
+    'PT': ('SI', 'petatesla'),
+    'PV': ('SI', 'petavolt'),
+    'PW': ('SI', 'petawatt'),
+    'PWb': ('SI', 'petaweber'),
+    'P_P': ('unit_definitions', 'planck_power'),
+    'Pa': ('unit_definitions', 'pascal'),
+    'Pcd': ('SI', 'petacandela'),
+    'Pg': ('SI', 'petagram'),
+    'Pgray': ('SI', 'petagray'),
+    'Pkat': ('SI', 'petakatal'),
+    'Plx': ('SI', 'petalux'),
+    'Pm': ('SI', 'petameter'),
+    'Pmol': ('SI', 'petamole'),
+    'Pohm': ('SI', 'petaohm'),
+    'Ps': ('SI', 'petasecond'),
+    'R': ('unit_definitions', 'molar_gas_constant'),
+    'R_k': ('unit_definitions', 'von_klitzing_constant'),
+    'Rd': ('unit_definitions', 'rutherford'),
+    'S': ('unit_definitions', 'siemens'),
+    'T': ('unit_definitions', 'tesla'),
+    'TA': ('SI', 'teraampere'),
+    'TBq': ('SI', 'terabecquerel'),
+    'TC': ('SI', 'teracoulomb'),
+    'TF': ('SI', 'terafarad'),
+    'TH': ('SI', 'terahenry'),
+    'THz': ('SI', 'terahertz'),
+    'TJ': ('SI', 'terajoule'),
+    'TK': ('SI', 'terakelvin'),
+    'TN': ('SI', 'teranewton'),
+    'TPa': ('SI', 'terapascal'),
+    'TS': ('SI', 'terasiemens'),
+    'TT': ('SI', 'teratesla'),
+    'TV': ('SI', 'teravolt'),
+    'TW': ('SI', 'terawatt'),
+    'TWb': ('SI', 'teraweber'),
+    'T_P': ('unit_definitions', 'planck_temperature'),
+    'Tcd': ('SI', 'teracandela'),
+    'Tg': ('SI', 'teragram'),
+    'Tgray': ('SI', 'teragray'),
+    'Tkat': ('SI', 'terakatal'),
+    'Tlx': ('SI', 'teralux'),
+    'Tm': ('SI', 'terameter'),
+    'Tmol': ('SI', 'teramole'),
+    'Tohm': ('SI', 'teraohm'),
+    'Ts': ('SI', 'terasecond'),
+    'V': ('unit_definitions', 'volt'),
+    'V_P': ('unit_definitions', 'planck_voltage'),
+    'W': ('unit_definitions', 'watt'),
+    'Wb': ('unit_definitions', 'weber'),
+    'YA': ('SI', 'yottaampere'),
+    'YBq': ('SI', 'yottabecquerel'),
+    'YC': ('SI', 'yottacoulomb'),
+    'YF': ('SI', 'yottafarad'),
+    'YH': ('SI', 'yottahenry'),
+    'YHz': ('SI', 'yottahertz'),
+    'YJ': ('SI', 'yottajoule'),
+    'YK': ('SI', 'yottakelvin'),
+    'YN': ('SI', 'yottanewton'),
+    'YPa': ('SI', 'yottapascal'),
+    'YS': ('SI', 'yottasiemens'),
+    'YT': ('SI', 'yottatesla'),
+    'YV': ('SI', 'yottavolt'),
+    'YW': ('SI', 'yottawatt'),
+    'YWb': ('SI', 'yottaweber'),
+    'Ycd': ('SI', 'yottacandela'),
+    'Yg': ('SI', 'yottagram'),
+    'Ygray': ('SI', 'yottagray'),
+    'Ykat': ('SI', 'yottakatal'),
+    'Ylx': ('SI', 'yottalux'),
+    'Ym': ('SI', 'yottameter'),
+    'Ymol': ('SI', 'yottamole'),
+    'Yohm': ('SI', 'yottaohm'),
+    'Ys': ('SI', 'yottasecond'),
+    'Z0': ('unit_definitions', 'vacuum_impedance'),
+    'ZA': ('SI', 'zettaampere'),
+    'ZBq': ('SI', 'zettabecquerel'),
+    'ZC': ('SI', 'zettacoulomb'),
+    'ZF': ('SI', 'zettafarad'),
+    'ZH': ('SI', 'zettahenry'),
+    'ZHz': ('SI', 'zettahertz'),
+    'ZJ': ('SI', 'zettajoule'),
+    'ZK': ('SI', 'zettakelvin'),
+    'ZN': ('SI', 'zettanewton'),
+    'ZPa': ('SI', 'zettapascal'),
+    'ZS': ('SI', 'zettasiemens'),
+    'ZT': ('SI', 'zettatesla'),
+    'ZV': ('SI', 'zettavolt'),
+    'ZW': ('SI', 'zettawatt'),
+    'ZWb': ('SI', 'zettaweber'),
+    'Z_0': ('unit_definitions', 'vacuum_impedance'),
+    'Z_P': ('unit_definitions', 'planck_impedance'),
+    'Zcd': ('SI', 'zettacandela'),
+    'Zg': ('SI', 'zettagram'),
+    'Zgray': ('SI', 'zettagray'),
+    'Zkat': ('SI', 'zettakatal'),
+    'Zlx': ('SI', 'zettalux'),
+    'Zm': ('SI', 'zettameter'),
+    'Zmol': ('SI', 'zettamole'),
+    'Zohm': ('SI', 'zettaohm'),
+    'Zs': ('SI', 'zettasecond'),
+    'aA': ('SI', 'attoampere'),
+    'aBq': ('SI', 'attobecquerel'),
+    'aC': ('SI', 'attocoulomb'),
+    'aF': ('SI', 'attofarad'),
+    'aH': ('SI', 'attohenry'),
+    'aHz': ('SI', 'attohertz'),
+    'aJ': ('SI', 'attojoule'),
+    'aK': ('SI', 'attokelvin'),
+    'aN': ('SI', 'attonewton'),
+    'aPa': ('SI', 'attopascal'),
+    'aS': ('SI', 'attosiemens'),
+    'aT': ('SI', 'attotesla'),
+    'aV': ('SI', 'attovolt'),
+    'aW': ('SI', 'attowatt'),
+    'aWb': ('SI', 'attoweber'),
+    'a_P': ('unit_definitions', 'planck_acceleration'),
+    'acceleration_due_to_gravity': ('unit_definitions', 'acceleration_due_to_gravity'),
+    'acd': ('SI', 'attocandela'),
+    'ag': ('SI', 'attogram'),
+    'agray': ('SI', 'attogray'),
+    'akat': ('SI', 'attokatal'),
+    'alx': ('SI', 'attolux'),
+    'am': ('SI', 'attometer'),
+    'amol': ('SI', 'attomole'),
+    'ampere': ('unit_definitions', 'ampere'),
+    'amperes': ('unit_definitions', 'ampere'),
+    'amu': ('unit_definitions', 'atomic_mass_constant'),
+    'amus': ('unit_definitions', 'atomic_mass_constant'),
+    'angstrom': ('unit_definitions', 'angstrom'),
+    'angstroms': ('unit_definitions', 'angstrom'),
+    'angular_mil': ('unit_definitions', 'angular_mil'),
+    'angular_mils': ('unit_definitions', 'angular_mil'),
+    'anomalistic_year': ('unit_definitions', 'anomalistic_year'),
+    'anomalistic_years': ('unit_definitions', 'anomalistic_year'),
+    'aohm': ('SI', 'attoohm'),
+    'as': ('SI', 'attosecond'),
+    'astronomical_unit': ('unit_definitions', 'astronomical_unit'),
+    'astronomical_units': ('unit_definitions', 'astronomical_unit'),
+    'atm': ('unit_definitions', 'atmosphere'),
+    'atmosphere': ('unit_definitions', 'atmosphere'),
+    'atmospheres': ('unit_definitions', 'atmosphere'),
+    'atomic_mass_constant': ('unit_definitions', 'atomic_mass_constant'),
+    'atomic_mass_unit': ('unit_definitions', 'atomic_mass_constant'),
+    'attoampere': ('SI', 'attoampere'),
+    'attobecquerel': ('SI', 'attobecquerel'),
+    'attocandela': ('SI', 'attocandela'),
+    'attocoulomb': ('SI', 'attocoulomb'),
+    'attofarad': ('SI', 'attofarad'),
+    'attogram': ('SI', 'attogram'),
+    'attogray': ('SI', 'attogray'),
+    'attohenry': ('SI', 'attohenry'),
+    'attohertz': ('SI', 'attohertz'),
+    'attojoule': ('SI', 'attojoule'),
+    'attokatal': ('SI', 'attokatal'),
+    'attokelvin': ('SI', 'attokelvin'),
+    'attolux': ('SI', 'attolux'),
+    'attometer': ('SI', 'attometer'),
+    'attomole': ('SI', 'attomole'),
+    'attonewton': ('SI', 'attonewton'),
+    'attoohm': ('SI', 'attoohm'),
+    'attopascal': ('SI', 'attopascal'),
+    'attosecond': ('SI', 'attosecond'),
+    'attosiemens': ('SI', 'attosiemens'),
+    'attotesla': ('SI', 'attotesla'),
+    'attovolt': ('SI', 'attovolt'),
+    'attowatt': ('SI', 'attowatt'),
+    'attoweber': ('SI', 'attoweber'),
+    'au': ('unit_definitions', 'astronomical_unit'),
+    'avogadro': ('unit_definitions', 'avogadro_constant'),
+    'avogadro_constant': ('unit_definitions', 'avogadro_constant'),
+    'avogadro_number': ('unit_definitions', 'avogadro_number'),
+    'bar': ('unit_definitions', 'bar'),
+    'bars': ('unit_definitions', 'bar'),
+    'becquerel': ('unit_definitions', 'becquerel'),
+    'bit': ('unit_definitions', 'bit'),
+    'bits': ('unit_definitions', 'bit'),
+    'boltzmann': ('unit_definitions', 'boltzmann_constant'),
+    'boltzmann_constant': ('unit_definitions', 'boltzmann_constant'),
+    'byte': ('unit_definitions', 'byte'),
+    'bytes': ('unit_definitions', 'byte'),
+    'c': ('unit_definitions', 'speed_of_light'),
+    'cA': ('SI', 'centiampere'),
+    'cBq': ('SI', 'centibecquerel'),
+    'cC': ('SI', 'centicoulomb'),
+    'cF': ('SI', 'centifarad'),
+    'cH': ('SI', 'centihenry'),
+    'cHz': ('SI', 'centihertz'),
+    'cJ': ('SI', 'centijoule'),
+    'cK': ('SI', 'centikelvin'),
+    'cL': ('unit_definitions', 'centiliter'),
+    'cN': ('SI', 'centinewton'),
+    'cPa': ('SI', 'centipascal'),
+    'cS': ('SI', 'centisiemens'),
+    'cT': ('SI', 'centitesla'),
+    'cV': ('SI', 'centivolt'),
+    'cW': ('SI', 'centiwatt'),
+    'cWb': ('SI', 'centiweber'),
+    'candela': ('unit_definitions', 'candela'),
+    'candelas': ('unit_definitions', 'candela'),
+    'ccd': ('SI', 'centicandela'),
+    'cd': ('unit_definitions', 'candela'),
+    'centiampere': ('SI', 'centiampere'),
+    'centibecquerel': ('SI', 'centibecquerel'),
+    'centicandela': ('SI', 'centicandela'),
+    'centicoulomb': ('SI', 'centicoulomb'),
+    'centifarad': ('SI', 'centifarad'),
+    'centigram': ('SI', 'centigram'),
+    'centigray': ('SI', 'centigray'),
+    'centihenry': ('SI', 'centihenry'),
+    'centihertz': ('SI', 'centihertz'),
+    'centijoule': ('SI', 'centijoule'),
+    'centikatal': ('SI', 'centikatal'),
+    'centikelvin': ('SI', 'centikelvin'),
+    'centiliter': ('unit_definitions', 'centiliter'),
+    'centiliters': ('unit_definitions', 'centiliter'),
+    'centilux': ('SI', 'centilux'),
+    'centimeter': ('SI', 'centimeter'),
+    'centimeters': ('unit_definitions', 'centimeter'),
+    'centimole': ('SI', 'centimole'),
+    'centinewton': ('SI', 'centinewton'),
+    'centiohm': ('SI', 'centiohm'),
+    'centipascal': ('SI', 'centipascal'),
+    'centisecond': ('SI', 'centisecond'),
+    'centisiemens': ('SI', 'centisiemens'),
+    'centitesla': ('SI', 'centitesla'),
+    'centivolt': ('SI', 'centivolt'),
+    'centiwatt': ('SI', 'centiwatt'),
+    'centiweber': ('SI', 'centiweber'),
+    'cg': ('SI', 'centigram'),
+    'cgray': ('SI', 'centigray'),
+    'ckat': ('SI', 'centikatal'),
+    'cl': ('unit_definitions', 'centiliter'),
+    'clx': ('SI', 'centilux'),
+    'cm': ('SI', 'centimeter'),
+    'cmol': ('SI', 'centimole'),
+    'cohm': ('SI', 'centiohm'),
+    'common_year': ('unit_definitions', 'common_year'),
+    'common_years': ('unit_definitions', 'common_year'),
+    'coulomb': ('unit_definitions', 'coulomb'),
+    'coulomb_constant': ('unit_definitions', 'coulomb_constant'),
+    'coulombs': ('unit_definitions', 'coulomb'),
+    'coulombs_constant': ('unit_definitions', 'coulomb_constant'),
+    'cs': ('SI', 'centisecond'),
+    'curie': ('unit_definitions', 'curie'),
+    'dA': ('SI', 'deciampere'),
+    'dBq': ('SI', 'decibecquerel'),
+    'dC': ('SI', 'decicoulomb'),
+    'dF': ('SI', 'decifarad'),
+    'dH': ('SI', 'decihenry'),
+    'dHz': ('SI', 'decihertz'),
+    'dJ': ('SI', 'decijoule'),
+    'dK': ('SI', 'decikelvin'),
+    'dL': ('unit_definitions', 'deciliter'),
+    'dN': ('SI', 'decinewton'),
+    'dPa': ('SI', 'decipascal'),
+    'dS': ('SI', 'decisiemens'),
+    'dT': ('SI', 'decitesla'),
+    'dV': ('SI', 'decivolt'),
+    'dW': ('SI', 'deciwatt'),
+    'dWb': ('SI', 'deciweber'),
+    'daA': ('SI', 'decaampere'),
+    'daBq': ('SI', 'decabecquerel'),
+    'daC': ('SI', 'decacoulomb'),
+    'daF': ('SI', 'decafarad'),
+    'daH': ('SI', 'decahenry'),
+    'daHz': ('SI', 'decahertz'),
+    'daJ': ('SI', 'decajoule'),
+    'daK': ('SI', 'decakelvin'),
+    'daN': ('SI', 'decanewton'),
+    'daPa': ('SI', 'decapascal'),
+    'daS': ('SI', 'decasiemens'),
+    'daT': ('SI', 'decatesla'),
+    'daV': ('SI', 'decavolt'),
+    'daW': ('SI', 'decawatt'),
+    'daWb': ('SI', 'decaweber'),
+    'dacd': ('SI', 'decacandela'),
+    'dag': ('SI', 'decagram'),
+    'dagray': ('SI', 'decagray'),
+    'dakat': ('SI', 'decakatal'),
+    'dalton': ('unit_definitions', 'atomic_mass_constant'),
+    'dalx': ('SI', 'decalux'),
+    'dam': ('SI', 'decameter'),
+    'damol': ('SI', 'decamole'),
+    'daohm': ('SI', 'decaohm'),
+    'das': ('SI', 'decasecond'),
+    'day': ('unit_definitions', 'day'),
+    'days': ('unit_definitions', 'day'),
+    'dcd': ('SI', 'decicandela'),
+    'debye': ('unit_definitions', 'debye'),
+    'decaampere': ('SI', 'decaampere'),
+    'decabecquerel': ('SI', 'decabecquerel'),
+    'decacandela': ('SI', 'decacandela'),
+    'decacoulomb': ('SI', 'decacoulomb'),
+    'decafarad': ('SI', 'decafarad'),
+    'decagram': ('SI', 'decagram'),
+    'decagray': ('SI', 'decagray'),
+    'decahenry': ('SI', 'decahenry'),
+    'decahertz': ('SI', 'decahertz'),
+    'decajoule': ('SI', 'decajoule'),
+    'decakatal': ('SI', 'decakatal'),
+    'decakelvin': ('SI', 'decakelvin'),
+    'decalux': ('SI', 'decalux'),
+    'decameter': ('SI', 'decameter'),
+    'decamole': ('SI', 'decamole'),
+    'decanewton': ('SI', 'decanewton'),
+    'decaohm': ('SI', 'decaohm'),
+    'decapascal': ('SI', 'decapascal'),
+    'decasecond': ('SI', 'decasecond'),
+    'decasiemens': ('SI', 'decasiemens'),
+    'decatesla': ('SI', 'decatesla'),
+    'decavolt': ('SI', 'decavolt'),
+    'decawatt': ('SI', 'decawatt'),
+    'decaweber': ('SI', 'decaweber'),
+    'deciampere': ('SI', 'deciampere'),
+    'decibecquerel': ('SI', 'decibecquerel'),
+    'decicandela': ('SI', 'decicandela'),
+    'decicoulomb': ('SI', 'decicoulomb'),
+    'decifarad': ('SI', 'decifarad'),
+    'decigram': ('SI', 'decigram'),
+    'decigray': ('SI', 'decigray'),
+    'decihenry': ('SI', 'decihenry'),
+    'decihertz': ('SI', 'decihertz'),
+    'decijoule': ('SI', 'decijoule'),
+    'decikatal': ('SI', 'decikatal'),
+    'decikelvin': ('SI', 'decikelvin'),
+    'deciliter': ('unit_definitions', 'deciliter'),
+    'deciliters': ('unit_definitions', 'deciliter'),
+    'decilux': ('SI', 'decilux'),
+    'decimeter': ('SI', 'decimeter'),
+    'decimeters': ('unit_definitions', 'decimeter'),
+    'decimole': ('SI', 'decimole'),
+    'decinewton': ('SI', 'decinewton'),
+    'deciohm': ('SI', 'deciohm'),
+    'decipascal': ('SI', 'decipascal'),
+    'decisecond': ('SI', 'decisecond'),
+    'decisiemens': ('SI', 'decisiemens'),
+    'decitesla': ('SI', 'decitesla'),
+    'decivolt': ('SI', 'decivolt'),
+    'deciwatt': ('SI', 'deciwatt'),
+    'deciweber': ('SI', 'deciweber'),
+    'deg': ('unit_definitions', 'degree'),
+    'degree': ('unit_definitions', 'degree'),
+    'degrees': ('unit_definitions', 'degree'),
+    'dg': ('SI', 'decigram'),
+    'dgray': ('SI', 'decigray'),
+    'diopter': ('unit_definitions', 'dioptre'),
+    'dioptre': ('unit_definitions', 'dioptre'),
+    'dkat': ('SI', 'decikatal'),
+    'dl': ('unit_definitions', 'deciliter'),
+    'dlx': ('SI', 'decilux'),
+    'dm': ('SI', 'decimeter'),
+    'dmol': ('SI', 'decimole'),
+    'dohm': ('SI', 'deciohm'),
+    'draconic_year': ('unit_definitions', 'draconic_year'),
+    'draconic_years': ('unit_definitions', 'draconic_year'),
+    'ds': ('SI', 'decisecond'),
+    'dyne': ('unit_definitions', 'dyne'),
+    'e': ('unit_definitions', 'elementary_charge'),
+    'e0': ('unit_definitions', 'vacuum_permittivity'),
+    'eV': ('unit_definitions', 'electronvolt'),
+    'electric_constant': ('unit_definitions', 'vacuum_permittivity'),
+    'electric_force_constant': ('unit_definitions', 'coulomb_constant'),
+    'electron_rest_mass': ('unit_definitions', 'electron_rest_mass'),
+    'electronvolt': ('unit_definitions', 'electronvolt'),
+    'electronvolts': ('unit_definitions', 'electronvolt'),
+    'elementary_charge': ('unit_definitions', 'elementary_charge'),
+    'erg': ('unit_definitions', 'erg'),
+    'exaampere': ('SI', 'exaampere'),
+    'exabecquerel': ('SI', 'exabecquerel'),
+    'exacandela': ('SI', 'exacandela'),
+    'exacoulomb': ('SI', 'exacoulomb'),
+    'exafarad': ('SI', 'exafarad'),
+    'exagram': ('SI', 'exagram'),
+    'exagray': ('SI', 'exagray'),
+    'exahenry': ('SI', 'exahenry'),
+    'exahertz': ('SI', 'exahertz'),
+    'exajoule': ('SI', 'exajoule'),
+    'exakatal': ('SI', 'exakatal'),
+    'exakelvin': ('SI', 'exakelvin'),
+    'exalux': ('SI', 'exalux'),
+    'exameter': ('SI', 'exameter'),
+    'examole': ('SI', 'examole'),
+    'exanewton': ('SI', 'exanewton'),
+    'exaohm': ('SI', 'exaohm'),
+    'exapascal': ('SI', 'exapascal'),
+    'exasecond': ('SI', 'exasecond'),
+    'exasiemens': ('SI', 'exasiemens'),
+    'exatesla': ('SI', 'exatesla'),
+    'exavolt': ('SI', 'exavolt'),
+    'exawatt': ('SI', 'exawatt'),
+    'exaweber': ('SI', 'exaweber'),
+    'exbibyte': ('unit_definitions', 'exbibyte'),
+    'exbibytes': ('unit_definitions', 'exbibyte'),
+    'fA': ('SI', 'femtoampere'),
+    'fBq': ('SI', 'femtobecquerel'),
+    'fC': ('SI', 'femtocoulomb'),
+    'fF': ('SI', 'femtofarad'),
+    'fH': ('SI', 'femtohenry'),
+    'fHz': ('SI', 'femtohertz'),
+    'fJ': ('SI', 'femtojoule'),
+    'fK': ('SI', 'femtokelvin'),
+    'fN': ('SI', 'femtonewton'),
+    'fPa': ('SI', 'femtopascal'),
+    'fS': ('SI', 'femtosiemens'),
+    'fT': ('SI', 'femtotesla'),
+    'fV': ('SI', 'femtovolt'),
+    'fW': ('SI', 'femtowatt'),
+    'fWb': ('SI', 'femtoweber'),
+    'farad': ('unit_definitions', 'farad'),
+    'faraday_constant': ('unit_definitions', 'faraday_constant'),
+    'farads': ('unit_definitions', 'farad'),
+    'fcd': ('SI', 'femtocandela'),
+    'feet': ('unit_definitions', 'foot'),
+    'femtoampere': ('SI', 'femtoampere'),
+    'femtobecquerel': ('SI', 'femtobecquerel'),
+    'femtocandela': ('SI', 'femtocandela'),
+    'femtocoulomb': ('SI', 'femtocoulomb'),
+    'femtofarad': ('SI', 'femtofarad'),
+    'femtogram': ('SI', 'femtogram'),
+    'femtogray': ('SI', 'femtogray'),
+    'femtohenry': ('SI', 'femtohenry'),
+    'femtohertz': ('SI', 'femtohertz'),
+    'femtojoule': ('SI', 'femtojoule'),
+    'femtokatal': ('SI', 'femtokatal'),
+    'femtokelvin': ('SI', 'femtokelvin'),
+    'femtolux': ('SI', 'femtolux'),
+    'femtometer': ('SI', 'femtometer'),
+    'femtomole': ('SI', 'femtomole'),
+    'femtonewton': ('SI', 'femtonewton'),
+    'femtoohm': ('SI', 'femtoohm'),
+    'femtopascal': ('SI', 'femtopascal'),
+    'femtosecond': ('SI', 'femtosecond'),
+    'femtosiemens': ('SI', 'femtosiemens'),
+    'femtotesla': ('SI', 'femtotesla'),
+    'femtovolt': ('SI', 'femtovolt'),
+    'femtowatt': ('SI', 'femtowatt'),
+    'femtoweber': ('SI', 'femtoweber'),
+    'fg': ('SI', 'femtogram'),
+    'fgray': ('SI', 'femtogray'),
+    'fkat': ('SI', 'femtokatal'),
+    'flx': ('SI', 'femtolux'),
+    'fm': ('SI', 'femtometer'),
+    'fmol': ('SI', 'femtomole'),
+    'fohm': ('SI', 'femtoohm'),
+    'foot': ('unit_definitions', 'foot'),
+    'franklin': ('unit_definitions', 'statcoulomb'),
+    'fs': ('SI', 'femtosecond'),
+    'ft': ('unit_definitions', 'foot'),
+    'full_moon_cycle': ('unit_definitions', 'full_moon_cycle'),
+    'full_moon_cycles': ('unit_definitions', 'full_moon_cycle'),
+    'g': ('unit_definitions', 'gram'),
+    'gauss': ('unit_definitions', 'gauss'),
+    'gaussian_year': ('unit_definitions', 'gaussian_year'),
+    'gaussian_years': ('unit_definitions', 'gaussian_year'),
+    'gee': ('unit_definitions', 'acceleration_due_to_gravity'),
+    'gees': ('unit_definitions', 'acceleration_due_to_gravity'),
+    'gibibyte': ('unit_definitions', 'gibibyte'),
+    'gibibytes': ('unit_definitions', 'gibibyte'),
+    'gigaampere': ('SI', 'gigaampere'),
+    'gigabecquerel': ('SI', 'gigabecquerel'),
+    'gigacandela': ('SI', 'gigacandela'),
+    'gigacoulomb': ('SI', 'gigacoulomb'),
+    'gigafarad': ('SI', 'gigafarad'),
+    'gigagram': ('SI', 'gigagram'),
+    'gigagray': ('SI', 'gigagray'),
+    'gigahenry': ('SI', 'gigahenry'),
+    'gigahertz': ('SI', 'gigahertz'),
+    'gigajoule': ('SI', 'gigajoule'),
+    'gigakatal': ('SI', 'gigakatal'),
+    'gigakelvin': ('SI', 'gigakelvin'),
+    'gigalux': ('SI', 'gigalux'),
+    'gigameter': ('SI', 'gigameter'),
+    'gigamole': ('SI', 'gigamole'),
+    'giganewton': ('SI', 'giganewton'),
+    'gigaohm': ('SI', 'gigaohm'),
+    'gigapascal': ('SI', 'gigapascal'),
+    'gigasecond': ('SI', 'gigasecond'),
+    'gigasiemens': ('SI', 'gigasiemens'),
+    'gigatesla': ('SI', 'gigatesla'),
+    'gigavolt': ('SI', 'gigavolt'),
+    'gigawatt': ('SI', 'gigawatt'),
+    'gigaweber': ('SI', 'gigaweber'),
+    'gram': ('unit_definitions', 'gram'),
+    'grams': ('unit_definitions', 'gram'),
+    'gravitational_constant': ('unit_definitions', 'gravitational_constant'),
+    'gray': ('unit_definitions', 'gray'),
+    'h': ('unit_definitions', 'hour'),
+    'hA': ('SI', 'hectoampere'),
+    'hBq': ('SI', 'hectobecquerel'),
+    'hC': ('SI', 'hectocoulomb'),
+    'hF': ('SI', 'hectofarad'),
+    'hH': ('SI', 'hectohenry'),
+    'hHz': ('SI', 'hectohertz'),
+    'hJ': ('SI', 'hectojoule'),
+    'hK': ('SI', 'hectokelvin'),
+    'hN': ('SI', 'hectonewton'),
+    'hPa': ('SI', 'hectopascal'),
+    'hS': ('SI', 'hectosiemens'),
+    'hT': ('SI', 'hectotesla'),
+    'hV': ('SI', 'hectovolt'),
+    'hW': ('SI', 'hectowatt'),
+    'hWb': ('SI', 'hectoweber'),
+    'ha': ('unit_definitions', 'hectare'),
+    'hbar': ('unit_definitions', 'hbar'),
+    'hcd': ('SI', 'hectocandela'),
+    'hectare': ('unit_definitions', 'hectare'),
+    'hectoampere': ('SI', 'hectoampere'),
+    'hectobecquerel': ('SI', 'hectobecquerel'),
+    'hectocandela': ('SI', 'hectocandela'),
+    'hectocoulomb': ('SI', 'hectocoulomb'),
+    'hectofarad': ('SI', 'hectofarad'),
+    'hectogram': ('SI', 'hectogram'),
+    'hectogray': ('SI', 'hectogray'),
+    'hectohenry': ('SI', 'hectohenry'),
+    'hectohertz': ('SI', 'hectohertz'),
+    'hectojoule': ('SI', 'hectojoule'),
+    'hectokatal': ('SI', 'hectokatal'),
+    'hectokelvin': ('SI', 'hectokelvin'),
+    'hectolux': ('SI', 'hectolux'),
+    'hectometer': ('SI', 'hectometer'),
+    'hectomole': ('SI', 'hectomole'),
+    'hectonewton': ('SI', 'hectonewton'),
+    'hectoohm': ('SI', 'hectoohm'),
+    'hectopascal': ('SI', 'hectopascal'),
+    'hectosecond': ('SI', 'hectosecond'),
+    'hectosiemens': ('SI', 'hectosiemens'),
+    'hectotesla': ('SI', 'hectotesla'),
+    'hectovolt': ('SI', 'hectovolt'),
+    'hectowatt': ('SI', 'hectowatt'),
+    'hectoweber': ('SI', 'hectoweber'),
+    'henry': ('unit_definitions', 'henry'),
+    'henrys': ('unit_definitions', 'henry'),
+    'hertz': ('unit_definitions', 'hertz'),
+    'hg': ('SI', 'hectogram'),
+    'hgray': ('SI', 'hectogray'),
+    'hkat': ('SI', 'hectokatal'),
+    'hlx': ('SI', 'hectolux'),
+    'hm': ('SI', 'hectometer'),
+    'hmol': ('SI', 'hectomole'),
+    'hohm': ('SI', 'hectoohm'),
+    'hour': ('unit_definitions', 'hour'),
+    'hours': ('unit_definitions', 'hour'),
+    'hs': ('SI', 'hectosecond'),
+    'hz': ('unit_definitions', 'hertz'),
+    'inch': ('unit_definitions', 'inch'),
+    'inches': ('unit_definitions', 'inch'),
+    'josephson_constant': ('unit_definitions', 'josephson_constant'),
+    'joule': ('unit_definitions', 'joule'),
+    'joules': ('unit_definitions', 'joule'),
+    'julian_year': ('unit_definitions', 'julian_year'),
+    'julian_years': ('unit_definitions', 'julian_year'),
+    'kA': ('SI', 'kiloampere'),
+    'kBq': ('SI', 'kilobecquerel'),
+    'kC': ('SI', 'kilocoulomb'),
+    'kF': ('SI', 'kilofarad'),
+    'kH': ('SI', 'kilohenry'),
+    'kHz': ('SI', 'kilohertz'),
+    'kJ': ('SI', 'kilojoule'),
+    'kK': ('SI', 'kilokelvin'),
+    'kN': ('SI', 'kilonewton'),
+    'kPa': ('SI', 'kilopascal'),
+    'kS': ('SI', 'kilosiemens'),
+    'kT': ('SI', 'kilotesla'),
+    'kV': ('SI', 'kilovolt'),
+    'kW': ('SI', 'kilowatt'),
+    'kWb': ('SI', 'kiloweber'),
+    'k_e': ('unit_definitions', 'coulomb_constant'),
+    'kat': ('unit_definitions', 'katal'),
+    'katal': ('unit_definitions', 'katal'),
+    'kcd': ('SI', 'kilocandela'),
+    'kelvin': ('unit_definitions', 'kelvin'),
+    'kelvins': ('unit_definitions', 'kelvin'),
+    'kg': ('unit_definitions', 'kilogram'),
+    'kgray': ('SI', 'kilogray'),
+    'kibibyte': ('unit_definitions', 'kibibyte'),
+    'kibibytes': ('unit_definitions', 'kibibyte'),
+    'kiloampere': ('SI', 'kiloampere'),
+    'kilobecquerel': ('SI', 'kilobecquerel'),
+    'kilocandela': ('SI', 'kilocandela'),
+    'kilocoulomb': ('SI', 'kilocoulomb'),
+    'kilofarad': ('SI', 'kilofarad'),
+    'kilogram': ('unit_definitions', 'kilogram'),
+    'kilograms': ('unit_definitions', 'kilogram'),
+    'kilogray': ('SI', 'kilogray'),
+    'kilohenry': ('SI', 'kilohenry'),
+    'kilohertz': ('SI', 'kilohertz'),
+    'kilojoule': ('SI', 'kilojoule'),
+    'kilokatal': ('SI', 'kilokatal'),
+    'kilokelvin': ('SI', 'kilokelvin'),
+    'kilolux': ('SI', 'kilolux'),
+    'kilometer': ('SI', 'kilometer'),
+    'kilometers': ('unit_definitions', 'kilometer'),
+    'kilomole': ('SI', 'kilomole'),
+    'kilonewton': ('SI', 'kilonewton'),
+    'kilonewtons': ('unit_definitions', 'kilonewton'),
+    'kiloohm': ('SI', 'kiloohm'),
+    'kilopascal': ('SI', 'kilopascal'),
+    'kilosecond': ('SI', 'kilosecond'),
+    'kilosiemens': ('SI', 'kilosiemens'),
+    'kilotesla': ('SI', 'kilotesla'),
+    'kilovolt': ('SI', 'kilovolt'),
+    'kilowatt': ('SI', 'kilowatt'),
+    'kiloweber': ('SI', 'kiloweber'),
+    'kkat': ('SI', 'kilokatal'),
+    'klx': ('SI', 'kilolux'),
+    'km': ('SI', 'kilometer'),
+    'kmol': ('SI', 'kilomole'),
+    'kohm': ('SI', 'kiloohm'),
+    'ks': ('SI', 'kilosecond'),
+    'l': ('unit_definitions', 'liter'),
+    'l_P': ('unit_definitions', 'planck_length'),
+    'lightyear': ('unit_definitions', 'lightyear'),
+    'lightyears': ('unit_definitions', 'lightyear'),
+    'liter': ('unit_definitions', 'liter'),
+    'liters': ('unit_definitions', 'liter'),
+    'lux': ('unit_definitions', 'lux'),
+    'lx': ('unit_definitions', 'lux'),
+    'ly': ('unit_definitions', 'lightyear'),
+    'm': ('unit_definitions', 'meter'),
+    'mA': ('SI', 'milliampere'),
+    'mBq': ('SI', 'millibecquerel'),
+    'mC': ('SI', 'millicoulomb'),
+    'mF': ('SI', 'millifarad'),
+    'mH': ('SI', 'millihenry'),
+    'mHz': ('SI', 'millihertz'),
+    'mJ': ('SI', 'millijoule'),
+    'mK': ('SI', 'millikelvin'),
+    'mL': ('unit_definitions', 'milliliter'),
+    'mN': ('SI', 'millinewton'),
+    'mPa': ('SI', 'millipascal'),
+    'mS': ('SI', 'millisiemens'),
+    'mT': ('SI', 'millitesla'),
+    'mV': ('SI', 'millivolt'),
+    'mW': ('SI', 'milliwatt'),
+    'mWb': ('SI', 'milliweber'),
+    'm_P': ('unit_definitions', 'planck_mass'),
+    'magnetic_constant': ('unit_definitions', 'magnetic_constant'),
+    'maxwell': ('unit_definitions', 'maxwell'),
+    'mcd': ('SI', 'millicandela'),
+    'me': ('unit_definitions', 'electron_rest_mass'),
+    'mebibyte': ('unit_definitions', 'mebibyte'),
+    'mebibytes': ('unit_definitions', 'mebibyte'),
+    'megaampere': ('SI', 'megaampere'),
+    'megabecquerel': ('SI', 'megabecquerel'),
+    'megacandela': ('SI', 'megacandela'),
+    'megacoulomb': ('SI', 'megacoulomb'),
+    'megafarad': ('SI', 'megafarad'),
+    'megagram': ('SI', 'megagram'),
+    'megagray': ('SI', 'megagray'),
+    'megahenry': ('SI', 'megahenry'),
+    'megahertz': ('SI', 'megahertz'),
+    'megajoule': ('SI', 'megajoule'),
+    'megakatal': ('SI', 'megakatal'),
+    'megakelvin': ('SI', 'megakelvin'),
+    'megalux': ('SI', 'megalux'),
+    'megameter': ('SI', 'megameter'),
+    'megamole': ('SI', 'megamole'),
+    'meganewton': ('SI', 'meganewton'),
+    'meganewtons': ('unit_definitions', 'meganewton'),
+    'megaohm': ('SI', 'megaohm'),
+    'megapascal': ('SI', 'megapascal'),
+    'megasecond': ('SI', 'megasecond'),
+    'megasiemens': ('SI', 'megasiemens'),
+    'megatesla': ('SI', 'megatesla'),
+    'megavolt': ('SI', 'megavolt'),
+    'megawatt': ('SI', 'megawatt'),
+    'megaweber': ('SI', 'megaweber'),
+    'meter': ('unit_definitions', 'meter'),
+    'meters': ('unit_definitions', 'meter'),
+    'metric_ton': ('unit_definitions', 'tonne'),
+    'mg': ('SI', 'milligram'),
+    'mgray': ('SI', 'milligray'),
+    'mho': ('unit_definitions', 'siemens'),
+    'mhos': ('unit_definitions', 'siemens'),
+    'mi': ('unit_definitions', 'mile'),
+    'microampere': ('SI', 'microampere'),
+    'microbecquerel': ('SI', 'microbecquerel'),
+    'microcandela': ('SI', 'microcandela'),
+    'microcoulomb': ('SI', 'microcoulomb'),
+    'microfarad': ('SI', 'microfarad'),
+    'microgram': ('SI', 'microgram'),
+    'micrograms': ('unit_definitions', 'microgram'),
+    'microgray': ('SI', 'microgray'),
+    'microhenry': ('SI', 'microhenry'),
+    'microhertz': ('SI', 'microhertz'),
+    'microjoule': ('SI', 'microjoule'),
+    'microkatal': ('SI', 'microkatal'),
+    'microkelvin': ('SI', 'microkelvin'),
+    'microlux': ('SI', 'microlux'),
+    'micrometer': ('SI', 'micrometer'),
+    'micrometers': ('unit_definitions', 'micrometer'),
+    'micromole': ('SI', 'micromole'),
+    'micron': ('unit_definitions', 'micrometer'),
+    'micronewton': ('SI', 'micronewton'),
+    'microns': ('unit_definitions', 'micrometer'),
+    'microohm': ('SI', 'microohm'),
+    'micropascal': ('SI', 'micropascal'),
+    'microsecond': ('SI', 'microsecond'),
+    'microseconds': ('unit_definitions', 'microsecond'),
+    'microsiemens': ('SI', 'microsiemens'),
+    'microtesla': ('SI', 'microtesla'),
+    'microvolt': ('SI', 'microvolt'),
+    'microwatt': ('SI', 'microwatt'),
+    'microweber': ('SI', 'microweber'),
+    'mil': ('unit_definitions', 'angular_mil'),
+    'mile': ('unit_definitions', 'mile'),
+    'miles': ('unit_definitions', 'mile'),
+    'milli_mass_unit': ('unit_definitions', 'milli_mass_unit'),
+    'milliampere': ('SI', 'milliampere'),
+    'millibecquerel': ('SI', 'millibecquerel'),
+    'millicandela': ('SI', 'millicandela'),
+    'millicoulomb': ('SI', 'millicoulomb'),
+    'millifarad': ('SI', 'millifarad'),
+    'milligram': ('SI', 'milligram'),
+    'milligrams': ('unit_definitions', 'milligram'),
+    'milligray': ('SI', 'milligray'),
+    'millihenry': ('SI', 'millihenry'),
+    'millihertz': ('SI', 'millihertz'),
+    'millijoule': ('SI', 'millijoule'),
+    'millikatal': ('SI', 'millikatal'),
+    'millikelvin': ('SI', 'millikelvin'),
+    'milliliter': ('unit_definitions', 'milliliter'),
+    'milliliters': ('unit_definitions', 'milliliter'),
+    'millilux': ('SI', 'millilux'),
+    'millimeter': ('SI', 'millimeter'),
+    'millimeters': ('unit_definitions', 'millimeter'),
+    'millimole': ('SI', 'millimole'),
+    'millinewton': ('SI', 'millinewton'),
+    'milliohm': ('SI', 'milliohm'),
+    'millipascal': ('SI', 'millipascal'),
+    'millisecond': ('SI', 'millisecond'),
+    'milliseconds': ('unit_definitions', 'millisecond'),
+    'millisiemens': ('SI', 'millisiemens'),
+    'millitesla': ('SI', 'millitesla'),
+    'millivolt': ('SI', 'millivolt'),
+    'milliwatt': ('SI', 'milliwatt'),
+    'milliweber': ('SI', 'milliweber'),
+    'min': ('unit_definitions', 'minute'),
+    'minute': ('unit_definitions', 'minute'),
+    'minutes': ('unit_definitions', 'minute'),
+    'mkat': ('SI', 'millikatal'),
+    'ml': ('unit_definitions', 'milliliter'),
+    'mlx': ('SI', 'millilux'),
+    'mm': ('SI', 'millimeter'),
+    'mmHg': ('unit_definitions', 'mmHg'),
+    'mmol': ('SI', 'millimole'),
+    'mmu': ('unit_definitions', 'milli_mass_unit'),
+    'mmus': ('unit_definitions', 'milli_mass_unit'),
+    'mohm': ('SI', 'milliohm'),
+    'mol': ('unit_definitions', 'mole'),
+    'molar_gas_constant': ('unit_definitions', 'molar_gas_constant'),
+    'mole': ('unit_definitions', 'mole'),
+    'moles': ('unit_definitions', 'mole'),
+    'ms': ('SI', 'millisecond'),
+    'muA': ('SI', 'microampere'),
+    'muBq': ('SI', 'microbecquerel'),
+    'muC': ('SI', 'microcoulomb'),
+    'muF': ('SI', 'microfarad'),
+    'muH': ('SI', 'microhenry'),
+    'muHz': ('SI', 'microhertz'),
+    'muJ': ('SI', 'microjoule'),
+    'muK': ('SI', 'microkelvin'),
+    'muN': ('SI', 'micronewton'),
+    'muPa': ('SI', 'micropascal'),
+    'muS': ('SI', 'microsiemens'),
+    'muT': ('SI', 'microtesla'),
+    'muV': ('SI', 'microvolt'),
+    'muW': ('SI', 'microwatt'),
+    'muWb': ('SI', 'microweber'),
+    'mucd': ('SI', 'microcandela'),
+    'mug': ('SI', 'microgram'),
+    'mugray': ('SI', 'microgray'),
+    'mukat': ('SI', 'microkatal'),
+    'mulx': ('SI', 'microlux'),
+    'mum': ('SI', 'micrometer'),
+    'mumol': ('SI', 'micromole'),
+    'muohm': ('SI', 'microohm'),
+    'mus': ('SI', 'microsecond'),
+    'nA': ('SI', 'nanoampere'),
+    'nBq': ('SI', 'nanobecquerel'),
+    'nC': ('SI', 'nanocoulomb'),
+    'nF': ('SI', 'nanofarad'),
+    'nH': ('SI', 'nanohenry'),
+    'nHz': ('SI', 'nanohertz'),
+    'nJ': ('SI', 'nanojoule'),
+    'nK': ('SI', 'nanokelvin'),
+    'nN': ('SI', 'nanonewton'),
+    'nPa': ('SI', 'nanopascal'),
+    'nS': ('SI', 'nanosiemens'),
+    'nT': ('SI', 'nanotesla'),
+    'nV': ('SI', 'nanovolt'),
+    'nW': ('SI', 'nanowatt'),
+    'nWb': ('SI', 'nanoweber'),
+    'nanoampere': ('SI', 'nanoampere'),
+    'nanobecquerel': ('SI', 'nanobecquerel'),
+    'nanocandela': ('SI', 'nanocandela'),
+    'nanocoulomb': ('SI', 'nanocoulomb'),
+    'nanofarad': ('SI', 'nanofarad'),
+    'nanogram': ('SI', 'nanogram'),
+    'nanogray': ('SI', 'nanogray'),
+    'nanohenry': ('SI', 'nanohenry'),
+    'nanohertz': ('SI', 'nanohertz'),
+    'nanojoule': ('SI', 'nanojoule'),
+    'nanokatal': ('SI', 'nanokatal'),
+    'nanokelvin': ('SI', 'nanokelvin'),
+    'nanolux': ('SI', 'nanolux'),
+    'nanometer': ('SI', 'nanometer'),
+    'nanometers': ('unit_definitions', 'nanometer'),
+    'nanomole': ('SI', 'nanomole'),
+    'nanonewton': ('SI', 'nanonewton'),
+    'nanoohm': ('SI', 'nanoohm'),
+    'nanopascal': ('SI', 'nanopascal'),
+    'nanosecond': ('SI', 'nanosecond'),
+    'nanoseconds': ('unit_definitions', 'nanosecond'),
+    'nanosiemens': ('SI', 'nanosiemens'),
+    'nanotesla': ('SI', 'nanotesla'),
+    'nanovolt': ('SI', 'nanovolt'),
+    'nanowatt': ('SI', 'nanowatt'),
+    'nanoweber': ('SI', 'nanoweber'),
+    'nautical_mile': ('unit_definitions', 'nautical_mile'),
+    'nautical_miles': ('unit_definitions', 'nautical_mile'),
+    'ncd': ('SI', 'nanocandela'),
+    'newton': ('unit_definitions', 'newton'),
+    'newtons': ('unit_definitions', 'newton'),
+    'ng': ('SI', 'nanogram'),
+    'ngray': ('SI', 'nanogray'),
+    'nkat': ('SI', 'nanokatal'),
+    'nlx': ('SI', 'nanolux'),
+    'nm': ('SI', 'nanometer'),
+    'nmi': ('unit_definitions', 'nautical_mile'),
+    'nmol': ('SI', 'nanomole'),
+    'nohm': ('SI', 'nanoohm'),
+    'ns': ('SI', 'nanosecond'),
+    'oersted': ('unit_definitions', 'oersted'),
+    'ohm': ('unit_definitions', 'ohm'),
+    'ohms': ('unit_definitions', 'ohm'),
+    'omega_P': ('unit_definitions', 'planck_angular_frequency'),
+    'optical_power': ('unit_definitions', 'dioptre'),
+    'pA': ('SI', 'picoampere'),
+    'pBq': ('SI', 'picobecquerel'),
+    'pC': ('SI', 'picocoulomb'),
+    'pF': ('SI', 'picofarad'),
+    'pH': ('SI', 'picohenry'),
+    'pHz': ('SI', 'picohertz'),
+    'pJ': ('SI', 'picojoule'),
+    'pK': ('SI', 'picokelvin'),
+    'pN': ('SI', 'piconewton'),
+    'pPa': ('SI', 'picopascal'),
+    'pS': ('SI', 'picosiemens'),
+    'pT': ('SI', 'picotesla'),
+    'pV': ('SI', 'picovolt'),
+    'pW': ('SI', 'picowatt'),
+    'pWb': ('SI', 'picoweber'),
+    'p_P': ('unit_definitions', 'planck_pressure'),
+    'pa': ('unit_definitions', 'pascal'),
+    'pascal': ('unit_definitions', 'pascal'),
+    'pascals': ('unit_definitions', 'pascal'),
+    'pcd': ('SI', 'picocandela'),
+    'pebibyte': ('unit_definitions', 'pebibyte'),
+    'pebibytes': ('unit_definitions', 'pebibyte'),
+    'percent': ('unit_definitions', 'percent'),
+    'percents': ('unit_definitions', 'percent'),
+    'permille': ('unit_definitions', 'permille'),
+    'petaampere': ('SI', 'petaampere'),
+    'petabecquerel': ('SI', 'petabecquerel'),
+    'petacandela': ('SI', 'petacandela'),
+    'petacoulomb': ('SI', 'petacoulomb'),
+    'petafarad': ('SI', 'petafarad'),
+    'petagram': ('SI', 'petagram'),
+    'petagray': ('SI', 'petagray'),
+    'petahenry': ('SI', 'petahenry'),
+    'petahertz': ('SI', 'petahertz'),
+    'petajoule': ('SI', 'petajoule'),
+    'petakatal': ('SI', 'petakatal'),
+    'petakelvin': ('SI', 'petakelvin'),
+    'petalux': ('SI', 'petalux'),
+    'petameter': ('SI', 'petameter'),
+    'petamole': ('SI', 'petamole'),
+    'petanewton': ('SI', 'petanewton'),
+    'petaohm': ('SI', 'petaohm'),
+    'petapascal': ('SI', 'petapascal'),
+    'petasecond': ('SI', 'petasecond'),
+    'petasiemens': ('SI', 'petasiemens'),
+    'petatesla': ('SI', 'petatesla'),
+    'petavolt': ('SI', 'petavolt'),
+    'petawatt': ('SI', 'petawatt'),
+    'petaweber': ('SI', 'petaweber'),
+    'pg': ('SI', 'picogram'),
+    'pgray': ('SI', 'picogray'),
+    'picoampere': ('SI', 'picoampere'),
+    'picobecquerel': ('SI', 'picobecquerel'),
+    'picocandela': ('SI', 'picocandela'),
+    'picocoulomb': ('SI', 'picocoulomb'),
+    'picofarad': ('SI', 'picofarad'),
+    'picogram': ('SI', 'picogram'),
+    'picogray': ('SI', 'picogray'),
+    'picohenry': ('SI', 'picohenry'),
+    'picohertz': ('SI', 'picohertz'),
+    'picojoule': ('SI', 'picojoule'),
+    'picokatal': ('SI', 'picokatal'),
+    'picokelvin': ('SI', 'picokelvin'),
+    'picolux': ('SI', 'picolux'),
+    'picometer': ('SI', 'picometer'),
+    'picometers': ('unit_definitions', 'picometer'),
+    'picomole': ('SI', 'picomole'),
+    'piconewton': ('SI', 'piconewton'),
+    'picoohm': ('SI', 'picoohm'),
+    'picopascal': ('SI', 'picopascal'),
+    'picosecond': ('SI', 'picosecond'),
+    'picoseconds': ('unit_definitions', 'picosecond'),
+    'picosiemens': ('SI', 'picosiemens'),
+    'picotesla': ('SI', 'picotesla'),
+    'picovolt': ('SI', 'picovolt'),
+    'picowatt': ('SI', 'picowatt'),
+    'picoweber': ('SI', 'picoweber'),
+    'pkat': ('SI', 'picokatal'),
+    'planck': ('unit_definitions', 'planck'),
+    'planck_acceleration': ('unit_definitions', 'planck_acceleration'),
+    'planck_angular_frequency': ('unit_definitions', 'planck_angular_frequency'),
+    'planck_area': ('unit_definitions', 'planck_area'),
+    'planck_charge': ('unit_definitions', 'planck_charge'),
+    'planck_current': ('unit_definitions', 'planck_current'),
+    'planck_density': ('unit_definitions', 'planck_density'),
+    'planck_energy': ('unit_definitions', 'planck_energy'),
+    'planck_energy_density': ('unit_definitions', 'planck_energy_density'),
+    'planck_force': ('unit_definitions', 'planck_force'),
+    'planck_impedance': ('unit_definitions', 'planck_impedance'),
+    'planck_intensity': ('unit_definitions', 'planck_intensity'),
+    'planck_length': ('unit_definitions', 'planck_length'),
+    'planck_mass': ('unit_definitions', 'planck_mass'),
+    'planck_momentum': ('unit_definitions', 'planck_momentum'),
+    'planck_power': ('unit_definitions', 'planck_power'),
+    'planck_pressure': ('unit_definitions', 'planck_pressure'),
+    'planck_temperature': ('unit_definitions', 'planck_temperature'),
+    'planck_time': ('unit_definitions', 'planck_time'),
+    'planck_voltage': ('unit_definitions', 'planck_voltage'),
+    'planck_volume': ('unit_definitions', 'planck_volume'),
+    'plx': ('SI', 'picolux'),
+    'pm': ('SI', 'picometer'),
+    'pmol': ('SI', 'picomole'),
+    'pohm': ('SI', 'picoohm'),
+    'pound': ('unit_definitions', 'pound'),
+    'pounds': ('unit_definitions', 'pound'),
+    'ps': ('SI', 'picosecond'),
+    'psi': ('unit_definitions', 'psi'),
+    'q_P': ('unit_definitions', 'planck_charge'),
+    'quart': ('unit_definitions', 'quart'),
+    'quarts': ('unit_definitions', 'quart'),
+    'rad': ('unit_definitions', 'radian'),
+    'radian': ('unit_definitions', 'radian'),
+    'radians': ('unit_definitions', 'radian'),
+    'rho^E_P': ('unit_definitions', 'planck_energy_density'),
+    'rho_P': ('unit_definitions', 'planck_density'),
+    'rutherford': ('unit_definitions', 'rutherford'),
+    's': ('unit_definitions', 'second'),
+    'sec': ('unit_definitions', 'second'),
+    'second': ('unit_definitions', 'second'),
+    'seconds': ('unit_definitions', 'second'),
+    'sidereal_year': ('unit_definitions', 'sidereal_year'),
+    'sidereal_years': ('unit_definitions', 'sidereal_year'),
+    'siemens': ('unit_definitions', 'siemens'),
+    'speed_of_light': ('unit_definitions', 'speed_of_light'),
+    'sr': ('unit_definitions', 'steradian'),
+    'statC': ('unit_definitions', 'statcoulomb'),
+    'statampere': ('unit_definitions', 'statampere'),
+    'statcoulomb': ('unit_definitions', 'statcoulomb'),
+    'statvolt': ('unit_definitions', 'statvolt'),
+    'stefan': ('unit_definitions', 'stefan_boltzmann_constant'),
+    'stefan_boltzmann_constant': ('unit_definitions', 'stefan_boltzmann_constant'),
+    'steradian': ('unit_definitions', 'steradian'),
+    'steradians': ('unit_definitions', 'steradian'),
+    't': ('unit_definitions', 'tonne'),
+    't_P': ('unit_definitions', 'planck_time'),
+    'tebibyte': ('unit_definitions', 'tebibyte'),
+    'tebibytes': ('unit_definitions', 'tebibyte'),
+    'teraampere': ('SI', 'teraampere'),
+    'terabecquerel': ('SI', 'terabecquerel'),
+    'teracandela': ('SI', 'teracandela'),
+    'teracoulomb': ('SI', 'teracoulomb'),
+    'terafarad': ('SI', 'terafarad'),
+    'teragram': ('SI', 'teragram'),
+    'teragray': ('SI', 'teragray'),
+    'terahenry': ('SI', 'terahenry'),
+    'terahertz': ('SI', 'terahertz'),
+    'terajoule': ('SI', 'terajoule'),
+    'terakatal': ('SI', 'terakatal'),
+    'terakelvin': ('SI', 'terakelvin'),
+    'teralux': ('SI', 'teralux'),
+    'terameter': ('SI', 'terameter'),
+    'teramole': ('SI', 'teramole'),
+    'teranewton': ('SI', 'teranewton'),
+    'teraohm': ('SI', 'teraohm'),
+    'terapascal': ('SI', 'terapascal'),
+    'terasecond': ('SI', 'terasecond'),
+    'terasiemens': ('SI', 'terasiemens'),
+    'teratesla': ('SI', 'teratesla'),
+    'teravolt': ('SI', 'teravolt'),
+    'terawatt': ('SI', 'terawatt'),
+    'teraweber': ('SI', 'teraweber'),
+    'tesla': ('unit_definitions', 'tesla'),
+    'teslas': ('unit_definitions', 'tesla'),
+    'tonne': ('unit_definitions', 'tonne'),
+    'torr': ('unit_definitions', 'mmHg'),
+    'tropical_year': ('unit_definitions', 'tropical_year'),
+    'tropical_years': ('unit_definitions', 'tropical_year'),
+    'u0': ('unit_definitions', 'magnetic_constant'),
+    'ug': ('unit_definitions', 'microgram'),
+    'um': ('unit_definitions', 'micrometer'),
+    'us': ('unit_definitions', 'microsecond'),
+    'v': ('unit_definitions', 'volt'),
+    'vacuum_impedance': ('unit_definitions', 'vacuum_impedance'),
+    'vacuum_permeability': ('unit_definitions', 'magnetic_constant'),
+    'vacuum_permittivity': ('unit_definitions', 'vacuum_permittivity'),
+    'volt': ('unit_definitions', 'volt'),
+    'volts': ('unit_definitions', 'volt'),
+    'von_klitzing_constant': ('unit_definitions', 'von_klitzing_constant'),
+    'watt': ('unit_definitions', 'watt'),
+    'watts': ('unit_definitions', 'watt'),
+    'wb': ('unit_definitions', 'weber'),
+    'weber': ('unit_definitions', 'weber'),
+    'webers': ('unit_definitions', 'weber'),
+    'yA': ('SI', 'yoctoampere'),
+    'yBq': ('SI', 'yoctobecquerel'),
+    'yC': ('SI', 'yoctocoulomb'),
+    'yF': ('SI', 'yoctofarad'),
+    'yH': ('SI', 'yoctohenry'),
+    'yHz': ('SI', 'yoctohertz'),
+    'yJ': ('SI', 'yoctojoule'),
+    'yK': ('SI', 'yoctokelvin'),
+    'yN': ('SI', 'yoctonewton'),
+    'yPa': ('SI', 'yoctopascal'),
+    'yS': ('SI', 'yoctosiemens'),
+    'yT': ('SI', 'yoctotesla'),
+    'yV': ('SI', 'yoctovolt'),
+    'yW': ('SI', 'yoctowatt'),
+    'yWb': ('SI', 'yoctoweber'),
+    'yard': ('unit_definitions', 'yard'),
+    'yards': ('unit_definitions', 'yard'),
+    'ycd': ('SI', 'yoctocandela'),
+    'yd': ('unit_definitions', 'yard'),
+    'year': ('unit_definitions', 'tropical_year'),
+    'years': ('unit_definitions', 'tropical_year'),
+    'yg': ('SI', 'yoctogram'),
+    'ygray': ('SI', 'yoctogray'),
+    'ykat': ('SI', 'yoctokatal'),
+    'ylx': ('SI', 'yoctolux'),
+    'ym': ('SI', 'yoctometer'),
+    'ymol': ('SI', 'yoctomole'),
+    'yoctoampere': ('SI', 'yoctoampere'),
+    'yoctobecquerel': ('SI', 'yoctobecquerel'),
+    'yoctocandela': ('SI', 'yoctocandela'),
+    'yoctocoulomb': ('SI', 'yoctocoulomb'),
+    'yoctofarad': ('SI', 'yoctofarad'),
+    'yoctogram': ('SI', 'yoctogram'),
+    'yoctogray': ('SI', 'yoctogray'),
+    'yoctohenry': ('SI', 'yoctohenry'),
+    'yoctohertz': ('SI', 'yoctohertz'),
+    'yoctojoule': ('SI', 'yoctojoule'),
+    'yoctokatal': ('SI', 'yoctokatal'),
+    'yoctokelvin': ('SI', 'yoctokelvin'),
+    'yoctolux': ('SI', 'yoctolux'),
+    'yoctometer': ('SI', 'yoctometer'),
+    'yoctomole': ('SI', 'yoctomole'),
+    'yoctonewton': ('SI', 'yoctonewton'),
+    'yoctoohm': ('SI', 'yoctoohm'),
+    'yoctopascal': ('SI', 'yoctopascal'),
+    'yoctosecond': ('SI', 'yoctosecond'),
+    'yoctosiemens': ('SI', 'yoctosiemens'),
+    'yoctotesla': ('SI', 'yoctotesla'),
+    'yoctovolt': ('SI', 'yoctovolt'),
+    'yoctowatt': ('SI', 'yoctowatt'),
+    'yoctoweber': ('SI', 'yoctoweber'),
+    'yohm': ('SI', 'yoctoohm'),
+    'yottaampere': ('SI', 'yottaampere'),
+    'yottabecquerel': ('SI', 'yottabecquerel'),
+    'yottacandela': ('SI', 'yottacandela'),
+    'yottacoulomb': ('SI', 'yottacoulomb'),
+    'yottafarad': ('SI', 'yottafarad'),
+    'yottagram': ('SI', 'yottagram'),
+    'yottagray': ('SI', 'yottagray'),
+    'yottahenry': ('SI', 'yottahenry'),
+    'yottahertz': ('SI', 'yottahertz'),
+    'yottajoule': ('SI', 'yottajoule'),
+    'yottakatal': ('SI', 'yottakatal'),
+    'yottakelvin': ('SI', 'yottakelvin'),
+    'yottalux': ('SI', 'yottalux'),
+    'yottameter': ('SI', 'yottameter'),
+    'yottamole': ('SI', 'yottamole'),
+    'yottanewton': ('SI', 'yottanewton'),
+    'yottaohm': ('SI', 'yottaohm'),
+    'yottapascal': ('SI', 'yottapascal'),
+    'yottasecond': ('SI', 'yottasecond'),
+    'yottasiemens': ('SI', 'yottasiemens'),
+    'yottatesla': ('SI', 'yottatesla'),
+    'yottavolt': ('SI', 'yottavolt'),
+    'yottawatt': ('SI', 'yottawatt'),
+    'yottaweber': ('SI', 'yottaweber'),
+    'ys': ('SI', 'yoctosecond'),
+    'zA': ('SI', 'zeptoampere'),
+    'zBq': ('SI', 'zeptobecquerel'),
+    'zC': ('SI', 'zeptocoulomb'),
+    'zF': ('SI', 'zeptofarad'),
+    'zH': ('SI', 'zeptohenry'),
+    'zHz': ('SI', 'zeptohertz'),
+    'zJ': ('SI', 'zeptojoule'),
+    'zK': ('SI', 'zeptokelvin'),
+    'zN': ('SI', 'zeptonewton'),
+    'zPa': ('SI', 'zeptopascal'),
+    'zS': ('SI', 'zeptosiemens'),
+    'zT': ('SI', 'zeptotesla'),
+    'zV': ('SI', 'zeptovolt'),
+    'zW': ('SI', 'zeptowatt'),
+    'zWb': ('SI', 'zeptoweber'),
+    'zcd': ('SI', 'zeptocandela'),
+    'zeptoampere': ('SI', 'zeptoampere'),
+    'zeptobecquerel': ('SI', 'zeptobecquerel'),
+    'zeptocandela': ('SI', 'zeptocandela'),
+    'zeptocoulomb': ('SI', 'zeptocoulomb'),
+    'zeptofarad': ('SI', 'zeptofarad'),
+    'zeptogram': ('SI', 'zeptogram'),
+    'zeptogray': ('SI', 'zeptogray'),
+    'zeptohenry': ('SI', 'zeptohenry'),
+    'zeptohertz': ('SI', 'zeptohertz'),
+    'zeptojoule': ('SI', 'zeptojoule'),
+    'zeptokatal': ('SI', 'zeptokatal'),
+    'zeptokelvin': ('SI', 'zeptokelvin'),
+    'zeptolux': ('SI', 'zeptolux'),
+    'zeptometer': ('SI', 'zeptometer'),
+    'zeptomole': ('SI', 'zeptomole'),
+    'zeptonewton': ('SI', 'zeptonewton'),
+    'zeptoohm': ('SI', 'zeptoohm'),
+    'zeptopascal': ('SI', 'zeptopascal'),
+    'zeptosecond': ('SI', 'zeptosecond'),
+    'zeptosiemens': ('SI', 'zeptosiemens'),
+    'zeptotesla': ('SI', 'zeptotesla'),
+    'zeptovolt': ('SI', 'zeptovolt'),
+    'zeptowatt': ('SI', 'zeptowatt'),
+    'zeptoweber': ('SI', 'zeptoweber'),
+    'zettaampere': ('SI', 'zettaampere'),
+    'zettabecquerel': ('SI', 'zettabecquerel'),
+    'zettacandela': ('SI', 'zettacandela'),
+    'zettacoulomb': ('SI', 'zettacoulomb'),
+    'zettafarad': ('SI', 'zettafarad'),
+    'zettagram': ('SI', 'zettagram'),
+    'zettagray': ('SI', 'zettagray'),
+    'zettahenry': ('SI', 'zettahenry'),
+    'zettahertz': ('SI', 'zettahertz'),
+    'zettajoule': ('SI', 'zettajoule'),
+    'zettakatal': ('SI', 'zettakatal'),
+    'zettakelvin': ('SI', 'zettakelvin'),
+    'zettalux': ('SI', 'zettalux'),
+    'zettameter': ('SI', 'zettameter'),
+    'zettamole': ('SI', 'zettamole'),
+    'zettanewton': ('SI', 'zettanewton'),
+    'zettaohm': ('SI', 'zettaohm'),
+    'zettapascal': ('SI', 'zettapascal'),
+    'zettasecond': ('SI', 'zettasecond'),
+    'zettasiemens': ('SI', 'zettasiemens'),
+    'zettatesla': ('SI', 'zettatesla'),
+    'zettavolt': ('SI', 'zettavolt'),
+    'zettawatt': ('SI', 'zettawatt'),
+    'zettaweber': ('SI', 'zettaweber'),
+    'zg': ('SI', 'zeptogram'),
+    'zgray': ('SI', 'zeptogray'),
+    'zkat': ('SI', 'zeptokatal'),
+    'zlx': ('SI', 'zeptolux'),
+    'zm': ('SI', 'zeptometer'),
+    'zmol': ('SI', 'zeptomole'),
+    'zohm': ('SI', 'zeptoohm'),
+    'zs': ('SI', 'zeptosecond'),
+}
@@ -1,44 +1,12 @@
 from sympy import Add, Matrix, MatrixBase, Symbol, Rel, Expr
 import sympy.physics.units as u
 import sympy.physics.units.definitions.unit_definitions as unit_definitions
-from sympy.physics.units.quantities import Quantity, PhysicalConstant
+from sympy.physics.units.quantities import Quantity
 from sympy.physics.units.systems import SI
 from sympy.physics.units.unitsystem import UnitSystem
+from sympy_client.UnitAliases import UNIT_ALIASES
 from copy import copy
-
-# Maps an alias to its corresponding Quantity object.
-UNIT_ALIAS_MAP = {}
-
-__defined_units_quantities = { unit_name: getattr(unit_definitions, unit_name) for unit_name in dir(unit_definitions) if isinstance(getattr(unit_definitions, unit_name), Quantity) }
-
-def __add_unit_aliases(str_units: list[tuple[str, Quantity]]):
-    for k, u in str_units:
-        if k not in UNIT_ALIAS_MAP:
-            UNIT_ALIAS_MAP[k] = u
-
-# add SI units
-__add_unit_aliases(( (str(unit), unit) for unit in SI._units))
-__add_unit_aliases(( (str(unit.abbrev), unit) for unit in SI._units))
-
-# add units specified in the defined_units module
-__add_unit_aliases(((key, unit)
-                for key, unit in __defined_units_quantities.items()
-                if not isinstance(unit, PhysicalConstant)))
-
-__add_unit_aliases(((str(unit.abbrev), unit)
-                for unit in __defined_units_quantities.values()
-                if not isinstance(unit, PhysicalConstant)))
-
-__add_unit_aliases(((key, unit)
-                for key, unit in __defined_units_quantities.items()
-                if isinstance(unit, PhysicalConstant)))
-
-__add_unit_aliases(((str(unit.abbrev), unit)
-                for unit in __defined_units_quantities.values()
-                if isinstance(unit, PhysicalConstant)))
-
-# add LaTeX Math specific unit aliases.
-__add_unit_aliases([ ( 'min', u.minute ), ( 'sec', u.second ) ])
+from functools import lru_cache
 
 # attempt to automatically convert the units in the given sympy expression.
 # this convertion method prioritizes as few units as possible raised to the lowest power possible (or lowest root possible).
@@ -82,14 +50,32 @@ def auto_convert(sympy_expr, unit_system: UnitSystem = SI):
     return Add(*converted_expressions)
 
 # find sympy unit which has the given str representation.
+# the unit is only constructed the first time an alias is looked up, after which the same unit is returned for it.
 def str_to_unit(unit_str: str) -> Quantity | None:
     # attempt to replace the symbol with a corresponding unit.
-    if unit_str not in UNIT_ALIAS_MAP:
+    if unit_str not in UNIT_ALIASES:
         return None
     else:
-        unit = copy(UNIT_ALIAS_MAP[unit_str])
-        unit._latex_repr = unit_str
-        return unit
+        return _alias_to_unit(unit_str)
+
+# only aliases are memoized, so the cache is bounded by the size of the alias table, regardless of what strings are looked up.
+@lru_cache(maxsize=len(UNIT_ALIASES))
+def _alias_to_unit(unit_alias: str) -> Quantity:
+    unit = copy(resolve_unit(*UNIT_ALIASES[unit_alias]))
+    unit._latex_repr = unit_alias
+    return unit
+
+# get the Quantity at the given source in the UNIT_ALIASES table.
+def resolve_unit(unit_source: str, unit_name: str) -> Quantity:
+    if unit_source == 'SI':
+        return _get_si_units_by_name()[unit_name]
+    
+    return getattr(unit_definitions, unit_name)
+
+# prefixed units are only found in the SI unit system, so they are indexed by name the first time one is needed.
+@lru_cache(maxsize=1)
+def _get_si_units_by_name() -> dict[str, Quantity]:
+    return { str(unit): unit for unit in SI._units }
 
 
 # get the 'complexity' of a unit.
@@ -0,0 +1,33 @@
+import json
+
+#
+# The first solve, unit conversion or simplification in a process pays for lazily imported sympy modules and empty caches.
+# Workers therefore run a warmup script of canned messages in the background, see WorkerPool.start_warmup,
+# so the first real command is about as fast as any later one.
+#
+# A warmup script is a list of (handler_key, message) pairs, which are handled exactly as real messages would be,
+# except their results are discarded. A custom script can be loaded from a json file with load_warmup_messages.
+#
+
+# Exercises parsing, simplification, solving, solving in a domain, unit conversion and calculus,
+# with each message kept short, as a real request waits for the warmup message currently being handled.
+DEFAULT_WARMUP_MESSAGES: list[tuple[str, dict]] = [
+    ("eval", { "expression": r"\frac{x^2 - 1}{x + 1} + \sin(x)^2 + \cos(x)^2", "environment": {} }),
+    ("solve", { "expression": r"x^2 - 3 x + 2 = 0", "environment": {} }),
+    ("solve", { "expression": r"\sin(x) = \frac{1}{2}", "environment": { "domain": "Interval(0, 2 * pi)" } }),
+    ("convert-units", { "expression": r"7.2 {km} / {h}", "target_units": [ "m", "s" ], "environment": {} }),
+    ("eval", { "expression": r"5 {gee} \cdot (10 {minutes})^2", "environment": {} }),
+    ("eval", { "expression": r"\int_0^1 x^2 d x + \frac{d}{d x} \cos(x)", "environment": {} }),
+    ("evalf", { "expression": r"\sqrt{2} \cdot \pi", "environment": {} }),
+    ("factor", { "expression": r"x^3 - x", "environment": {} }),
+]
+
+# Load a warmup script from a json file, containing a list of [ handler_key, message ] pairs.
+def load_warmup_messages(warmup_file: str) -> list[tuple[str, dict]]:
+    with open(warmup_file, 'r', encoding='utf-8') as file:
+        warmup_messages = json.load(file)
+
+    if not isinstance(warmup_messages, list) or not all(isinstance(pair, list) and len(pair) == 2 and isinstance(pair[0], str) for pair in warmup_messages):
+        raise ValueError(f"Warmup file '{warmup_file}' must contain a list of [ handler_key, message ] pairs")
+
+    return [ (handler_key, message) for handler_key, message in warmup_messages ]
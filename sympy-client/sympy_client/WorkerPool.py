@@ -0,0 +1,396 @@
+from .command_handlers.CommandHandler import CommandHandler, handle_message
+from .EnvironmentSessions import EnvironmentSessions, SessionState, SessionSync
+from .HandlerRegistry import HandlerRegistry
+from .Metrics import process_stats
+
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import traceback
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Hashable
+
+# Raised when a handler raised an exception inside a worker process.
+# The message contains the formatted traceback from the worker.
+class WorkerError(Exception):
+    pass
+
+# Raised when a worker process died before it could reply, either because it was killed by WorkerPool.cancel, or because it crashed.
+class WorkerKilledError(Exception):
+    pass
+
+# How often, in seconds, an idle worker checks whether the warmup has been started.
+WARMUP_POLL_INTERVAL = 0.1
+
+# Sent to an idle worker instead of a message, which replies with its process stats.
+STATS_REQUEST = ('stats',)
+
+# Entry point of a worker process.
+# Registers the handlers of the given factory, reports their keys as a ready signal,
+# and then handles (handler_key, message, closed_session_ids, session_sync) tuples until the connection is closed.
+# Before a message is handled, the sessions closed since the previous message are closed in the worker,
+# and the session the message refers to, if any, is brought up to date by the session_sync, see EnvironmentSessions.
+# Each reply is a (status, payload) pair.
+#
+# A STATS_REQUEST is replied to with the process stats of the worker, which are only collected when asked for,
+# as they walk the caches of the worker, see Metrics.process_stats.
+#
+# Once warmup_started is set, the worker handles the warmup messages one at a time, whenever it is idle.
+# A message arriving during the warmup preempts it, the warmup is only resumed after replying to the message.
+def _worker_main(connection: Connection, handlers_factory: Callable[[], dict[str, CommandHandler | str]], warmup_messages: list[tuple[str, Any]], warmup_started):
+    threading.Thread(target=_exit_with_parent, daemon=True).start()
+
+    handlers = HandlerRegistry(handlers_factory())
+    sessions = EnvironmentSessions()
+    connection.send(handlers.keys())
+
+    pending_warmup_messages = list(reversed(warmup_messages))
+
+    while True:
+        while len(pending_warmup_messages) > 0 and not connection.poll(0 if warmup_started.is_set() else WARMUP_POLL_INTERVAL):
+            if warmup_started.is_set():
+                _run_warmup_message(handlers, *pending_warmup_messages.pop())
+
+        try:
+            request = connection.recv()
+        except EOFError:
+            break
+
+        if request == STATS_REQUEST:
+            connection.send(process_stats())
+            continue
+
+        handler_key, message, closed_session_ids, session_sync = request
+
+        try:
+            for session_id in closed_session_ids:
+                sessions.close(session_id)
+
+            if session_sync is not None:
+                sessions.apply_sync(session_sync)
+                message = sessions.resolve_message(message)
+
+            result_payload = handle_message(handlers.get_handler(handler_key), message, lambda partial_payload: connection.send(('partial', partial_payload)))
+            connection.send(('result', result_payload))
+        except Exception as e:
+            connection.send(('error', str(e) + "\n" + traceback.format_exc()))
+
+# Exit the worker process when the process which started it dies, e.g. if the client is killed, even if the worker is busy handling a message.
+def _exit_with_parent():
+    parent_process = multiprocessing.parent_process()
+
+    if parent_process is not None:
+        parent_process.join()
+        os._exit(1)
+
+# Handle a warmup message, discarding its result, a failing warmup message should not stop the worker.
+def _run_warmup_message(handlers: HandlerRegistry, handler_key: str, message: Any):
+    try:
+        if handler_key in handlers:
+            handle_message(handlers.get_handler(handler_key), message)
+    except Exception:
+        pass
+
+# A Worker wraps a single process which runs command handlers.
+# Contrary to a thread, the process can be killed at any point, which frees up the cpu time spent on a runaway handler.
+class Worker:
+    def __init__(self,
+                 context: multiprocessing.context.BaseContext,
+                 handlers_factory: Callable[[], dict[str, CommandHandler | str]],
+                 warmup_messages: list[tuple[str, Any]] = [],
+                 warmup_started = None
+                 ):
+        if warmup_started is None:
+            warmup_started = context.Event()
+
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(target=_worker_main, args=(child_connection, handlers_factory, warmup_messages, warmup_started), daemon=True)
+        self._process.start()
+        # close our copy of the child end, so the connection reports EOF if the process dies.
+        child_connection.close()
+
+        self._handler_keys: list[str] | None = None
+        self._ready_lock = threading.Lock()
+        self._killed = False
+        self.task_count = 0
+        # stats of the worker process, as of the last time they were collected, see collect_stats.
+        self.process_stats: dict | None = None
+        # the version of each session known by the worker process, and the sessions it knows which have since been closed.
+        self._session_versions: dict[str, int] = {}
+        self._closed_sessions: list[str] = []
+        self._sessions_lock = threading.Lock()
+
+    # Block until the worker has constructed its handlers, and return their keys.
+    def wait_ready(self) -> list[str]:
+        # the ready signal must only be received once, even if this is called from several threads.
+        with self._ready_lock:
+            if self._handler_keys is None:
+                self._handler_keys = self._receive()
+
+        return self._handler_keys
+
+    # Handle the message with the handler registered at handler_key in the worker process, and return its result payload.
+    # Partial payloads of streamed results are passed to send_partial as they are received.
+    # If the message refers to a session, session is its state, which the worker is brought up to date with first.
+    def run(self, handler_key: str, message: Any, send_partial: Callable[[dict], None] | None = None, session: SessionState | None = None) -> dict:
+        self.wait_ready()
+        self.task_count += 1
+
+        with self._sessions_lock:
+            closed_session_ids, self._closed_sessions = self._closed_sessions, []
+            session_sync: SessionSync | None = None
+
+            if session is not None:
+                session_sync = session.get_sync(self._session_versions.get(session.session_id))
+                self._session_versions[session.session_id] = session.version
+
+        self._send((handler_key, message, closed_session_ids, session_sync))
+
+        status, reply = self._receive()
+
+        while status == 'partial':
+            if send_partial is not None:
+                send_partial(reply)
+            status, reply = self._receive()
+
+        if status == 'error':
+            raise WorkerError(reply)
+
+        return reply
+
+    # Collect the stats of the worker process, which must not be running a message.
+    def collect_stats(self) -> dict:
+        self.wait_ready()
+        self._send(STATS_REQUEST)
+        self.process_stats = self._receive()
+
+        return self.process_stats
+
+    # Close the session in the worker process before its next message, if it knows the session.
+    def close_session(self, session_id: str):
+        with self._sessions_lock:
+            if self._session_versions.pop(session_id, None) is not None:
+                self._closed_sessions.append(session_id)
+
+    def kill(self):
+        self._killed = True
+        self._process.kill()
+
+    # Whether the worker can still be used for handling messages.
+    def is_usable(self) -> bool:
+        return not self._killed and self._process.is_alive()
+
+    # The process is killed before the connection is closed, so a thread waiting for a reply from it gets a WorkerKilledError.
+    def close(self):
+        self._killed = True
+        self._process.kill()
+        self._process.join()
+        self._connection.close()
+
+    # the worker may be killed by a cancel before the message is sent to it.
+    def _send(self, message: Any):
+        try:
+            self._connection.send(message)
+        except OSError as e:
+            raise WorkerKilledError("Worker process died before the message could be sent") from e
+
+    def _receive(self) -> Any:
+        try:
+            return self._connection.recv()
+        except (EOFError, OSError) as e:
+            raise WorkerKilledError("Worker process died before it could reply") from e
+
+# The WorkerPool distributes handler work across a fixed number of Worker processes.
+# A request running in the pool can be cancelled, which kills the worker running it,
+# and immediately spawns a replacement, so it is warm by the time the next request arrives.
+#
+# The handlers_factory is called in each worker, and once in the pool itself to learn the handler keys,
+# so it should register expensive handlers by path, see HandlerRegistry, rather than constructing them.
+#
+# Where available, workers are forked from a forkserver, which imports the given preload_modules once.
+# Every worker then starts with these modules already imported, instead of importing them itself.
+# If max_tasks_per_worker is given, workers are replaced after handling this many messages,
+# which releases any memory they have accumulated in caches.
+#
+# After start_warmup is called, every worker, including replacement workers, handles the given warmup_messages whenever it is idle, see _worker_main.
+# Real requests preempt the warmup, so they wait at most for the single warmup message currently being handled.
+class WorkerPool:
+    def __init__(self,
+                 handlers_factory: Callable[[], dict[str, CommandHandler | str]],
+                 worker_count: int = 1,
+                 max_tasks_per_worker: int | None = None,
+                 preload_modules: list[str] = [],
+                 context: multiprocessing.context.BaseContext | None = None,
+                 warmup_messages: list[tuple[str, Any]] = []
+                 ):
+        self._handlers_factory = handlers_factory
+        self._max_tasks_per_worker = max_tasks_per_worker
+        self._context = context if context is not None else WorkerPool._default_context(preload_modules)
+        self._warmup_messages = warmup_messages
+        self._warmup_started = self._context.Event()
+
+        self._idle_workers: queue.Queue[Worker] = queue.Queue()
+        # every worker in the pool, both idle and busy ones.
+        self._workers: set[Worker] = set()
+        self._busy_workers: dict[Hashable, Worker] = {}
+        # requests which have been submitted to run, but are still waiting for an idle worker.
+        self._queued_requests: set[Hashable] = set()
+        self._cancelled_requests: set[Hashable] = set()
+        self._requests_lock = threading.Lock()
+        self._is_shut_down = False
+
+        # the workers are started in the background, as starting the first one waits on the forkserver importing the preload modules.
+        self._startup_thread = threading.Thread(target=self._start_workers, args=(worker_count,), daemon=True)
+        self._startup_thread.start()
+
+        self._handler_keys = list(handlers_factory().keys())
+
+    # The keys of the handlers registered by the handlers factory.
+    @property
+    def handler_keys(self) -> list[str]:
+        return self._handler_keys
+
+    # Block until every worker in the pool has registered its handlers.
+    def wait_ready(self):
+        self._startup_thread.join()
+
+        with self._requests_lock:
+            workers = list(self._workers)
+
+        for worker in workers:
+            try:
+                worker.wait_ready()
+            except WorkerKilledError:
+                # the worker was cancelled while starting, its replacement is waited on by the next request instead.
+                pass
+
+    # Start handling the warmup messages in the background of every worker.
+    # This is separate from constructing the pool, so the warmup does not compete with the client for cpu time, while it is connecting.
+    def start_warmup(self):
+        self._warmup_started.set()
+
+    # Handle the given message on the first available worker, blocking until it replies.
+    # request_key identifies the request in calls to cancel, and session is the state of the session the message refers to, if any, see Worker.run.
+    # Raises WorkerKilledError if the request was cancelled, and WorkerError if the handler raised an exception.
+    def run(self, request_key: Hashable, handler_key: str, message: Any, send_partial: Callable[[dict], None] | None = None, session: SessionState | None = None) -> dict:
+        with self._requests_lock:
+            self._queued_requests.add(request_key)
+
+        worker = self._idle_workers.get()
+
+        with self._requests_lock:
+            self._queued_requests.remove(request_key)
+
+            if request_key in self._cancelled_requests:
+                self._cancelled_requests.remove(request_key)
+                self._idle_workers.put(worker)
+                raise WorkerKilledError("Request was cancelled before it started")
+
+            self._busy_workers[request_key] = worker
+
+        try:
+            return worker.run(handler_key, message, send_partial, session)
+        finally:
+            with self._requests_lock:
+                del self._busy_workers[request_key]
+
+            # the worker may have been killed right after replying, so check its state even if it succeeded.
+            if self._is_shut_down:
+                self._close_worker(worker)
+            else:
+                if not worker.is_usable() or self._max_tasks_per_worker is not None and worker.task_count >= self._max_tasks_per_worker:
+                    self._close_worker(worker)
+                    worker = self._spawn_worker()
+
+                self._idle_workers.put(worker)
+
+    # Kill the worker currently running the request identified by request_key,
+    # or prevent it from starting, if it is still waiting for an idle worker.
+    # Returns whether the request was found.
+    def cancel(self, request_key: Hashable) -> bool:
+        with self._requests_lock:
+            if request_key in self._busy_workers:
+                self._busy_workers[request_key].kill()
+                return True
+
+            if request_key in self._queued_requests:
+                self._cancelled_requests.add(request_key)
+                return True
+
+            return False
+
+    # Close the given session in every worker process knowing it, which they do before handling their next message.
+    def close_session(self, session_id: str):
+        with self._requests_lock:
+            workers = list(self._workers)
+
+        for worker in workers:
+            worker.close_session(session_id)
+
+    # Stats of each worker process in the pool.
+    # The stats of idle workers are collected now, busy workers report the stats of the last time they were collected, if any.
+    def worker_stats(self) -> list[dict]:
+        idle_workers = []
+
+        # the idle workers are taken from the pool while collecting their stats, so no message is sent to them meanwhile.
+        try:
+            while True:
+                idle_workers.append(self._idle_workers.get_nowait())
+        except queue.Empty:
+            pass
+
+        try:
+            for worker in idle_workers:
+                try:
+                    worker.collect_stats()
+                except WorkerKilledError:
+                    pass
+        finally:
+            for worker in idle_workers:
+                self._idle_workers.put(worker)
+
+        with self._requests_lock:
+            return [ worker.process_stats for worker in self._workers if worker.process_stats is not None ]
+
+    # Close every worker, including busy ones, whose requests fail with a WorkerKilledError.
+    def shutdown(self):
+        self._startup_thread.join()
+
+        with self._requests_lock:
+            self._is_shut_down = True
+            workers = list(self._workers)
+
+        for worker in workers:
+            self._close_worker(worker)
+
+    def _start_workers(self, worker_count: int):
+        for _ in range(worker_count):
+            self._idle_workers.put(self._spawn_worker())
+
+    def _spawn_worker(self) -> Worker:
+        worker = Worker(self._context, self._handlers_factory, self._warmup_messages, self._warmup_started)
+
+        with self._requests_lock:
+            self._workers.add(worker)
+
+        return worker
+
+    def _close_worker(self, worker: Worker):
+        with self._requests_lock:
+            self._workers.discard(worker)
+
+        worker.close()
+
+    # Use a forkserver if the platform supports it, otherwise fall back to spawning workers from scratch.
+    # Frozen executables can only start processes through spawn, which is handled by multiprocessing.freeze_support.
+    @staticmethod
+    def _default_context(preload_modules: list[str]) -> multiprocessing.context.BaseContext:
+        if getattr(sys, 'frozen', False) or 'forkserver' not in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context('spawn')
+
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(preload_modules)
+
+        return context
@@ -0,0 +1,13 @@
+#
+# This module is preloaded by the forkserver of the WorkerPool started by SympyClient.py.
+# Everything imported and constructed here is done once in the forkserver,
+# and inherited by every worker forked from it, instead of being redone by each worker.
+#
+import sympy
+import sympy.physics.units
+import sympy.solvers.solveset
+import sympy_client.command_handlers.EvalHandlerBase
+import sympy_client.command_handlers.SolveHandler
+from sympy_client import HandlerFactories
+
+HandlerFactories.latex_parser()
@@ -0,0 +1,67 @@
+from typing import Iterator, NotRequired, TypedDict, override
+
+from sympy_client.grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
+from sympy_client.grammar.SympyParser import SympyParser
+from sympy_client.LmatEnvironment import LmatEnvironment
+
+from .CommandHandler import CommandHandler, CommandResult, ErrorResult, StreamedResult
+from .EvalHandlerBase import EvalHandlerBase
+
+
+class BatchItem(TypedDict):
+    mode: str
+    expression: str
+    target_units: NotRequired[list[str]]
+
+class BatchMessage(TypedDict):
+    environment: LmatEnvironment
+    session_id: NotRequired[str]
+    items: list[BatchItem]
+
+class BatchResult(StreamedResult):
+
+    def __init__(self, item_payloads: Iterator[dict], item_count: int):
+        super().__init__()
+        self.item_payloads = item_payloads
+        self.item_count = item_count
+
+    @override
+    def stream(self) -> Iterator[dict]:
+        return self.item_payloads
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(dict(item_count=self.item_count))
+
+# Evaluates a list of expressions in the same environment, using the evaluate handler registered for each items mode.
+# The definitions store is only constructed once, and shared between all items.
+# Each item result is streamed back as soon as it is evaluated, with its index in the items list in its metadata.
+# An item failing to evaluate results in an error result for that item, the remaining items are still evaluated.
+class BatchHandler(CommandHandler):
+    message_type = BatchMessage
+
+    def __init__(self, parser: SympyParser, eval_handlers: dict[str, EvalHandlerBase], definitions_stores: LmatEnvDefStoreCache | None = None):
+        super().__init__()
+        self._parser = parser
+        self._definitions_stores = definitions_stores if definitions_stores is not None else LmatEnvDefStoreCache(parser, max_size=0)
+        self._eval_handlers = eval_handlers
+
+    @override
+    def handle(self, message: BatchMessage) -> BatchResult:
+        return BatchResult(self._evaluate_items(message), len(message['items']))
+
+    def _evaluate_items(self, message: BatchMessage) -> Iterator[dict]:
+        with self._definitions_stores.definitions_store(message['environment'], message.get('session_id')) as definitions_store:
+            for index, item in enumerate(message['items']):
+                try:
+                    if item['mode'] not in self._eval_handlers:
+                        raise ValueError(f"Unknown batch mode: {item['mode']}")
+
+                    item_message = dict(item, environment=message['environment'])
+                    payload = self._eval_handlers[item['mode']].handle_in_store(item_message, definitions_store).getPayload()
+                except Exception as e:
+                    payload = ErrorResult(str(e)).getPayload()
+
+                payload['metadata'] = dict(payload['metadata'], index=index)
+
+                yield payload
@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING, Any, override
+
+from .CommandHandler import CommandHandler, CommandResult
+
+if TYPE_CHECKING:
+    from sympy_client.ResultCache import ResultCache
+
+
+class CacheClearResult(CommandResult):
+
+    def __init__(self, cleared_count: int):
+        super().__init__()
+        self.cleared_count = cleared_count
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(dict(cleared=self.cleared_count))
+
+# Deletes every result stored in the persistent result cache of the client, if it has one, see ResultCache.
+class CacheClearHandler(CommandHandler):
+
+    def __init__(self, result_cache: 'ResultCache | None' = None):
+        super().__init__()
+        self._result_cache = result_cache
+
+    @override
+    def handle(self, message: Any) -> CacheClearResult:
+        if self._result_cache is None:
+            return CacheClearResult(0)
+
+        return CacheClearResult(self._result_cache.clear())
@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, override
+from contextlib import nullcontext
+from typing import Any, Callable, Iterator, override
+
+from sympy_client import MessageCodec
+from sympy_client.PhaseTimer import PhaseTimer, timed_phase
 
 # The CommandResult represents an arbitrary result returned by a CommandHandler.
 # It contains the result data and a method for converting this data into a message payload.
@@ -14,6 +18,15 @@ class CommandResult(ABC):
     def result(result, metadata: dict = None, status: str = 'success') -> dict:
         return dict(result=result, metadata=metadata or {}, status=status)
 
+# A StreamedResult is a result which is produced in parts.
+# Each part is sent to the plugin as a 'partial' message as soon as it is available,
+# followed by the payload of the result itself, once all parts have been sent.
+class StreamedResult(CommandResult):
+
+    @abstractmethod
+    def stream(self) -> Iterator[dict]:
+        pass
+
 class ErrorResult(CommandResult):
     
     def __init__(self, err_msg: str):
@@ -24,10 +37,56 @@ class ErrorResult(CommandResult):
     def getPayload(self) -> dict:
         return CommandResult.result(dict(message=self.err_msg), status='error')
 
+# Returned in place of a handlers result, if its request did not finish before its deadline.
+class TimeoutResult(CommandResult):
+
+    def __init__(self, deadline_ms: float):
+        super().__init__()
+        self.deadline_ms = deadline_ms
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(dict(message=f"Request did not finish within {self.deadline_ms} ms"), status='timeout')
+
+# Returned in place of a handlers result, if its request was cancelled by a cancel message.
+class CancelledResult(CommandResult):
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(dict(message="Request was cancelled"), status='cancelled')
+
 # CommandHandler should be inherited by objects wanting to implement a handler.
 # The handle method returns a CommandResult for the implemented command.
 class CommandHandler(ABC):
+    # TypedDict describing the messages accepted by this handler.
+    # If set, messages are validated against it before they are handled.
+    message_type: type | None = None
+
     @abstractmethod
     def handle(self, message: Any) -> CommandResult:
         pass
 
+# Validate the message against the message type of the handler, handle it, and produce the payload of its result.
+# If the result is a StreamedResult, each of its parts is passed to send_partial, before its payload is produced.
+# If the message has a truthy 'timing' key, the time spent in each phase of handling it is added to the 'timing' key of the result metadata.
+def handle_message(handler: CommandHandler, message: Any, send_partial: Callable[[dict], None] | None = None) -> dict:
+    if handler.message_type is not None:
+        MessageCodec.validate(message, handler.message_type)
+
+    timer = PhaseTimer() if isinstance(message, dict) and message.get('timing', False) else None
+
+    with timer.activate() if timer is not None else nullcontext():
+        result = handler.handle(message)
+
+        if isinstance(result, StreamedResult):
+            for partial_payload in result.stream():
+                if send_partial is not None:
+                    send_partial(partial_payload)
+
+        with timed_phase('print'):
+            payload = result.getPayload()
+
+    if timer is not None:
+        payload['metadata'] = dict(payload['metadata'], timing=timer.get_metadata())
+
+    return payload
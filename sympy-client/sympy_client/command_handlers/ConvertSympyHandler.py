@@ -1,7 +1,6 @@
-from typing import TypedDict, override
+from typing import NotRequired, TypedDict, override
 
-from sympy import *
-from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy_client.grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
 from sympy_client.grammar.SympyParser import SympyParser
 from sympy_client.LmatEnvironment import LmatEnvironment
 
@@ -21,14 +20,17 @@ class ConvertSympyResult(CommandResult):
 class ConvertSympyModeMessage(TypedDict):
     expression: str
     environment: LmatEnvironment
+    session_id: NotRequired[str]
 
 class ConvertSympyHandler(CommandHandler):
-    def __init__(self, parser: SympyParser):
+    message_type = ConvertSympyModeMessage
+
+    def __init__(self, parser: SympyParser, definitions_stores: LmatEnvDefStoreCache | None = None):
         super().__init__()
         self._parser = parser
+        self._definitions_stores = definitions_stores if definitions_stores is not None else LmatEnvDefStoreCache(parser, max_size=0)
         
     @override
     def handle(self, message: ConvertSympyModeMessage):
-        return ConvertSympyResult(
-            self._parser.parse(message['expression'], LmatEnvDefStore(self._parser, message['environment']))
-        )
+        with self._definitions_stores.definitions_store(message['environment'], message.get('session_id')) as definitions_store:
+            return ConvertSympyResult(self._parser.parse(message['expression'], definitions_store))
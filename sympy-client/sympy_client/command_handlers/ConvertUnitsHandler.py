@@ -1,20 +1,29 @@
 from sympy.physics.units import convert_to
+from sympy.physics.units.systems import SI
+from sympy.physics.units.unitsystem import UnitSystem
 import sympy_client.UnitsUtils as UnitsUtils
-from .EvalHandlerBase import EvaluateMessage, EvalHandlerBase, EvalResult
+from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy_client.grammar.transformers.FunctionsTransformer import doit_deferred
+from .EvalHandlerBase import EvaluateMessage, EvalHandlerBase
 
-from sympy import *
+from typing import NotRequired
+
+from sympy import Expr
 
 class ConvertMessage(EvaluateMessage):
-    target_units: list[str]
+    target_units: NotRequired[list[str]]
 
 # Tries to convert the sympy expressions units to the provided units in message.target_units.
 class ConvertUnitsHandler(EvalHandlerBase):
+    message_type = ConvertMessage
     
-    def handle(self, message: ConvertMessage) -> EvalResult:
-        message['environment']['unit_system'] = "SI"
-        return super().handle(message)
+    # the result is given in the target units, which are SI units, regardless of the unit system of the environment.
+    def get_unit_system(self, _message: ConvertMessage, _definitions_store: LmatEnvDefStore) -> UnitSystem:
+        return SI
     
     def evaluate(self, sympy_expr: Expr, message: ConvertMessage):
+        sympy_expr = doit_deferred(sympy_expr)
+        
         if 'target_units' not in message:
             return sympy_expr
         
@@ -0,0 +1,74 @@
+from typing import TypedDict, override
+
+from sympy_client.EnvironmentSessions import (EnvironmentSessions,
+                                              UnknownSessionError)
+from sympy_client.LmatEnvironment import LmatEnvironment, LmatEnvironmentDelta
+
+from .CommandHandler import CommandHandler, CommandResult, ErrorResult
+
+
+class EnvOpenMessage(TypedDict):
+    session_id: str
+    environment: LmatEnvironment
+
+# The delta is given in the rest of the message.
+class EnvUpdateMessage(LmatEnvironmentDelta):
+    session_id: str
+
+class EnvCloseMessage(TypedDict):
+    session_id: str
+
+class SessionResult(CommandResult):
+
+    def __init__(self, session_id: str, is_open: bool):
+        super().__init__()
+        self.session_id = session_id
+        self.is_open = is_open
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(dict(session_id=self.session_id, open=self.is_open))
+
+# Opens a session with the environment of the message, which later messages can refer to by its session_id, see EnvironmentSessions.
+class EnvOpenHandler(CommandHandler):
+    message_type = EnvOpenMessage
+
+    def __init__(self, sessions: EnvironmentSessions):
+        super().__init__()
+        self._sessions = sessions
+
+    @override
+    def handle(self, message: EnvOpenMessage) -> SessionResult:
+        self._sessions.open(message['session_id'], message['environment'])
+        return SessionResult(message['session_id'], True)
+
+# Changes the environment of a session by the delta given in the rest of the message, see LmatEnvironmentDelta.
+class EnvUpdateHandler(CommandHandler):
+    message_type = EnvUpdateMessage
+
+    def __init__(self, sessions: EnvironmentSessions):
+        super().__init__()
+        self._sessions = sessions
+
+    @override
+    def handle(self, message: EnvUpdateMessage) -> SessionResult | ErrorResult:
+        delta: LmatEnvironmentDelta = { key: value for key, value in message.items() if key != 'session_id' }
+
+        try:
+            self._sessions.update(message['session_id'], delta)
+        except UnknownSessionError as e:
+            return ErrorResult(str(e))
+
+        return SessionResult(message['session_id'], True)
+
+class EnvCloseHandler(CommandHandler):
+    message_type = EnvCloseMessage
+
+    def __init__(self, sessions: EnvironmentSessions):
+        super().__init__()
+        self._sessions = sessions
+
+    @override
+    def handle(self, message: EnvCloseMessage) -> SessionResult:
+        self._sessions.close(message['session_id'])
+        return SessionResult(message['session_id'], False)
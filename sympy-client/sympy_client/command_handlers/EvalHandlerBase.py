@@ -1,16 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import TypedDict, override
+from typing import NotRequired, TypedDict, override
 
 import sympy_client.UnitsUtils as UnitsUtils
-from sympy import *
+from sympy import Expr
 from sympy.core.operations import AssocOp, LatticeOp
 from sympy.core.relational import Relational
 from sympy.physics.units.unitsystem import UnitSystem
 from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy_client.grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
 from sympy_client.grammar.SympyParser import SympyParser
 from sympy_client.grammar.SystemOfExpr import SystemOfExpr
 from sympy_client.LmatEnvironment import LmatEnvironment
 from sympy_client.LmatLatexPrinter import lmat_latex
+from sympy_client.PhaseTimer import timed_phase
+from sympy_client.SimplifyCache import SimplifyCache
 
 from .CommandHandler import CommandHandler, CommandResult
 
@@ -36,12 +39,19 @@ class EvalResult(CommandResult, ABC):
 class EvaluateMessage(TypedDict):
     expression: str
     environment: LmatEnvironment
+    # set if the environment is the environment of a session, see EnvironmentSessions.
+    session_id: NotRequired[str]
 
 class EvalHandlerBase(CommandHandler, ABC):
+    message_type = EvaluateMessage
     
-    def __init__(self, parser: SympyParser):
+    # definitions_stores and simplified_exprs are the caches of definition stores and simplified expressions shared between the handlers,
+    # if no cache is given, nothing is reused.
+    def __init__(self, parser: SympyParser, definitions_stores: LmatEnvDefStoreCache | None = None, simplified_exprs: SimplifyCache | None = None):
         super().__init__()
         self._parser = parser
+        self._definitions_stores = definitions_stores if definitions_stores is not None else LmatEnvDefStoreCache(parser, max_size=0)
+        self._simplified_exprs = simplified_exprs if simplified_exprs is not None else SimplifyCache(max_entries=0)
     
     @abstractmethod
     def evaluate(self, sympy_expr: Expr, message: EvaluateMessage) -> Expr:
@@ -49,7 +59,12 @@ class EvalHandlerBase(CommandHandler, ABC):
 
     @override
     def handle(self, message: EvaluateMessage) -> EvalResult:
-        definitions_store = LmatEnvDefStore(self._parser, message['environment'])
+        with self._definitions_stores.definitions_store(message['environment'], message.get('session_id')) as definitions_store:
+            return self.handle_in_store(message, definitions_store)
+
+    # Handle the message using an already constructed definitions store for its environment,
+    # this allows multiple messages in the same environment to share the work of constructing the store.
+    def handle_in_store(self, message: EvaluateMessage, definitions_store: LmatEnvDefStore) -> EvalResult:
         sympy_expr = self._parser.parse(message['expression'], definitions_store)
         expr_lines = None
         
@@ -58,7 +73,8 @@ class EvalHandlerBase(CommandHandler, ABC):
             # for system of expressions, take the last one
             if isinstance(sympy_expr, SystemOfExpr):
                 expr_lines = (sympy_expr.get_location(-1).line, sympy_expr.get_location(-1).end_line)
-                sympy_expr = sympy_expr.get_expr(-1)
+                # only the right hand side is evaluated, so the rest of the system is never transformed.
+                sympy_expr = sympy_expr.get_rhs(-1)
             # for equalities, take the right hand side.
             if isinstance(sympy_expr, Relational):
                 sympy_expr = sympy_expr.rhs
@@ -66,14 +82,19 @@ class EvalHandlerBase(CommandHandler, ABC):
             elif isinstance(sympy_expr, LatticeOp):
                 sympy_expr = AssocOp.make_args(sympy_expr)[-1]
 
-        sympy_expr = self.evaluate(sympy_expr, message)
-        
-        unit_system = message['environment'].get('unit_system', None)
+        with timed_phase('evaluate'):
+            sympy_expr = self.evaluate(sympy_expr, message)
         
-        if unit_system is not None:
-            sympy_expr = UnitsUtils.auto_convert(sympy_expr, UnitSystem.get_unit_system(unit_system))
-        else:
-            sympy_expr = UnitsUtils.auto_convert(sympy_expr)
+        with timed_phase('convert_units'):
+            sympy_expr = UnitsUtils.auto_convert(sympy_expr, self.get_unit_system(message, definitions_store))
             
   
         return EvalResult(sympy_expr, expr_lines)
+    
+    # simplify(sympy_expr.doit()), reusing the result of any handler which simplified the same expression before.
+    def simplify(self, sympy_expr: Expr) -> Expr:
+        return self._simplified_exprs.simplify(sympy_expr)
+    
+    # The unit system the result of the given message is converted to.
+    def get_unit_system(self, _message: EvaluateMessage, definitions_store: LmatEnvDefStore) -> UnitSystem:
+        return definitions_store.unit_system
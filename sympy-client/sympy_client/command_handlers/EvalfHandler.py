@@ -1,13 +1,15 @@
 from typing import Any, override
 from .EvalHandlerBase import EvalHandlerBase, EvaluateMessage
+from sympy_client.grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
 from sympy_client.grammar.SympyParser import SympyParser
+from sympy_client.grammar.transformers.FunctionsTransformer import doit_deferred
 
-from sympy import *
+from sympy import Expr
 
 class EvalfHandler(EvalHandlerBase):
-    def __init__(self, parser: SympyParser):
-        super().__init__(parser)
+    def __init__(self, parser: SympyParser, definitions_stores: LmatEnvDefStoreCache | None = None):
+        super().__init__(parser, definitions_stores)
 
     @override
     def evaluate(self, sympy_expr: Expr, _message: EvaluateMessage) -> Expr:  
-        return sympy_expr.evalf()
\ No newline at end of file
+        return doit_deferred(sympy_expr).evalf()
\ No newline at end of file
@@ -1,13 +1,15 @@
 from typing import Any, override
 from .EvalHandlerBase import EvalHandlerBase, EvaluateMessage
+from sympy_client.grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
 from sympy_client.grammar.SympyParser import SympyParser
+from sympy_client.SimplifyCache import SimplifyCache
 
-from sympy import *
+from sympy import Expr, factor
 
 class FactorHandler(EvalHandlerBase):
-    def __init__(self, parser: SympyParser):
-        super().__init__(parser)
+    def __init__(self, parser: SympyParser, definitions_stores: LmatEnvDefStoreCache | None = None, simplified_exprs: SimplifyCache | None = None):
+        super().__init__(parser, definitions_stores, simplified_exprs)
 
     @override
     def evaluate(self, sympy_expr: Expr, _message: EvaluateMessage) -> Expr:
-        return factor(simplify(sympy_expr.doit()))
\ No newline at end of file
+        return factor(self.simplify(sympy_expr))
\ No newline at end of file
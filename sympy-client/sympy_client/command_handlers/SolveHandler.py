@@ -1,21 +1,25 @@
-from typing import Any, TypedDict, override
+from typing import Any, NotRequired, TypedDict, override
 
-from sympy import *
+from sympy import FiniteSet, linsolve, nonlinsolve, simplify, solveset
 from sympy.solvers.solveset import NonlinearError
 from sympy_client import UnitsUtils
 from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy_client.grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
 from sympy_client.grammar.SympyParser import SympyParser
 from sympy_client.grammar.SystemOfExpr import SystemOfExpr
+from sympy_client.grammar.transformers.FunctionsTransformer import doit_deferred
 from sympy_client.LmatEnvironment import LmatEnvironment
 from sympy_client.LmatLatexPrinter import lmat_latex
+from sympy_client.PhaseTimer import timed_phase
 
 from .CommandHandler import *
 
 
 class SolveModeMessage(TypedDict):
     expression: str
-    symbol: str | None
+    symbols: NotRequired[list[str]]
     environment: LmatEnvironment
+    session_id: NotRequired[str]
 
 class MultivariateResult(CommandResult):
     
@@ -68,16 +72,20 @@ class SolveResult(CommandResult):
 # along with a list of possible symbols to solve for in its symbols key.
 # if successfull its sends a message with status solved, and the result in the result key.
 class SolveHandler(CommandHandler):
+    message_type = SolveModeMessage
     
-    def __init__(self, parser: SympyParser):
+    def __init__(self, parser: SympyParser, definitions_stores: LmatEnvDefStoreCache | None = None):
         super().__init__()
         self._parser = parser
+        self._definitions_stores = definitions_stores if definitions_stores is not None else LmatEnvDefStoreCache(parser, max_size=0)
 
     @override
     def handle(self, message: SolveModeMessage) -> SolveResult | MultivariateResult | ErrorResult:
-        equations = self._parser.parse(message['expression'],
-                                         LmatEnvDefStore(self._parser, message['environment'])
-                                         )
+        with self._definitions_stores.definitions_store(message['environment'], message.get('session_id')) as definitions_store:
+            return self.handle_in_store(message, definitions_store)
+
+    def handle_in_store(self, message: SolveModeMessage, definitions_store: LmatEnvDefStore) -> SolveResult | MultivariateResult | ErrorResult:
+        equations = self._parser.parse(message['expression'], definitions_store)
 
         # position information is not needed here,
         # so extract the equations into a tuple, which sympy can work with.
@@ -85,6 +93,9 @@ class SolveHandler(CommandHandler):
             equations = equations.get_all_expr()
         else:
             equations = (equations,)
+        
+        with timed_phase('evaluate'):
+            equations = tuple(doit_deferred(equation) for equation in equations)
 
         # get a list of free symbols, by combining all the equations individual free symbols.
         free_symbols = set()
@@ -97,10 +108,7 @@ class SolveHandler(CommandHandler):
 
         free_symbols = sorted(list(free_symbols), key=str)
 
-        domain = S.Complexes
-        
-        if 'domain' in message['environment'] and message['environment']['domain'].strip() != "":
-            domain = sympify(message['environment']['domain'])
+        domain = definitions_store.domain
 
         # determine what symbols to solve for
         if 'symbols' not in message and len(free_symbols) > len(equations):
@@ -125,27 +133,21 @@ class SolveHandler(CommandHandler):
         # TODO: is there another way to do this?
         # it is sortof a mess having to distinguish between strictly 1 equation and multiple equations.
         
-        if len(equations) == 1 and len(symbols) == 1: # these two should always have equal lenth.
-            solution_set = solveset(equations[0], symbols[0], domain=domain)
-        else:
-            try:
-                solution_set = linsolve(equations, symbols)
-            except NonlinearError:
-                solution_set = nonlinsolve(equations, symbols)
-        
-        unit_system = message['environment'].get('unit_system', None)
+        with timed_phase('evaluate'):
+            if len(equations) == 1 and len(symbols) == 1: # these two should always have equal lenth.
+                solution_set = solveset(equations[0], symbols[0], domain=domain)
+            else:
+                try:
+                    solution_set = linsolve(equations, symbols)
+                except NonlinearError:
+                    solution_set = nonlinsolve(equations, symbols)
         
         # if there is a finite number of solutions, go through each solution, simplify it, and convert units in it.
         if isinstance(solution_set, FiniteSet):
-            if unit_system is not None:
-                solution_set = FiniteSet(*(
-                    UnitsUtils.auto_convert(simplify(sol.doit()), unit_system)
-                    for sol in solution_set.args)
-                    )
-            else:
-                solution_set = FiniteSet(*(
-                    UnitsUtils.auto_convert(simplify(sol.doit()))
-                    for sol in solution_set.args)
-                    )
+            with timed_phase('evaluate'):
+                solutions = [ simplify(sol.doit()) for sol in solution_set.args ]
+
+            with timed_phase('convert_units'):
+                solution_set = FiniteSet(*(UnitsUtils.auto_convert(sol, definitions_store.unit_system) for sol in solutions))
         
         return SolveResult(solution_set, symbols)
@@ -0,0 +1,36 @@
+from typing import Any, override
+
+from sympy_client.Metrics import MetricsRegistry, process_stats
+from sympy_client.WorkerPool import WorkerPool
+
+from .CommandHandler import CommandHandler, CommandResult
+
+
+class StatsResult(CommandResult):
+
+    def __init__(self, handler_stats: dict[str, dict[str, Any]], process_stats: list[dict[str, Any]]):
+        super().__init__()
+        self.handler_stats = handler_stats
+        self.process_stats = process_stats
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(dict(handlers=self.handler_stats, processes=self.process_stats))
+
+# Reports the performance of the client, that is the request counts, error counts and latency percentiles of each handler key,
+# and the memory and cache usage of the client process, and of each worker process if it has a worker pool.
+class StatsHandler(CommandHandler):
+
+    def __init__(self, metrics: MetricsRegistry, worker_pool: WorkerPool | None = None):
+        super().__init__()
+        self._metrics = metrics
+        self._worker_pool = worker_pool
+
+    @override
+    def handle(self, message: Any) -> StatsResult:
+        processes = [ dict(process_stats(), role='client') ]
+
+        if self._worker_pool is not None:
+            processes.extend(dict(worker_stats, role='worker') for worker_stats in self._worker_pool.worker_stats())
+
+        return StatsResult(self._metrics.get_stats(), processes)
@@ -1,9 +1,10 @@
-from typing import TypedDict, override
+from typing import NotRequired, TypedDict, override
 
-from sympy import *
-from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy import FiniteSet, Interval, S, Set, Symbol, oo
+from sympy_client.grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
 from sympy_client.grammar.SympyParser import SympyParser
 from sympy_client.LmatEnvironment import LmatEnvironment
+from sympy_client.PhaseTimer import timed_phase
 
 from .CommandHandler import *
 
@@ -55,33 +56,38 @@ class SymbolSetResult(CommandResult):
 
 class SymbolSetModeMessage(TypedDict):
     environment: LmatEnvironment
+    session_id: NotRequired[str]
 
 class SymbolSetHandler(CommandHandler):
+    message_type = SymbolSetModeMessage
     
-    def __init__(self, parser: SympyParser):
+    def __init__(self, parser: SympyParser, definitions_stores: LmatEnvDefStoreCache | None = None):
         super().__init__()
         self._parser = parser
+        self._definitions_stores = definitions_stores if definitions_stores is not None else LmatEnvDefStoreCache(parser, max_size=0)
     
     def handle(self, message: SymbolSetModeMessage) -> SymbolSetResult:
         environment: LmatEnvironment = message['environment']
-        definition_store = LmatEnvDefStore(self._parser, environment)
+        
+        with self._definitions_stores.definitions_store(environment, message.get('session_id')) as definition_store:
+            sympy_symbols = { symbol: definition_store.deserialize_symbol(symbol) for symbol in environment.get('symbols', {}) }
     
         set_symbols = {set: [] for set in SETS}
 
         # loop over sets and figure out which symbol belongs to which sets.        
-        for symbol in environment.get('symbols', {}):
-            sympy_symbol = definition_store.deserialize_symbol(symbol)
-            
-            smallest_containing_set = None
-            
-            for set in SETS:
+        with timed_phase('evaluate'):
+            for symbol, sympy_symbol in sympy_symbols.items():
                 
-                set_contains_symbol = set.contains(sympy_symbol)
+                smallest_containing_set = None
                 
-                if set_contains_symbol == True:
-                    smallest_containing_set = set
+                for set in SETS:
+                    
+                    set_contains_symbol = set.contains(sympy_symbol)
+                    
+                    if set_contains_symbol == True:
+                        smallest_containing_set = set
 
-            if smallest_containing_set is not None:
-                set_symbols[smallest_containing_set].append(symbol)
+                if smallest_containing_set is not None:
+                    set_symbols[smallest_containing_set].append(symbol)
         
         return SymbolSetResult(set_symbols)
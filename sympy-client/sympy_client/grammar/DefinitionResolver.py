@@ -0,0 +1,86 @@
+from typing import Any, Callable, Hashable
+
+# Raised when a definition depends on itself, e.g. through the variables a = b + 1 and b = a - 1.
+class CyclicDefinitionError(RuntimeError):
+    def __init__(self, cycle: list[Hashable]):
+        super().__init__(f"Cyclic definition: {' -> '.join(str(key) for key in cycle)}")
+        self.cycle = cycle
+
+# The DefinitionResolver resolves the definitions of a definitions store, e.g. its variables and function bodies,
+# at most once each, and records the dependency graph between them while doing so.
+#
+# A definition depends on every definition resolved, or looked up with add_dependency, while it is being resolved.
+# Definitions are therefore resolved depth first, that is in topological order of the dependency graph,
+# and a definition depending on a definition which is still being resolved is a cycle.
+#
+# Lookups of names which are not defined are also recorded as dependencies,
+# so defining them later invalidates the definitions which used them as plain symbols.
+class DefinitionResolver:
+    def __init__(self):
+        self._values: dict[Hashable, Any] = {}
+        self._dependencies: dict[Hashable, set[Hashable]] = {}
+        self._dependents: dict[Hashable, set[Hashable]] = {}
+        # the definitions currently being resolved, each depending on the next.
+        self._resolving: list[Hashable] = []
+
+    # Get the resolved value of the definition with the given key, resolving it with resolve_func if it is not already resolved.
+    def resolve(self, key: Hashable, resolve_func: Callable[[], Any]) -> Any:
+        self.add_dependency(key)
+
+        if key in self._values:
+            return self._values[key]
+
+        if key in self._resolving:
+            raise CyclicDefinitionError([ *self._resolving[self._resolving.index(key):], key ])
+
+        self._resolving.append(key)
+
+        try:
+            value = resolve_func()
+        finally:
+            self._resolving.pop()
+
+        self._values[key] = value
+
+        return value
+
+    # Record that the definition currently being resolved, if any, depends on the given key.
+    def add_dependency(self, key: Hashable):
+        if len(self._resolving) == 0:
+            return
+
+        dependent = self._resolving[-1]
+
+        self._dependencies.setdefault(dependent, set()).add(key)
+        self._dependents.setdefault(key, set()).add(dependent)
+
+    # Forget the resolved value of the given key, and of every definition depending on it, directly or indirectly.
+    # Returns the keys of the definitions which were invalidated, not including the given key.
+    def invalidate(self, key: Hashable) -> set[Hashable]:
+        invalidated = set()
+        pending = [ key ]
+
+        while len(pending) > 0:
+            current = pending.pop()
+
+            self._values.pop(current, None)
+
+            # the dependencies of a definition are recorded again when it is resolved again.
+            for dependency in self._dependencies.pop(current, set()):
+                self._dependents.get(dependency, set()).discard(current)
+
+            for dependent in self._dependents.get(current, set()):
+                if dependent not in invalidated:
+                    invalidated.add(dependent)
+                    pending.append(dependent)
+
+        invalidated.discard(key)
+
+        return invalidated
+
+    # The definitions the given key was found to depend on when it was last resolved.
+    def get_dependencies(self, key: Hashable) -> set[Hashable]:
+        return set(self._dependencies.get(key, set()))
+
+    def is_resolved(self, key: Hashable) -> bool:
+        return key in self._values
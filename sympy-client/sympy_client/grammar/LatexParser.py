@@ -1,14 +1,26 @@
+import glob
+import hashlib
 import os
 import re as regex
-from typing import Callable, Iterator
+import sys
+import threading
+from collections import OrderedDict
+from copy import copy
+from typing import Any, Callable, Iterator
 
-from lark import Lark, LarkError, Token, UnexpectedInput
+import lark
+from lark import Lark, LarkError, Token, Tree, UnexpectedInput
+from lark.exceptions import VisitError
 from lark.lark import PostLex
 from lark.lexer import TerminalDef
-from sympy import *
+from lark.parse_tree_builder import ParseTreeBuilder
+
+from sympy_client.PhaseTimer import timed_phase
 
 from .SympyParser import DefinitionStore, SympyParser
-from .transformers.LatexTransformer import LatexTransformer
+from .transformers.LatexTransformer import (LatexTransformer,
+                                            PositionsRequiredError,
+                                            TreelessLatexTransformer)
 
 
 # Represents a scope to be handled by the ScopePostLexer.
@@ -24,24 +36,31 @@ class LexerScope:
                 ):
         self.scope_pairs = scope_pairs
         self.replace_tokens = replace_tokens
+        # the replace_tokens, with the patterns of the replacing terminals compiled up front, instead of for every token.
+        self._compiled_replace_tokens: dict[str, str|list[tuple[str, regex.Pattern]]] = {
+            token_type: replacement if isinstance(replacement, str) else [ (terminal.name, regex.compile(terminal.pattern.to_regexp())) for terminal in replacement ]
+            for token_type, replacement in replace_tokens.items()
+        }
     
     def token_handler(self, token_stream: Iterator[Token], _scope_start_token: Token) -> Iterator[Token]:
+        compiled_replace_tokens = self._compiled_replace_tokens
+        
         for t in token_stream:
+            replacement = compiled_replace_tokens.get(t.type)
+            
             # try to replace the token
-            if t.type in self.replace_tokens:
-                if isinstance(self.replace_tokens[t.type], str):
-                    yield Token(self.replace_tokens[t.type], t.value)
-                    continue
-                
-                for replace_token in self.replace_tokens[t.type]:
-                    if regex.fullmatch(replace_token.pattern.to_regexp(), t.value):
-                        yield Token(replace_token.name, t.value)
+            if replacement is None:
+                yield t
+            elif isinstance(replacement, str):
+                yield Token(replacement, t.value)
+            else:
+                for replace_token_name, replace_token_pattern in replacement:
+                    if replace_token_pattern.fullmatch(t.value):
+                        yield Token(replace_token_name, t.value)
                         break
                 else:
                     # no tokens could replace it anyways, so just return the original one.
                     yield t
-            else:
-                yield t
 
 class MultiArgScope(LexerScope):
     def __init__(self, arg_count: int, *args, **kwargs):
@@ -84,6 +103,9 @@ class PartialDiffScope(LexerScope):
 # It does this by recognizing pairs of terminals, which define a scope.
 # Inside this scope, terminals can be specified which should be replaced by other terminals,
 # or optionally a custom token handler can be given, for more complex operations.
+#
+# The scope pairs are written as regex patterns of terminal names, which are only matched once for each terminal,
+# the scope started by a terminal is looked up in a dispatch table keyed by its type after that.
 class ScopePostLexer(PostLex):
         
     # setup scopes using the terminals defined in the given parser.
@@ -167,41 +189,99 @@ class ScopePostLexer(PostLex):
             )
         ]
         
+        # maps a token type to the scope it starts, and the compiled pattern of the terminal ending it,
+        # or None if it does not start a scope.
+        self._scope_starts: dict[str, tuple[LexerScope, regex.Pattern] | None] = {}
+        
+        for terminal in parser.terminals:
+            self._get_scope_start(terminal.name)
+        
+    # The scopes are processed with an explicit stack of the token handlers of the currently open scopes, innermost last,
+    # together with the pattern of the terminal ending each scope.
+    # Only the innermost token handler pulls tokens from the stream, so each token passes through a single token handler,
+    # regardless of how deeply its scope is nested.
     def process(self, stream: Iterator[Token]) -> Iterator[Token]:
-        yield from self._process_scope(stream, LexerScope(), None, None)
+        scope_stack: list[tuple[Iterator[Token], regex.Pattern | None]] = [ (LexerScope().token_handler(stream, None), None) ]
+        
+        while len(scope_stack) > 0:
+            token_handler, scope_end_terminal = scope_stack[-1]
+            token = next(token_handler, None)
+            
+            # the scope has run out of tokens, continue with the enclosing scope.
+            if token is None:
+                scope_stack.pop()
+                continue
             
-    def _process_scope(self, stream, scope: LexerScope, scope_begin_token: Token | None, scope_end_terminal: str | None):
-        for token in scope.token_handler(stream, scope_begin_token):
             yield token
             
             # check if we are ourselves at an end terminal
             # if we are, go out of the scope.
-            if scope_end_terminal is not None and regex.fullmatch(scope_end_terminal, token.type):
-                break
+            if scope_end_terminal is not None and scope_end_terminal.fullmatch(token.type):
+                scope_stack.pop()
+                continue
             
             # check if the token starts a scope
-            for new_scope in self.scopes:
-                for scope_pair in new_scope.scope_pairs:
-                    match = regex.fullmatch(scope_pair[0], token.type)
-                    if match:
-                        end_terminal = scope_pair[1] if isinstance(scope_pair[1], str) else scope_pair[1](match)
-                        yield from self._process_scope(stream, new_scope, token, end_terminal)
-                        break # do not consider other scopes
-                # do not continue if the inner loop was broken out of.
-                else:
-                    continue
+            scope_start = self._get_scope_start(token.type)
+            
+            if scope_start is not None:
+                new_scope, end_terminal = scope_start
+                scope_stack.append((new_scope.token_handler(stream, token), end_terminal))
+    
+    # Get the scope started by the given token type, and the compiled pattern of its end terminal, from the dispatch table.
+    # Token types not in the table, e.g. ones produced by the post lexer itself, are matched against the scope pairs, and added to it.
+    def _get_scope_start(self, token_type: str) -> tuple[LexerScope, regex.Pattern] | None:
+        try:
+            return self._scope_starts[token_type]
+        except KeyError:
+            pass
+        
+        scope_start = None
+        
+        for new_scope in self.scopes:
+            for start_terminal, end_terminal in new_scope.scope_pairs:
+                match = regex.fullmatch(start_terminal, token_type)
+                if match:
+                    scope_start = (new_scope, regex.compile(end_terminal if isinstance(end_terminal, str) else end_terminal(match)))
+                    break # do not consider other scopes
+            
+            if scope_start is not None:
                 break
+        
+        self._scope_starts[token_type] = scope_start
+        
+        return scope_start
 
 ## The LmatLatexParser is responsible for parsing a latex string in the context of an LmatEnvironment.
+#
+# Building the LALR tables of the grammar takes several seconds, so the built parser is stored next to the grammar,
+# in a file keyed by a hash of the grammar files, see get_parser_cache_file.
+# Release builds ship this file, built by BuildParser.py, so the tables are never built on the users machine.
+#
+# Strings are parsed in one of two modes:
+# - tree-less, where a TreelessLatexTransformer is embedded in the lalr parser, so sympy expressions are built as rules are reduced,
+#   without allocating a parse tree, or tracking positions in the latex string.
+# - into a parse tree with positions, which is then transformed by a LatexTransformer.
+#   This is needed for systems of relations, which keep the positions of their expressions.
+#
+# A parse tree only depends on the latex string, not on the environment it is parsed in,
+# so only the transformation into a sympy expression needs to be redone when the same string is parsed again,
+# e.g. for every call of a function, or for the variable definitions of every request.
+# The first time a string is parsed, it is parsed tree-less, as most strings are never parsed again.
+# If it is parsed again, its tree is built and kept in an lru cache of the last parse_cache_size strings.
+# Cached trees are shared between parses, so they must never be modified.
 class LatexParser(SympyParser):
 
-    def __init__(self, grammar_file: str = None):
+    def __init__(self, grammar_file: str = None, parse_cache_size: int = 512):
         if grammar_file is None:
-            grammar_file = os.path.join(
-                os.path.dirname(__file__), "latex_math_grammar.lark"
-            )
+            grammar_file = LatexParser.DEFAULT_GRAMMAR_FILE
         
         post_lexer = ScopePostLexer()
+        parser_cache_file = LatexParser.get_parser_cache_file(grammar_file)
+
+        # if the parser has not been built, and cannot be stored next to the grammar, e.g. in an installed package,
+        # fall back to lark's own cache in the temp directory.
+        if not os.path.isfile(parser_cache_file) and not os.access(os.path.dirname(parser_cache_file), os.W_OK):
+            parser_cache_file = True
         
         self.parser = Lark.open(
             grammar_file,
@@ -210,25 +290,143 @@ class LatexParser(SympyParser):
             start="latex_string",
             lexer="contextual",
             debug=False,
-            cache=True,
+            cache=parser_cache_file,
             propagate_positions=True,
             maybe_placeholders=True,
             postlex=post_lexer
         )
         
         post_lexer.initialize_scopes(self.parser)
+        
+        self._treeless_parser = self._create_treeless_parser()
+        
+        # maps recently parsed strings to their parse tree, or None if it has only been parsed tree-less.
+        self._parse_cache: OrderedDict[str, Tree | None] = OrderedDict()
+        self._parse_cache_size = parse_cache_size
+        self._parse_cache_hits = 0
+        self._parse_cache_misses = 0
+        # handlers may parse from several executor threads at once.
+        self._parse_cache_lock = threading.Lock()
+
+    # Path of the file storing the built parser of the given grammar file.
+    # Its name contains a hash of every grammar file in the directory of the grammar file, and of the lark and python versions,
+    # so editing the grammar, or upgrading lark, results in a new parser file, instead of a stale one being loaded.
+    @staticmethod
+    def get_parser_cache_file(grammar_file: str) -> str:
+        grammar_hash = hashlib.sha256(f"{lark.__version__}|{sys.version_info[:2]}".encode())
+
+        for grammar_dependency in sorted(glob.glob(os.path.join(os.path.dirname(grammar_file), "*.lark"))):
+            with open(grammar_dependency, "rb") as f:
+                grammar_hash.update(os.path.basename(grammar_dependency).encode())
+                grammar_hash.update(f.read())
+
+        grammar_name = os.path.splitext(grammar_file)[0]
+
+        return f"{grammar_name}-{grammar_hash.hexdigest()[:16]}.lark_cache"
 
     # Parse the given latex expression into a sympy expression, substituting any information into the expression, present in the current environment.
     def parse(self, latex_str: str, definitions_store: DefinitionStore):        
-        transformer = LatexTransformer(definitions_store)
-        
         try:
-            parse_tree = self.parser.parse(latex_str)
+            parse_tree = self._get_cached_parse_tree(latex_str)
+            
+            if parse_tree is None:
+                try:
+                    # the tree-less parse also transforms the expression, so it is timed as a whole.
+                    with timed_phase('parse'), TreelessLatexTransformer.use_definitions_store(definitions_store):
+                        return self._treeless_parser.parse(latex_str)
+                except PositionsRequiredError:
+                    pass
+                
+                with timed_phase('parse'):
+                    parse_tree = self.parser.parse(latex_str)
+                
+                self._cache_parse_tree(latex_str, parse_tree)
         except UnexpectedInput as e:
             raise LarkError(f"{e.get_context(latex_str, LatexParser.__PARSE_ERR_PRETTY_STR_SPAN)}{e}") from e
-            
-        expr = transformer.transform(parse_tree)
+        
+        # lark wraps errors raised while transforming a tree, the original error is raised instead,
+        # so it is the same as for the tree-less parse, and e.g. a CyclicDefinitionError can be caught by the definition it passes through.
+        try:
+            with timed_phase('transform'):
+                expr = LatexTransformer(definitions_store).transform(parse_tree)
+        except VisitError as e:
+            raise e.orig_exc from e
         
         return expr
     
+    # The size, maximum size, hits and misses of the parse tree cache, see Metrics.register_cache_stats.
+    # A miss is a string parsed without its tree being in the cache.
+    def get_parse_cache_stats(self) -> dict[str, Any]:
+        with self._parse_cache_lock:
+            return dict(size=len(self._parse_cache), max_size=self._parse_cache_size, hits=self._parse_cache_hits, misses=self._parse_cache_misses)
+    
+    def clear_parse_cache(self):
+        with self._parse_cache_lock:
+            self._parse_cache.clear()
+            self._parse_cache_hits = 0
+            self._parse_cache_misses = 0
+    
+    # Get the cached parse tree of the given string, or None if it should be parsed tree-less.
+    # If the string has been parsed before, but its tree is not cached, it is parsed into a tree right away.
+    def _get_cached_parse_tree(self, latex_str: str) -> Tree | None:
+        with self._parse_cache_lock:
+            if latex_str in self._parse_cache:
+                self._parse_cache.move_to_end(latex_str)
+                parse_tree = self._parse_cache[latex_str]
+                
+                if parse_tree is not None:
+                    self._parse_cache_hits += 1
+                    return parse_tree
+            else:
+                self._parse_cache_misses += 1
+                self._cache_parse_tree_unlocked(latex_str, None)
+                return None
+            
+            self._parse_cache_misses += 1
+        
+        with timed_phase('parse'):
+            parse_tree = self.parser.parse(latex_str)
+        
+        self._cache_parse_tree(latex_str, parse_tree)
+        
+        return parse_tree
+    
+    def _cache_parse_tree(self, latex_str: str, parse_tree: Tree):
+        with self._parse_cache_lock:
+            self._cache_parse_tree_unlocked(latex_str, parse_tree)
+    
+    def _cache_parse_tree_unlocked(self, latex_str: str, parse_tree: Tree | None):
+        if self._parse_cache_size <= 0:
+            return
+        
+        self._parse_cache[latex_str] = parse_tree
+        self._parse_cache.move_to_end(latex_str)
+        
+        while len(self._parse_cache) > self._parse_cache_size:
+            self._parse_cache.popitem(last=False)
+    
+    # Construct a parsing frontend which shares the lexer and parse table of the tree parser,
+    # but whose parser callbacks are those of a TreelessLatexTransformer, without position propagation.
+    def _create_treeless_parser(self):
+        transformer = TreelessLatexTransformer()
+        
+        parse_tree_builder = ParseTreeBuilder(self.parser.rules, self.parser.options.tree_class, propagate_positions=False, maybe_placeholders=self.parser.options.maybe_placeholders)
+        callbacks = parse_tree_builder.create_callback(transformer)
+        
+        # terminals with a transformer method are transformed as they are shifted.
+        for terminal in self.parser.terminals:
+            terminal_callback = getattr(transformer, terminal.name, None)
+            
+            if terminal_callback is not None:
+                callbacks[terminal.name] = terminal_callback
+        
+        treeless_parser = copy(self.parser.parser)
+        treeless_parser.parser = copy(treeless_parser.parser)
+        treeless_parser.parser.parser = copy(treeless_parser.parser.parser)
+        treeless_parser.parser.parser.callbacks = callbacks
+        
+        return treeless_parser
+    
     __PARSE_ERR_PRETTY_STR_SPAN = 30
+
+    DEFAULT_GRAMMAR_FILE = os.path.join(os.path.dirname(__file__), "latex_math_grammar.lark")
@@ -1,29 +1,93 @@
-from copy import copy
+from functools import lru_cache
 from typing import Iterable
 
-from sympy import Expr, Function, Symbol
+from sympy import (Basic, Derivative, Dummy, Expr, Function, Limit, Pow, S,
+                   Set, Symbol, evaluate, preorder_traversal, sympify)
+from sympy.concrete.expr_with_limits import ExprWithLimits
+from sympy.functions.elementary.hyperbolic import (HyperbolicFunction,
+                                                   InverseHyperbolicFunction)
+from sympy.functions.elementary.trigonometric import (InverseTrigonometricFunction,
+                                                      TrigonometricFunction)
+from sympy.physics.units.systems import SI
+from sympy.physics.units.unitsystem import UnitSystem
+from sympy_client.grammar.DefinitionResolver import (CyclicDefinitionError,
+                                                     DefinitionResolver)
 from sympy_client.grammar.SympyParser import (DefinitionStore,
                                               FunctionDefinition, SympyParser)
 from sympy_client.LmatEnvironment import LmatEnvironment
 
+# Functions transformed by the trig_function rule, which are inverted if raised to -1.
+TRIGONOMETRIC_FUNCTIONS = (TrigonometricFunction, InverseTrigonometricFunction, HyperbolicFunction, InverseHyperbolicFunction)
 
+# The maximum number of distinct symbols kept by intern_symbol.
+SYMBOL_TABLE_SIZE = 8192
+
+# Get the canonical instance of the symbol with the given name and assumptions.
+# Symbols are interned across definition stores, so equal symbols are the same instance in every store and command,
+# which makes comparing them an identity check, instead of relying on sympy's own cache, which evicts them along with every other cached result.
+@lru_cache(maxsize=SYMBOL_TABLE_SIZE)
+def intern_symbol(name: str, assumptions: frozenset[str] = frozenset()) -> Symbol:
+    return Symbol(name, **{ assumption: True for assumption in assumptions })
+
+# Values which may hit a singularity cancelled out of an evaluated template, e.g. x / x is 1, but 0 / 0 is nan.
+SINGULAR_VALUES = (S.Infinity, S.NegativeInfinity, S.ComplexInfinity, S.NaN)
+
+# Substitute the given values into the given unevaluated expression, and evaluate every node of it bottom up,
+# like parsing the expression with the values would.
+def substitute_evaluated(unevaluated_expr: Basic, values: dict[Basic, Basic]) -> Basic:
+    evaluated_nodes = dict(values)
+
+    def evaluate_node(node: Basic) -> Basic:
+        evaluated_node = evaluated_nodes.get(node)
+
+        if evaluated_node is None:
+            evaluated_node = node.func(*map(evaluate_node, node.args)) if node.args else node
+            evaluated_nodes[node] = evaluated_node
+
+        return evaluated_node
+
+    with evaluate(True):
+        return evaluate_node(unevaluated_expr)
+
+# The body of a function definition is parsed once, with its arguments substituted by dummy symbols,
+# into a template which is called by substituting the dummies with the values of the arguments, like a sympy Lambda.
+#
+# Parsing evaluates the body, which may cancel out singularities of its arguments, e.g. x / x is 1, even though it is undefined for x = 0.
+# Symbolic values cancel the same way when parsed, but numbers may not, so numeric values are instead substituted into an unevaluated template,
+# which is then evaluated bottom up, see substitute_evaluated.
+#
+# Some rules are transformed differently depending on the values of their expressions, e.g. |x| is a determinant if x is a matrix,
+# so the body is parsed with the values of the arguments instead, if substituting them into the template could give a different result.
+#
+# The template is resolved by the given resolver under the given key, so it is invalidated along with the definitions it depends on.
 class LmatEnvFunctionDefinition(FunctionDefinition):
-    def __init__(self, definition_store: DefinitionStore, parser: SympyParser, args: Iterable[Symbol], latex_expr: str):
+    def __init__(self, definition_store: DefinitionStore, parser: SympyParser, args: Iterable[Symbol], latex_expr: str, resolver: DefinitionResolver, key: Function):
         super().__init__()
         self._definitions_store = definition_store
         self._parser = parser
         self._args = tuple(args)
         self._latex_expr = latex_expr
+        self._resolver = resolver
+        self._key = key
+        
+        self._template_args = tuple(Dummy(str(arg)) for arg in self._args)
 
     def call(self, *args) -> Expr:
         assert len(args) == len(self.args)
-
-        args_map = { arg: val for arg, val in zip(self.args, args) }
-        func_def_store = LmantEnvFuncDefStore(args_map, self._definitions_store)
         
-        expr = self._parser.parse(self.serialized_body, func_def_store)
+        templates = self._get_templates()
         
-        return expr
+        if templates is not None and all(self._is_substitutable_value(arg) for arg in args):
+            template, unevaluated_template = templates
+            values = dict(zip(self._template_args, args))
+            
+            if not any(self._is_singular_value(arg) for arg in args):
+                return template.xreplace(values)
+            
+            if unevaluated_template is not None:
+                return substitute_evaluated(unevaluated_template, values)
+        
+        return self._parse_body(args)
     
     def get_body(self):
         return self.call(*self.args)
@@ -35,9 +99,86 @@ class LmatEnvFunctionDefinition(FunctionDefinition):
     @property
     def serialized_body(self) -> str:
         return self._latex_expr
+    
+    def _parse_body(self, args: Iterable[Expr]) -> Expr:
+        args_map = { arg: val for arg, val in zip(self.args, args) }
+        func_def_store = LmantEnvFuncDefStore(args_map, self._definitions_store)
+        
+        return self._parser.parse(self.serialized_body, func_def_store)
+    
+    # Get the evaluated and unevaluated templates of the body, None if it cannot be substituted into.
+    # The unevaluated template is None if evaluating it does not give the evaluated template.
+    def _get_templates(self) -> tuple[Expr, Expr | None] | None:
+        return self._resolver.resolve(self._key, self._parse_templates)
+    
+    def _parse_templates(self) -> tuple[Expr, Expr | None] | None:
+        try:
+            # the template may be resolved while parsing the unevaluated template of another function.
+            with evaluate(True):
+                template = self._parse_body(self._template_args)
+        except CyclicDefinitionError:
+            raise
+        except Exception:
+            # the body may only be valid for some values of its arguments, e.g. a matrix plus an argument.
+            return None
+        
+        if not self._is_substitutable_template(template):
+            return None
+        
+        try:
+            with evaluate(False):
+                unevaluated_template = self._parse_body(self._template_args)
+            
+            # rules computing more than their sympy objects, e.g. matrix products, are not reproduced by evaluating the nodes of their result.
+            if substitute_evaluated(unevaluated_template, {}) != template:
+                unevaluated_template = None
+        except CyclicDefinitionError:
+            raise
+        except Exception:
+            unevaluated_template = None
+        
+        return template, unevaluated_template
+    
+    # Matrices are transformed differently from scalars, and the template is parsed with scalar dummies.
+    @staticmethod
+    def _is_substitutable_value(value) -> bool:
+        return isinstance(value, Expr) and not value.is_Matrix
+    
+    @staticmethod
+    def _is_singular_value(value: Expr) -> bool:
+        return value.is_number or value.has(*SINGULAR_VALUES)
+    
+    # Whether the given template gives the same result as parsing the body with the values of the arguments, when substituted into.
+    # This is not the case if an argument is used as a variable of e.g. an integral, as it is then not substituted,
+    # if an argument is differentiated, as derivative rules may pick the variable based on the free symbols of their expression,
+    # or if an argument is the exponent of a trigonometric function, as an exponent of -1 gives its inverse function.
+    def _is_substitutable_template(self, template) -> bool:
+        if not isinstance(template, Expr):
+            return False
+        
+        template_args = set(self._template_args)
+        
+        for node in preorder_traversal(template):
+            if isinstance(node, Derivative) and not template_args.isdisjoint(node.free_symbols | set(node.variables)):
+                return False
+            
+            if isinstance(node, ExprWithLimits) and not template_args.isdisjoint(node.variables):
+                return False
+            
+            if isinstance(node, Limit) and node.args[1] in template_args:
+                return False
+            
+            if isinstance(node, Pow) and isinstance(node.base, TRIGONOMETRIC_FUNCTIONS) and not template_args.isdisjoint(node.exp.free_symbols):
+                return False
+        
+        return True
 
 # Definition store implementation in the context of an LmatEnvironment.
 # provides definitions and deserializatiosn based on the symbols, variables and functions tables.
+#
+# Variables and function templates are resolved on their first use, and at most once, by a DefinitionResolver,
+# which also reports cyclic definitions. set_variable and set_function change a single definition,
+# and only invalidate the definitions depending on it.
 class LmatEnvDefStore(DefinitionStore):
     
     def __init__(self, parser: SympyParser, environment: LmatEnvironment):
@@ -47,33 +188,53 @@ class LmatEnvDefStore(DefinitionStore):
         
         self._environment = environment
         
+        self._resolver = DefinitionResolver()
+        
         self._cached_symbols = {}
-        self._cached_symbol_definitions = {}
+        
+        # no symbol substitution should take place during cache generation,
+        # and the variables are keyed by the symbols with their assumptions, so they are deserialized afterwards.
+        self._serialized_symbol_definitions = {}
+
+        self._gen_symbols_cache()
 
         self._serialized_symbol_definitions = {
             self.deserialize_symbol(s): definition
             for s, definition in environment.get('variables', {}).items()
         }
-
-        self._gen_symbols_cache()
         
         
-        self._functions: dict[Symbol, FunctionDefinition] = {}
+        self._functions: dict[Function, FunctionDefinition] = {}
+        
+        for func_name, func_def in self._environment.get('functions', {}).items():
+            self._functions[self.deserialize_function(func_name)] = self._create_function_definition(func_name, func_def)
         
-        if 'functions' in self._environment:
-            for func_name, func_def in self._environment['functions'].items():
-                
-                func_args = [ self.deserialize_symbol(s) for s in func_def['args'] ]
-                
-                self._functions[self.deserialize_function(func_name)] = LmatEnvFunctionDefinition(
-                    definition_store=self,
-                    args=func_args,
-                    latex_expr=func_def['expr'],
-                    parser=parser
-                )
+        self._domain: Set | None = None
+        self._unit_system: UnitSystem | None = None
+    
+    # The domain equations are solved in, parsed from the domain of the environment on first use.
+    # Defaults to the complex numbers.
+    @property
+    def domain(self) -> Set:
+        if self._domain is None:
+            domain = (self._environment.get('domain') or '').strip()
+            self._domain = sympify(domain) if domain != "" else S.Complexes
+        
+        return self._domain
+    
+    # The unit system results are converted to, resolved from the unit system of the environment on first use.
+    # Defaults to SI.
+    @property
+    def unit_system(self) -> UnitSystem:
+        if self._unit_system is None:
+            unit_system = self._environment.get('unit_system', None)
+            self._unit_system = UnitSystem.get_unit_system(unit_system) if unit_system is not None else SI
+        
+        return self._unit_system
     
     
     def get_function_definition(self, function: Function) -> FunctionDefinition | None:
+        self._resolver.add_dependency(function)
         return self._functions.get(function)
     
     def deserialize_function(self, serialized_function: str) -> Function:
@@ -82,44 +243,105 @@ class LmatEnvDefStore(DefinitionStore):
     # Attempt to get the value which the given variable / symbol name should be substituted with.
     # If no such variable / symbol exists, returns None.
     def get_symbol_definition(self, symbol: Symbol) -> Expr | None:
-        if symbol in self._cached_symbol_definitions:
-            return self._cached_symbol_definitions[symbol]
-        elif symbol in self._serialized_symbol_definitions:
-            return self._deserialize_definition(symbol)  
-        else:
+        if symbol not in self._serialized_symbol_definitions:
+            # recorded, so defining the symbol later invalidates the definitions using it.
+            self._resolver.add_dependency(symbol)
             return None
         
+        return self._resolver.resolve(symbol, lambda: self._parse_symbol_definition(symbol))
+        
+    # Symbols are looked up for every identifier parsed in the store, so each name is only interned once per store.
     def deserialize_symbol(self, symbol_latex: str):
-        return copy(self._cached_symbols.get(symbol_latex, Symbol(symbol_latex)))
-
-    def _deserialize_definition(self, symbol: Symbol):
-        serialized_definition = self._serialized_symbol_definitions[symbol]
-        definition_value = self._parser.parse(serialized_definition, self)
-        self._cached_symbols[symbol] = definition_value
+        symbol = self._cached_symbols.get(symbol_latex)
         
-        return definition_value
-
-    def _gen_symbols_cache(self):
-        tmp_cached_symbol_definitions = self._cached_symbol_definitions
-        tmp_serialized_symbol_definitions = self._serialized_symbol_definitions
+        if symbol is None:
+            symbol = self._cached_symbols[symbol_latex] = intern_symbol(symbol_latex)
         
-        # no symbol substitution should take place during cache generation,
-        # so we temporarily clear these here.
-        self._cached_symbol_definitions = {}
-        self._serialized_symbol_definitions = {}
+        return symbol
+    
+    # Define, or redefine, the given variable as the given latex expression, or remove it if the definition is None.
+    # Returns the variables and functions whose definitions depended on it, and have to be resolved again.
+    def set_variable(self, variable_latex: str, latex_definition: str | None) -> set[Symbol | Function]:
+        variable = self.deserialize_symbol(variable_latex)
+        
+        if latex_definition is None:
+            self._serialized_symbol_definitions.pop(variable, None)
+        else:
+            self._serialized_symbol_definitions[variable] = latex_definition
+        
+        return self._resolver.invalidate(variable)
+    
+    # Define, or redefine, the given function from an entry of the functions table, or remove it if the definition is None.
+    # Returns the variables and functions whose definitions depended on it, and have to be resolved again.
+    def set_function(self, function_name: str, function_definition: dict | None) -> set[Symbol | Function]:
+        function = self.deserialize_function(function_name)
         
+        if function_definition is None:
+            self._functions.pop(function, None)
+        else:
+            self._functions[function] = self._create_function_definition(function_name, function_definition)
+        
+        return self._resolver.invalidate(function)
+    
+    # Change the environment of the store to the given environment,
+    # only invalidating the definitions depending on the variables and functions which changed.
+    # Returns False if the symbols changed, as this changes every symbol deserialized by the store, so a new store has to be built instead.
+    def update_environment(self, environment: LmatEnvironment) -> bool:
+        if LmatEnvDefStore._get_assumptions(environment) != LmatEnvDefStore._get_assumptions(self._environment):
+            return False
+        
+        variables = self._environment.get('variables', {})
+        updated_variables = environment.get('variables', {})
+        
+        for variable_latex in variables.keys() | updated_variables.keys():
+            if variables.get(variable_latex) != updated_variables.get(variable_latex):
+                self.set_variable(variable_latex, updated_variables.get(variable_latex))
+        
+        functions = self._environment.get('functions', {})
+        updated_functions = environment.get('functions', {})
+        
+        for function_name in functions.keys() | updated_functions.keys():
+            if functions.get(function_name) != updated_functions.get(function_name):
+                self.set_function(function_name, updated_functions.get(function_name))
+        
+        if environment.get('domain') != self._environment.get('domain'):
+            self._domain = None
+        
+        if environment.get('unit_system') != self._environment.get('unit_system'):
+            self._unit_system = None
+        
+        self._environment = environment
+        
+        return True
+    
+    # Variables are always evaluated, even if first resolved while parsing the unevaluated template of a function.
+    def _parse_symbol_definition(self, symbol: Symbol) -> Expr:
+        with evaluate(True):
+            return self._parser.parse(self._serialized_symbol_definitions[symbol], self)
+    
+    # The assumptions of each symbol in the symbols table of the given environment, regardless of their order.
+    @staticmethod
+    def _get_assumptions(environment: LmatEnvironment) -> dict[str, set[str]]:
+        return { symbol: set(assumptions) for symbol, assumptions in environment.get('symbols', {}).items() }
+    
+    def _create_function_definition(self, function_name: str, function_definition: dict) -> LmatEnvFunctionDefinition:
+        return LmatEnvFunctionDefinition(
+            definition_store=self,
+            args=[ self.deserialize_symbol(s) for s in function_definition['args'] ],
+            latex_expr=function_definition['expr'],
+            parser=self._parser,
+            resolver=self._resolver,
+            key=self.deserialize_function(function_name)
+        )
+
+    def _gen_symbols_cache(self):
         for latex_str, assumptions_list in self._environment.get('symbols', {}).items():
             symbol = self._parser.parse(latex_str, self)
             
             if not isinstance(symbol, Symbol):
                 raise RuntimeError(f'Symbol expression cannot be parsed as a symbol: "{latex_str}"')
             
-            assumptions = { assumption: True for assumption in assumptions_list }
-            
-            self._cached_symbols[str(symbol)] = Symbol(str(symbol), **assumptions)
-            
-        self._cached_symbol_definitions = tmp_cached_symbol_definitions
-        self._serialized_symbol_definitions = tmp_serialized_symbol_definitions
+            self._cached_symbols[str(symbol)] = intern_symbol(str(symbol), frozenset(assumptions_list))
 
 
 # wrapper class for a DefinitionStore, which maps function args and their corresponding symbols to a given set of values.
@@ -138,7 +360,11 @@ class LmantEnvFuncDefStore(DefinitionStore):
         return self._definitions_store.deserialize_function(serialized_function)
     
     def get_symbol_definition(self, symbol: Symbol) -> Expr | None:
-        return self._args.get(symbol, self._definitions_store.get_symbol_definition(symbol))
+        # arguments shadow variables, so the body does not depend on variables of the same name.
+        if symbol in self._args:
+            return self._args[symbol]
+        
+        return self._definitions_store.get_symbol_definition(symbol)
 
     def deserialize_symbol(self, serialized_symbol):
         return self._definitions_store.deserialize_symbol(serialized_symbol)
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy_client.grammar.SympyParser import SympyParser
+from sympy_client.LmatEnvironment import LmatEnvironment
+from sympy_client.PhaseTimer import timed_phase
+
+# The LmatEnvDefStoreCache keeps the definition stores of the last max_size environments,
+# so consecutive commands in the same note skip parsing its symbols, function definitions, domain and unit system,
+# and reuse the variables and function templates resolved by the previous commands.
+#
+# Environments are identified by a canonical hash of their contents, see environment_hash,
+# or by the id of their session, if they belong to one, see EnvironmentSessions.
+# The environment of a session changes between commands, so its store is updated to the new environment,
+# which only invalidates the definitions depending on the entries which changed, see LmatEnvDefStore.update_environment.
+#
+# A store resolves its definitions as it is used, so it is only used by one command at a time,
+# a command in an environment whose store is in use gets a new store, which is not cached.
+class LmatEnvDefStoreCache:
+    def __init__(self, parser: SympyParser, max_size: int = 16):
+        self._parser = parser
+        self._max_size = max_size
+
+        self._stores: OrderedDict[tuple[str, str], tuple[LmatEnvDefStore, threading.Lock]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+        self._lock = threading.Lock()
+
+    # Get a definitions store for the given environment, for the duration of the with block.
+    # If the environment belongs to a session, session_id is the id of it.
+    @contextmanager
+    def definitions_store(self, environment: LmatEnvironment, session_id: str | None = None) -> Iterator[LmatEnvDefStore]:
+        if self._max_size <= 0:
+            store_key = None
+        elif session_id is not None:
+            store_key = ('session', session_id)
+        else:
+            store_key = ('environment', LmatEnvDefStoreCache.environment_hash(environment))
+
+        with self._lock:
+            cached_store = self._stores.get(store_key)
+
+            if cached_store is not None:
+                self._stores.move_to_end(store_key)
+
+        if cached_store is not None:
+            store, store_lock = cached_store
+
+            if store_lock.acquire(blocking=False):
+                is_store_updated = False
+
+                try:
+                    with timed_phase('definitions'):
+                        is_store_updated = store.update_environment(environment)
+
+                    if is_store_updated:
+                        self._count_lookup(is_hit=True)
+                        yield store
+                finally:
+                    store_lock.release()
+
+                if is_store_updated:
+                    return
+
+                # the store could not be updated, so it is replaced by a new store below.
+                cached_store = None
+
+        self._count_lookup(is_hit=False)
+
+        with timed_phase('definitions'):
+            store = LmatEnvDefStore(self._parser, environment)
+
+        if store_key is None or cached_store is not None:
+            yield store
+            return
+
+        store_lock = threading.Lock()
+
+        with store_lock:
+            with self._lock:
+                self._stores[store_key] = (store, store_lock)
+                self._stores.move_to_end(store_key)
+
+                while len(self._stores) > self._max_size:
+                    self._stores.popitem(last=False)
+
+            yield store
+
+    # The size, maximum size, hits and misses of the cache, see Metrics.register_cache_stats.
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return dict(size=len(self._stores), max_size=self._max_size, hits=self._hits, misses=self._misses)
+
+    # Evict the store of the given session, if any, as its session has been closed.
+    def evict_session(self, session_id: str):
+        with self._lock:
+            self._stores.pop(('session', session_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._stores.clear()
+            self._hits = 0
+            self._misses = 0
+
+    # Hash of the contents of the given environment, which is equal for environments with equal definitions,
+    # regardless of the order of their tables, or of the assumptions of a symbol.
+    @staticmethod
+    def environment_hash(environment: LmatEnvironment) -> str:
+        canonical_environment = dict(
+            environment,
+            symbols={ symbol: sorted(assumptions) for symbol, assumptions in environment.get('symbols', {}).items() }
+        )
+
+        return hashlib.sha256(json.dumps(canonical_environment, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+    def _count_lookup(self, is_hit: bool):
+        with self._lock:
+            if is_hit:
+                self._hits += 1
+            else:
+                self._misses += 1
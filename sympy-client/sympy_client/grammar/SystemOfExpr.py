@@ -1,8 +1,17 @@
 from lark.tree import Meta 
+from sympy.core.relational import Relational
 
 from typing import Callable, Any
 
+# An expression in a SystemOfExpr, which is only constructed once it is retreived from the system.
+# get_rhs constructs only the right hand side of the expression if it is a relation, without its left hand side.
+class LazyExpr:
+    def __init__(self, get_expr: Callable[[], Any], get_rhs: Callable[[], Any]):
+        self.get_expr = get_expr
+        self.get_rhs = get_rhs
+
 # The SystemOfExpr class represents a list of sympy expressions and their original locations in some source text.
+# Expressions may be given as LazyExpr's, e.g. the lines of an align block, so only the expressions which are used are transformed.
 class SystemOfExpr:
     def __init__(self, expressions: list[tuple[Any, Meta]]):
         self.__expressions: list[Any] = [ e[0] for e in expressions]
@@ -17,15 +26,33 @@ class SystemOfExpr:
     
     # modify a single expression in the system.
     def change_expr(self, expression_index: int, change_func: Callable[[Any], Any]):
-        self.__expressions[expression_index] = change_func(self.__expressions[expression_index])
+        self.__expressions[expression_index] = change_func(self.get_expr(expression_index))
     
     # retreive the expression at the given index
     def get_expr(self, expression_index: int):
-        return self.__expressions[expression_index]
+        expression = self.__expressions[expression_index]
+        
+        if isinstance(expression, LazyExpr):
+            expression = self.__expressions[expression_index] = expression.get_expr()
+        
+        return expression
+    
+    # retreive the right hand side of the relation at the given index, or the expression itself if it is not a relation.
+    # a lazy relation is not constructed, so its left hand side is never transformed.
+    def get_rhs(self, expression_index: int):
+        expression = self.__expressions[expression_index]
+        
+        if isinstance(expression, LazyExpr):
+            return expression.get_rhs()
+        
+        if isinstance(expression, Relational):
+            return expression.rhs
+        
+        return expression
     
     # retreive all expressions
     def get_all_expr(self):
-        return tuple(self.__expressions)
+        return tuple(self.get_expr(i) for i in range(len(self)))
     
     # retreive location information about the given expression
     def get_location(self, expression_index: int) -> Meta:
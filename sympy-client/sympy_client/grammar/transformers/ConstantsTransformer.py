@@ -1,5 +1,5 @@
 from lark import Transformer, v_args
-from sympy import *
+from sympy import E, Expr, I, oo, pi
 
 
 # This transformer is responsible for providing the values of various mathematical constants.
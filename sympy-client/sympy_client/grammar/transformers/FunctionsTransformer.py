@@ -1,20 +1,28 @@
-from typing import Iterator
+from typing import Callable, Iterator
 
 import sympy
 from lark import Token, Transformer, v_args
-from sympy import *
+from sympy import (Abs, Basic, Derivative, E, Expr, Integral, Limit, Matrix,
+                   MatrixBase, Max, Min, Mod, Mul, Product, S, ShapeError, Sum,
+                   Symbol, arg, binomial, ceiling, conjugate, exp, factorial,
+                   floor, gcd, im, lcm, log, lowergamma, re, root, sign, sqrt,
+                   uppergamma)
 from sympy.core.function import AppliedUndef
-from sympy.tensor.array import derive_by_array
+from sympy.core.relational import Relational
 from sympy_client.grammar.SympyParser import DefinitionStore
 
 
 # The FucntionsTransformer holds the implementation of various mathematical function rules,
 # defined in the latex math grammar.
+#
+# Limits, derivatives and integrals are left unevaluated, as computing them may take a long time,
+# and is not needed for e.g. converting an expression to sympy, or a variable which is never evaluated.
+# Handlers evaluating an expression should therefore call doit, or doit_deferred, on it first.
 @v_args(inline=True)
 class FunctionsTransformer(Transformer):
     
     def __init__(self, definitions_store: DefinitionStore):
-        self.__definitions_store = definitions_store
+        self._definitions_store = definitions_store
     
     def trig_function(self, func_token: Token, exponent: Expr | None, arg: Expr) -> Expr:
         func_type = func_token.type.replace('FUNC_', '').lower()
@@ -89,7 +97,7 @@ class FunctionsTransformer(Transformer):
     def limit(self, symbol: Expr, approach_value: Expr, direction: str | None, arg: Expr) -> Expr:
         # default direction of limits is both positive and negative.
         direction = '+-' if direction is None else direction
-        return limit(arg, symbol, approach_value, direction)
+        return self._apply_elementwise(arg, lambda e: Limit(e, symbol, approach_value, direction))
     
     def real_part(self, exponent: Expr | None, val: Expr) -> Expr:
         return self._try_raise_exponent(re(val), exponent)
@@ -132,7 +140,8 @@ class FunctionsTransformer(Transformer):
         return [*arg_list]
     
     def derivative_symbols_first(self, symbols: Iterator[tuple[Expr, Expr]], expr: Expr):
-        return diff(expr, *symbols)
+        symbols = list(symbols)
+        return self._apply_elementwise(expr, lambda e: Derivative(e, *symbols))
     
     def derivative_func_first(self, expr: Expr, symbols: Iterator[tuple[Expr, Expr]]):
         return self.derivative_symbols_first(symbols, expr)
@@ -142,7 +151,7 @@ class FunctionsTransformer(Transformer):
         symbols = expr.free_symbols
         
         if isinstance(expr, AppliedUndef):
-            func_def = self.__definitions_store.get_function_definition(expr.func)
+            func_def = self._definitions_store.get_function_definition(expr.func)
         
             if func_def is not None:
                 symbols = func_def.args
@@ -151,15 +160,15 @@ class FunctionsTransformer(Transformer):
         if len(symbols) == 0:
             return S.Zero
         else:
-            return diff(expr, sorted(symbols, key=str)[0], primes.value.count("'"), evaluate=False)
+            return self._apply_elementwise(expr, lambda e: Derivative(e, (sorted(symbols, key=str)[0], primes.value.count("'"))))
     
     def integral_no_bounds(self, expr: Expr | None, symbol: Expr):
         expr = 1 if expr is None else expr
-        return integrate(expr, symbol)
+        return self._apply_elementwise(expr, lambda e: Integral(e, symbol))
     
     def integral_lower_bound_first(self, lower_bound: Expr, upper_bound: Expr, expr: Expr | None, symbol: Expr):
         expr = 1 if expr is None else expr
-        return integrate(expr, (symbol, lower_bound, upper_bound))
+        return self._apply_elementwise(expr, lambda e: Integral(e, (symbol, lower_bound, upper_bound)))
     
     def integral_upper_bound_first(self, upper_bound: Expr, lower_bound: Expr, expr: Expr | None, symbol: Expr):
         return self.integral_lower_bound_first(lower_bound, upper_bound, expr, symbol)
@@ -219,31 +228,31 @@ class FunctionsTransformer(Transformer):
         symbols = list(sorted(expr.free_symbols, key=str))
         
         if isinstance(expr, Symbol):
-            func_def = self.__definitions_store.get_function_definition(self.__definitions_store.deserialize_function(str(expr)))
+            func_def = self._definitions_store.get_function_definition(self._definitions_store.deserialize_function(str(expr)))
             
             if func_def is not None:
                 symbols = func_def.args
                 expr = func_def.get_body()
         
-        return self._try_raise_exponent(Matrix(derive_by_array(expr, symbols)), exponent)
+        return self._try_raise_exponent(Matrix([ Derivative(expr, symbol) for symbol in symbols ]), exponent)
 
     def hessian(self, exponent: Expr | None, expr: Expr) -> Expr:
         symbols = list(sorted(expr.free_symbols, key=str))
         
         if isinstance(expr, Symbol):
-            func_def = self.__definitions_store.get_function_definition(self.__definitions_store.deserialize_function(str(expr)))
+            func_def = self._definitions_store.get_function_definition(self._definitions_store.deserialize_function(str(expr)))
         
             if func_def is not None:
                 symbols = func_def.args
                 expr = func_def.get_body()
         
-        return self._try_raise_exponent(hessian(expr, symbols), exponent)
+        return self._try_raise_exponent(Matrix(len(symbols), len(symbols), lambda i, j: Derivative(expr, symbols[i], symbols[j])), exponent)
         
     def jacobian(self, exponent: Expr | None, matrix: Expr) -> Expr:
         symbols = list(sorted(matrix.free_symbols, key=str))
         
         if isinstance(matrix, Symbol):
-            func_def = self.__definitions_store.get_function_definition(self.__definitions_store.deserialize_function(str(matrix)))
+            func_def = self._definitions_store.get_function_definition(self._definitions_store.deserialize_function(str(matrix)))
         
             if func_def is not None:
                 symbols = func_def.args
@@ -260,7 +269,7 @@ class FunctionsTransformer(Transformer):
         gradients = []
         
         for item in matrix:
-            gradients.append(Matrix([derive_by_array(item, symbols)]))
+            gradients.append(Matrix([[ Derivative(item, symbol) for symbol in symbols ]]))
         
         return self._try_raise_exponent(Matrix.vstack(*gradients), exponent)
     
@@ -301,9 +310,28 @@ class FunctionsTransformer(Transformer):
         else:
             return arg
 
+    # Apply the given function to every element of the given matrix, or to the given value itself, if it is not a matrix.
+    # Used for unevaluated calculus operations, which do not support matrices.
+    def _apply_elementwise(self, obj: Basic, func: Callable[[Expr], Expr]) -> Basic:
+        if isinstance(obj, MatrixBase):
+            return obj.applyfunc(func)
+        return func(obj)
+
     # If the given object is not a matrix, try to construct a 0d Matrix containing the given value.
     # If it is already a matrix, returns the matrix without modifying it in any way.
     def _ensure_matrix(self, obj: Basic) -> MatrixBase:
         if not hasattr(obj, "is_Matrix") or not obj.is_Matrix:
             return Matrix([obj])
         return obj
+
+# The operations left unevaluated by the FunctionsTransformer.
+DEFERRED_OPERATIONS = (Integral, Limit, Derivative)
+
+# Evaluate only the limits, derivatives and integrals left unevaluated by the FunctionsTransformer in the given expression,
+# for handlers which should not evaluate anything else, e.g. sums or the relations themselves.
+def doit_deferred(expr: Basic) -> Basic:
+    if isinstance(expr, Relational):
+        return expr.func(doit_deferred(expr.lhs), doit_deferred(expr.rhs), evaluate=False)
+    
+    # inner operations are replaced first, so each operation is evaluated on its own.
+    return expr.replace(lambda e: isinstance(e, DEFERRED_OPERATIONS), lambda e: e.doit(deep=False))
\ No newline at end of file
@@ -1,16 +1,19 @@
 import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
+from functools import partial
 from typing import Iterator
 
 import sympy_client.UnitsUtils as UnitUtils
-from lark import Token, v_args
-from sympy import *
-from sympy import Expr
-from sympy.core.numbers import Float, Integer
-from sympy.logic.boolalg import *
+from lark import Token, Tree, v_args
+from sympy import (Add, Dummy, Eq, Expr, Function, Ge, Gt, Le, Lt, Matrix, Mul,
+                   Ne, Pow, Rel, S, Symbol, evaluate)
+from sympy.core.numbers import Float, Integer, Number
 from sympy.physics.units import Quantity
 from sympy_client.grammar.SympyParser import DefinitionStore
-from sympy_client.grammar.SystemOfExpr import SystemOfExpr
+from sympy_client.grammar.SystemOfExpr import LazyExpr, SystemOfExpr
+from sympy_client.PhaseTimer import timed_phase
 
 from .ConstantsTransformer import ConstantsTransformer
 from .FunctionsTransformer import FunctionsTransformer
@@ -25,7 +28,6 @@ class LatexTransformer(ConstantsTransformer, FunctionsTransformer):
 
     def __init__(self, definitions_store: DefinitionStore):
         super().__init__(definitions_store)
-        self.__definitions_store = definitions_store
     
     @v_args(inline=True)
     def NUMERIC_DIGIT(self, digit: Token):
@@ -40,18 +42,36 @@ class LatexTransformer(ConstantsTransformer, FunctionsTransformer):
             return Float(number_str)
         return Integer(number_str)
 
-    def system_of_relations(self, relations: list[Expr]) -> SystemOfExpr:
+    def _transform_tree(self, tree: Tree):
+        if tree.data == 'system_of_relations':
+            return self._system_of_relations(tree)
+        
+        return super()._transform_tree(tree)
+    
+    # the relations of a system are only transformed once they are retreived from it,
+    # e.g. the eval handlers only transform the right hand side of the last line of an align block.
+    def _system_of_relations(self, tree: Tree) -> SystemOfExpr:
         return SystemOfExpr([
-            next(row) # the row iterator should only contain 1 element
-            for is_delim, row in itertools.groupby(relations, lambda t: t == self.Delim.MatDelim)
-            if not is_delim
-            ])
-
-    class system_of_relations_expr:
-        @staticmethod
-        def visit_wrapper(_f, _data, children, meta) -> tuple[Expr]:
             # location data is needed for system_of_expressions handler.
-            return (children[0], meta)
+            (LazyExpr(partial(self._transform_relation, relation), partial(self._transform_relation_rhs, relation)), system_expr.meta)
+            for system_expr in tree.children if isinstance(system_expr, Tree) and system_expr.data == 'system_of_relations_expr'
+            for relation in system_expr.children
+            ])
+    
+    def _transform_relation(self, relation: Tree) -> SystemOfExpr | Expr:
+        with timed_phase('transform'):
+            return self.transform(relation)
+    
+    # transform the right hand side of the last relation in the given relation tree, see relation.
+    def _transform_relation_rhs(self, relation: Tree) -> Expr:
+        rhs = relation.children[-1]
+        
+        # a trailing relation operator has no right hand side.
+        if isinstance(rhs, Token):
+            return Dummy()
+        
+        with timed_phase('transform'):
+            return next(self._transform_children([ rhs ]))
 
     @v_args(meta=True)
     def relation(self, meta, tokens: list[Expr|Token]) -> SystemOfExpr | Expr:
@@ -99,12 +119,19 @@ class LatexTransformer(ConstantsTransformer, FunctionsTransformer):
         if len(signs) != len(values):
             raise RuntimeError(f"Error, too few signs were present in expression, expected {len(values) - 1} - {len(values)} got {len(signs)}")
         
-        result = signs[0] * values[0]
+        terms = [ sign * value for sign, value in zip(signs, values) ]
+        
+        # adding the terms one at a time canonicalizes every partial sum, which is quadratic in the number of terms,
+        # so scalar terms are summed in a single Add instead.
+        if all(map(self._is_scalar_expr, terms)):
+            return Add(*self._flatten_args(terms, Add))
+        
+        result = terms[0]
         
         # TODO: perhaps scalars should be autoconverted to 0d matrices here,
         # if it is attempted to sum a matrix and a scalar.
-        for sign, value in zip(signs[1:], values[1:]):
-            result += sign * value
+        for term in terms[1:]:
+            result += term
         
         return result
     
@@ -113,7 +140,9 @@ class LatexTransformer(ConstantsTransformer, FunctionsTransformer):
         # tokens is a list of sympy expressions, representing factors,
         # separated by a multiplication / division token.
         
-        result = tokens[0]
+        first_factor = tokens[0]
+        # the remaining factors, and whether they multiply or divide the product.
+        factors: list[tuple[Expr, bool]] = []
         
         i = 1
         while i < len(tokens):
@@ -130,16 +159,41 @@ class LatexTransformer(ConstantsTransformer, FunctionsTransformer):
             factor = tokens[i]
             i += 1
             
-            if operator.type == 'OPERATOR_MUL':
-                result *= sign * factor
-            elif operator.type == 'OPERATOR_DIV':
-                result /= sign * factor
-            else:
+            if operator.type not in ('OPERATOR_MUL', 'OPERATOR_DIV'):
                 raise RuntimeError(f"Unknown term operator '{operator.type}'")
+            
+            factors.append((sign * factor, operator.type == 'OPERATOR_DIV'))
+        
+        result = first_factor
+        
+        # a number divided by a number is computed directly, and not as a multiplication by its inverse,
+        # which rounds floats differently, so leading numbers are still combined one at a time.
+        while len(factors) > 0 and isinstance(result, Number) and isinstance(factors[0][0], Number):
+            factor, is_division = factors.pop(0)
+            result = result / factor if is_division else result * factor
+        
+        # as with sums, the remaining factors are multiplied in a single Mul, where a division is a multiplication by the inverse.
+        if self._is_scalar_expr(result) and all(self._is_scalar_expr(factor) for factor, _ in factors):
+            operands = self._flatten_args([ result, *( Pow(factor, S.NegativeOne) if is_division else factor for factor, is_division in factors ) ], Mul)
+            
+            if all(map(self._is_mul_operand, operands)):
+                return Mul(*operands)
+        
+        for factor, is_division in factors:
+            if is_division:
+                result /= factor
+            else:
+                result *= factor
         
         return result
     
     def implicit_multiplication(self, factors: list[Expr]) -> Expr:
+        if all(map(self._is_scalar_expr, factors)):
+            operands = self._flatten_args(factors, Mul)
+            
+            if all(map(self._is_mul_operand, operands)):
+                return Mul(*operands)
+        
         result = S.One
         
         for token in factors:
@@ -147,6 +201,26 @@ class LatexTransformer(ConstantsTransformer, FunctionsTransformer):
         
         return result
     
+    # Whether the given value can be passed directly to Add and Mul.
+    # Matrices and non sympy expressions instead rely on their own arithmetic operators.
+    @staticmethod
+    def _is_scalar_expr(value) -> bool:
+        return isinstance(value, Expr) and not value.is_Matrix
+    
+    # Whether the given flattened operand can be multiplied in a single Mul, with the same result as multiplying the factors one at a time.
+    # A number multiplied by a sum is distributed over it, e.g. 2 (x + 1) is 2 x + 2, but only if they are the only two factors,
+    # so products of sums are still multiplied one at a time, to distribute the same numbers as they would have been.
+    @staticmethod
+    def _is_mul_operand(value: Expr) -> bool:
+        return not value.is_Add and not (value.is_Pow and value.base.is_Add)
+    
+    # Replace commutative operands which are themselves of the given operation with their arguments.
+    # The operation then combines numeric coefficients in the order they are written,
+    # like when applying it one operand at a time, so float results are rounded the same way.
+    @staticmethod
+    def _flatten_args(operands: list[Expr], operation: type[Add] | type[Mul]) -> list[Expr]:
+        return [ arg for operand in operands for arg in (operand.args if isinstance(operand, operation) and operand.is_commutative else (operand,)) ]
+    
     @v_args(inline=True)
     def exponentiation(self, base: Expr, exponent: Expr) -> Expr:
         # special matrix notation.
@@ -160,11 +234,11 @@ class LatexTransformer(ConstantsTransformer, FunctionsTransformer):
     
     @v_args(inline=True)
     def symbol(self, *symbol_strings: str) -> Symbol:
-        return self.__definitions_store.deserialize_symbol(''.join(map(str, symbol_strings)))
+        return self._definitions_store.deserialize_symbol(''.join(map(str, symbol_strings)))
     
     @v_args(inline=True)
     def substitute_symbol(self, symbol: Symbol) -> Symbol | Expr:
-        substituted_value = self.__definitions_store.get_symbol_definition(symbol)
+        substituted_value = self._definitions_store.get_symbol_definition(symbol)
         
         if substituted_value is not None:
             return substituted_value
@@ -174,9 +248,9 @@ class LatexTransformer(ConstantsTransformer, FunctionsTransformer):
     @v_args(inline=True)
     def undefined_function(self, func_name: Token, func_args: Iterator[Expr]) -> Function | Expr:
         func_name = func_name.value[:-1] # remove the suffixed parenthesees
-        func = self.__definitions_store.deserialize_function(func_name)
+        func = self._definitions_store.deserialize_function(func_name)
         
-        func_definition = self.__definitions_store.get_function_definition(func)
+        func_definition = self._definitions_store.get_function_definition(func)
         
         if func_definition:
             return func_definition.call(*func_args)
@@ -257,3 +331,54 @@ class LatexTransformer(ConstantsTransformer, FunctionsTransformer):
                     return Ge(left, right)
                 case _:
                     raise RuntimeError(f"Unknown relation type '{relation_type}' between {left} and {right}")
+
+
+# Raised by the TreelessLatexTransformer when a rule needs the positions of its expressions in the latex string,
+# which are only available when transforming a parse tree built with propagate_positions.
+class PositionsRequiredError(Exception):
+    pass
+
+# The definitions store of the parse currently being transformed by a TreelessLatexTransformer in this context.
+_treeless_definitions_store: ContextVar[DefinitionStore] = ContextVar('_treeless_definitions_store')
+
+# The TreelessLatexTransformer is embedded in the lalr parser, so sympy expressions are constructed as rules are reduced,
+# instead of first building a parse tree, and then transforming it.
+# The callbacks of an embedded transformer are built once per parser, so the transformer is shared between all parses,
+# and each parse provides its definitions store through use_definitions_store instead.
+#
+# Relations and systems of relations need the positions of their expressions, which are not tracked while parsing,
+# so they raise a PositionsRequiredError, and should be parsed into a tree with positions instead.
+class TreelessLatexTransformer(LatexTransformer):
+    def __init__(self):
+        pass
+
+    @property
+    def _definitions_store(self) -> DefinitionStore:
+        return _treeless_definitions_store.get()
+
+    # Transform every rule reduced in this context in the given definitions store.
+    @staticmethod
+    @contextmanager
+    def use_definitions_store(definitions_store: DefinitionStore):
+        context_token = _treeless_definitions_store.set(definitions_store)
+
+        try:
+            yield
+        finally:
+            _treeless_definitions_store.reset(context_token)
+
+    def relation(self, tokens: list[Expr|Token]) -> Expr:
+        # chained relations are a system of expressions, whose location data is not available.
+        relation = super().relation(None, tokens)
+
+        if isinstance(relation, SystemOfExpr):
+            raise PositionsRequiredError()
+
+        return relation
+
+    # systems of relations are detected as soon as they begin, so none of their relations are transformed here.
+    def _CMD_BEGIN_ALIGN(self, _token: Token):
+        raise PositionsRequiredError()
+    
+    def _CMD_BEGIN_CASES(self, _token: Token):
+        raise PositionsRequiredError()
@@ -0,0 +1,63 @@
+import sympy_client.grammar.LmatEnvDefStoreCache as LmatEnvDefStoreCacheModule
+from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy_client.command_handlers.BatchHandler import *
+from sympy_client.command_handlers.CommandHandler import handle_message
+from sympy_client.command_handlers.ConvertUnitsHandler import *
+from sympy_client.command_handlers.EvalfHandler import *
+from sympy_client.command_handlers.EvalHandler import *
+from sympy_client.grammar.LatexParser import LatexParser
+
+
+## Tests the batch mode.
+class TestBatch:
+    parser = LatexParser()
+
+    def _create_handler(self):
+        return BatchHandler(self.parser, {
+            "eval": EvalHandler(self.parser),
+            "evalf": EvalfHandler(self.parser),
+            "convert-units": ConvertUnitsHandler(self.parser),
+        })
+
+    def test_batch(self):
+        handler = self._create_handler()
+
+        partial_payloads = []
+        payload = handle_message(handler, {
+            "environment": { "variables": { "a": "2" }, "unit_system": "MKS" },
+            "items": [
+                { "mode": "eval", "expression": "a + a" },
+                { "mode": "evalf", "expression": r"\frac{a}{4}" },
+                { "mode": "unknown", "expression": "a" },
+                { "mode": "eval", "expression": r"\frac{a}{" },
+                { "mode": "convert-units", "expression": "a {km}", "target_units": [ "m" ] },
+            ]
+        }, partial_payloads.append)
+
+        assert payload['result'] == dict(item_count=5)
+
+        assert [ p['metadata']['index'] for p in partial_payloads ] == [ 0, 1, 2, 3, 4 ]
+        assert [ p['status'] for p in partial_payloads ] == [ "success", "success", "error", "error", "success" ]
+        assert partial_payloads[0]['result'] == "4"
+        assert partial_payloads[1]['result'] == "0.5"
+        assert partial_payloads[4]['result'] == "2000 \\, {m}"
+
+    def test_shared_definitions_store(self, monkeypatch):
+        store_count = 0
+
+        class CountingDefStore(LmatEnvDefStore):
+            def __init__(self, *args, **kwargs):
+                nonlocal store_count
+                store_count += 1
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(LmatEnvDefStoreCacheModule, "LmatEnvDefStore", CountingDefStore)
+
+        handler = self._create_handler()
+        result = handler.handle({
+            "environment": { "variables": { "a": "2" } },
+            "items": [ { "mode": "eval", "expression": f"a + {i}" } for i in range(10) ]
+        })
+
+        assert [ p['result'] for p in result.stream() ] == [ str(2 + i) for i in range(10) ]
+        assert store_count == 1
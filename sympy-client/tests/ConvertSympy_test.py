@@ -15,3 +15,13 @@ class TestConvertSympy:
         result = handler.handle({"expression": "a + b", "environment": {}})
 
         assert result.sympy_expr == a + b
+    
+    def test_convert_unevaluated(self):
+        x, t = symbols("x t")
+        
+        handler = ConvertSympyHandler(self.parser)
+        
+        # integrals, limits and derivatives are only evaluated by handlers which evaluate the expression.
+        result = handler.handle({"expression": r"\int_0^1 e^{x^2} d x + \lim_{t \to 0} \frac{\sin t}{t} + \frac{d}{d x} f", "environment": { "variables": { "f": r"\int x^2 \sin x d x" } }})
+
+        assert result.sympy_expr == Integral(exp(x**2), (x, 0, 1)) + Limit(sin(t) / t, t, 0, '+-') + Derivative(Integral(x**2 * sin(x), x), x)
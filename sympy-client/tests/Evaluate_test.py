@@ -47,6 +47,21 @@ class TestEvaluate:
         
         assert result.sympy_expr == 2 * Matrix([[1, 2], [3, 4]])
         
+    def test_multi_line_only_evaluated_side(self):
+        handler = EvalHandler(self.parser)
+        
+        # a matrix plus a scalar cannot be transformed,
+        # but only the right hand side of the last line is evaluated, so the rest should not be transformed.
+        result = handler.handle({"expression": r"""
+        \begin{align}
+        x &= \begin{bmatrix} 1 & 2 \end{bmatrix} + 1 \\
+        \begin{bmatrix} 1 \end{bmatrix} + 1 &= 2 + 3
+        \end{align}
+        """, "environment": {}})
+        
+        assert result.sympy_expr == 5
+        assert result.expr_lines == (4, 4)
+        
     def test_matrix_normal(self):
         handler = EvalHandler(self.parser)
         result = handler.handle({"expression": r"""
@@ -277,6 +292,21 @@ class TestEvaluate:
             }
         })
         assert result.sympy_expr == Matrix([[125]])
+
+        # Function whose body is undefined for its input
+        for body in [ r"\frac{x}{x}", r"0\cdot\frac{1}{x}" ]:
+            result = handler.handle({
+                "expression": "f(0)",
+                "environment": {
+                    "functions": {
+                        "f": {
+                            "args": ["x"],
+                            "expr": body
+                        }
+                    }
+                }
+            })
+            assert result.sympy_expr is S.NaN
     
     def test_hessian(self):
         handler = EvalHandler(self.parser)
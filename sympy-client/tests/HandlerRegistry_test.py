@@ -0,0 +1,52 @@
+import pytest
+from sympy_client.HandlerRegistry import HandlerRegistry
+
+from .WorkerPool_test import EchoHandler
+
+constructed_handler_count = 0
+
+def create_counting_handler() -> EchoHandler:
+    global constructed_handler_count
+    constructed_handler_count += 1
+    return EchoHandler()
+
+
+## Tests the lazy handler registration.
+class TestHandlerRegistry:
+
+    def test_lazy_handler(self):
+        global constructed_handler_count
+        constructed_handler_count = 0
+
+        registry = HandlerRegistry({ "echo": f"{__name__}:create_counting_handler" })
+
+        assert "echo" in registry
+        assert registry.keys() == [ "echo" ]
+        assert constructed_handler_count == 0
+
+        handler = registry.get_handler("echo")
+
+        assert isinstance(handler, EchoHandler)
+        assert registry.get_handler("echo") is handler
+        assert constructed_handler_count == 1
+
+    def test_direct_handler(self):
+        handler = EchoHandler()
+        registry = HandlerRegistry()
+        registry.register_handler("echo", handler)
+
+        assert registry.get_handler("echo") is handler
+
+    def test_invalid_path(self):
+        registry = HandlerRegistry({ "echo": "tests.WorkerPool_test.EchoHandler" })
+
+        with pytest.raises(ValueError):
+            registry.get_handler("echo")
+
+    def test_default_handlers(self):
+        from sympy_client.HandlerFactories import create_handlers
+
+        registry = HandlerRegistry(create_handlers())
+
+        assert registry.get_handler("eval").handle({ "expression": "1 + 1", "environment": {} }).sympy_expr == 2
+        assert registry.get_handler("batch") is not None
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+# Cold start budget of SympyClient.py, that is the time it takes to import it before it can connect to the plugin,
+# as a fraction of the time it takes to import sympy, which the client process never does.
+# Both are measured in the same run, so the budget does not depend on how fast, or how busy, the machine is.
+IMPORT_TIME_BUDGET_RATIO = 0.5
+
+SYMPY_CLIENT_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+# Import the given module in a fresh interpreter with -X importtime, and return its cumulative import time in microseconds.
+def measure_import_time(module_name: str) -> int:
+    import_process = subprocess.run(
+        [ sys.executable, "-X", "importtime", "-c", f"import {module_name}" ],
+        cwd=SYMPY_CLIENT_DIR, capture_output=True, text=True, check=True
+    )
+
+    # each line is formatted as 'import time: self [us] | cumulative | imported package'.
+    for line in import_process.stderr.splitlines():
+        _, cumulative_us, imported_module = line.split("|")
+
+        if imported_module.strip() == module_name:
+            return int(cumulative_us)
+
+    raise AssertionError(f"{module_name} was not found in the import time report")
+
+
+## Tests the cold start of the sympy client.
+class TestImportTime:
+
+    def test_sympy_client_import_time(self):
+        # the imports are interleaved, and the fastest of a few runs of each is used,
+        # so a slow period on a busy machine affects both, or neither, of them.
+        client_times_us, sympy_times_us = zip(*[ (measure_import_time("SympyClient"), measure_import_time("sympy")) for _ in range(3) ])
+        import_time_ratio = min(client_times_us) / min(sympy_times_us)
+
+        assert import_time_ratio < IMPORT_TIME_BUDGET_RATIO, f"Importing SympyClient.py took {import_time_ratio:.2f} times as long as importing sympy, which exceeds the budget of {IMPORT_TIME_BUDGET_RATIO}"
+
+    def test_sympy_client_does_not_import_sympy(self):
+        # sympy is only imported by the worker processes.
+        import_process = subprocess.run(
+            [ sys.executable, "-c", "import sys, SympyClient; print('sympy' in sys.modules)" ],
+            cwd=SYMPY_CLIENT_DIR, capture_output=True, text=True, check=True
+        )
+
+        assert import_process.stdout.strip() == "False"
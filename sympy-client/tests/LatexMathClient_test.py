@@ -0,0 +1,310 @@
+import asyncio
+import json
+import threading
+from typing import override
+
+import websockets
+from sympy_client.command_handlers.CommandHandler import (CommandHandler,
+                                                          CommandResult)
+from sympy_client.LatexMathClient import LatexMathClient
+from sympy_client.WorkerPool import WorkerPool
+
+from .WorkerPool_test import CountHandler, create_test_handlers, wait_exited
+
+
+class EchoResult(CommandResult):
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(self.value)
+
+# Echoes the 'value' key of its message, after waiting for the given event to be set, if any.
+class EchoHandler(CommandHandler):
+    def __init__(self, release_event: threading.Event | None = None):
+        super().__init__()
+        self.release_event = release_event
+
+    @override
+    def handle(self, message: dict) -> EchoResult:
+        if self.release_event is not None:
+            self.release_event.wait(timeout=10)
+        return EchoResult(message['value'])
+
+# Echoes the environment of its message.
+class EnvironmentHandler(CommandHandler):
+    @override
+    def handle(self, message: dict) -> EchoResult:
+        return EchoResult(message['environment'])
+
+# Hosts a websocket server, playing the role of the Latex Math plugin,
+# and runs the given coroutine with the connection to a LatexMathClient running its message loop.
+# The client is sent an exit message afterwards, unless send_exit is False, in which case the coroutine must send it.
+async def run_with_client(client: LatexMathClient, plugin_coroutine, send_exit: bool = True):
+    connection_future = asyncio.get_running_loop().create_future()
+
+    async def on_connection(connection):
+        connection_future.set_result(connection)
+        await connection.wait_closed()
+
+    async with websockets.serve(on_connection, "localhost", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        await client.connect(port)
+        message_loop = asyncio.create_task(client.run_message_loop())
+        connection = await connection_future
+
+        await plugin_coroutine(connection)
+
+        if send_exit:
+            await connection.send("exit|{}")
+            assert (await connection.recv()).startswith("exit|")
+
+        await message_loop
+        await client.connection.close()
+
+async def receive(connection) -> tuple[str, dict]:
+    handler_key, payload = (await asyncio.wait_for(connection.recv(), 10)).split("|", 1)
+    return handler_key, json.loads(payload)
+
+
+class TestLatexMathClient:
+
+    def test_legacy_framing(self):
+        client = LatexMathClient()
+        client.register_handler("echo", EchoHandler())
+
+        async def plugin(connection):
+            await connection.send("echo|" + json.dumps({ "value": 1 }))
+            handler_key, payload = await receive(connection)
+
+            assert handler_key == "result"
+            assert payload['result'] == 1
+            assert 'request_id' not in payload
+
+            await connection.send("unknown|{}")
+            handler_key, payload = await receive(connection)
+
+            assert handler_key == "error"
+            assert payload['message'] == "unknown"
+
+        asyncio.run(run_with_client(client, plugin))
+
+    def test_environment_sessions(self):
+        client = LatexMathClient()
+        client.register_handler("environment", EnvironmentHandler())
+
+        async def plugin(connection):
+            await connection.send("env-open|" + json.dumps({ "session_id": "note", "environment": { "variables": { "a": "1", "b": "2" }, "domain": "Reals" } }))
+            assert (await receive(connection))[1]['result'] == dict(session_id="note", open=True)
+
+            await connection.send("env-update|" + json.dumps({ "session_id": "note", "variables": { "a": "3", "b": None, "c": "4" }, "domain": None, "unit_system": "SI" }))
+            assert (await receive(connection))[0] == "result"
+
+            await connection.send("environment|" + json.dumps({ "session_id": "note" }))
+            assert (await receive(connection))[1]['result'] == { "variables": { "a": "3", "c": "4" }, "unit_system": "SI" }
+
+            # an environment in the message takes precedence over its session.
+            await connection.send("environment|" + json.dumps({ "session_id": "note", "environment": {} }))
+            assert (await receive(connection))[1]['result'] == {}
+
+            await connection.send("env-close|" + json.dumps({ "session_id": "note" }))
+            assert (await receive(connection))[1]['result'] == dict(session_id="note", open=False)
+
+            await connection.send("environment|" + json.dumps({ "session_id": "note" }))
+            assert await receive(connection) == ("error", dict(message="Unknown environment session: note"))
+
+            await connection.send("env-update|" + json.dumps({ "session_id": "note", "variables": {} }))
+            assert (await receive(connection))[1]['status'] == "error"
+
+        asyncio.run(run_with_client(client, plugin))
+
+    def test_exit_cancels_pending_requests(self):
+        worker_pool = WorkerPool(create_test_handlers, worker_count=1)
+        client = LatexMathClient(worker_pool=worker_pool)
+
+        async def plugin(connection):
+            await connection.send("pid|{}")
+            worker_pid = (await receive(connection))[1]['result']
+
+            # a runaway legacy request, and one waiting for it, neither of which holds up the exit.
+            await connection.send("spin|" + json.dumps({ "seconds": 60 }))
+            await connection.send("echo|" + json.dumps({ "value": 1 }))
+            # let the worker pick up the runaway request.
+            await asyncio.sleep(0.5)
+            await connection.send("exit|{}")
+
+            assert [ (await receive(connection))[1]['status'] for _ in range(2) ] == [ "cancelled", "cancelled" ]
+            assert (await receive(connection))[0] == "exit"
+
+            # the worker running the runaway request is killed.
+            assert wait_exited(worker_pid)
+
+        try:
+            asyncio.run(run_with_client(client, plugin, send_exit=False))
+        finally:
+            worker_pool.shutdown()
+
+    def test_worker_pool_sessions(self):
+        worker_pool = WorkerPool(create_test_handlers, worker_count=1)
+        client = LatexMathClient(worker_pool=worker_pool)
+
+        async def plugin(connection):
+            await connection.send("env-open|" + json.dumps({ "session_id": "note", "environment": { "variables": { "a": "1" } } }))
+            await receive(connection)
+
+            await connection.send("env-update|" + json.dumps({ "session_id": "note", "variables": { "b": "2" } }))
+            await receive(connection)
+
+            await connection.send("environment|" + json.dumps({ "session_id": "note" }))
+            assert (await receive(connection))[1]['result'] == { "variables": { "a": "1", "b": "2" } }
+
+            await connection.send("env-close|" + json.dumps({ "session_id": "note" }))
+            await receive(connection)
+
+            await connection.send("closed-sessions|{}")
+            assert (await receive(connection))[1]['result'] == [ "note" ]
+
+        try:
+            asyncio.run(run_with_client(client, plugin))
+        finally:
+            worker_pool.shutdown()
+
+    def test_out_of_order_replies(self):
+        release_slow = threading.Event()
+
+        client = LatexMathClient()
+        client.register_handler("slow", EchoHandler(release_slow))
+        client.register_handler("fast", EchoHandler())
+
+        async def plugin(connection):
+            await connection.send("slow|" + json.dumps({ "request_id": "a", "value": "slow" }))
+            await connection.send("fast|" + json.dumps({ "request_id": "b", "value": "fast" }))
+            await connection.send("unknown|" + json.dumps({ "request_id": "c" }))
+
+            # the slow request is still blocked, so both of the later requests must be replied to first.
+            replies = { payload['request_id']: (handler_key, payload) for handler_key, payload in [ await receive(connection), await receive(connection) ] }
+            release_slow.set()
+
+            assert replies["b"] == ("result", dict(result="fast", metadata={}, status="success", request_id="b"))
+            assert replies["c"] == ("error", dict(message="unknown", request_id="c"))
+            assert await receive(connection) == ("result", dict(result="slow", metadata={}, status="success", request_id="a"))
+
+        asyncio.run(run_with_client(client, plugin))
+
+    def test_cancel(self):
+        release_blocked = threading.Event()
+
+        client = LatexMathClient()
+        client.register_handler("blocked", EchoHandler(release_blocked))
+        client.register_handler("echo", EchoHandler())
+
+        async def plugin(connection):
+            await connection.send("blocked|" + json.dumps({ "request_id": "a", "value": 1 }))
+            await connection.send("cancel|" + json.dumps({ "request_id": "b", "target_request_id": "a" }))
+
+            replies = { payload['request_id']: payload for _, payload in [ await receive(connection), await receive(connection) ] }
+            release_blocked.set()
+
+            assert replies["a"]['status'] == "cancelled"
+            assert replies["b"]['result'] == dict(cancelled=True)
+
+            await connection.send("cancel|" + json.dumps({ "target_request_id": "a" }))
+            assert (await receive(connection))[1]['result'] == dict(cancelled=False)
+
+            # malformed cancel messages are replied to with an error, and do not stop the message loop.
+            await connection.send("cancel|[]")
+            assert await receive(connection) == ("error", dict(message="message: expected object, got list"))
+
+            await connection.send("cancel|" + json.dumps({ "request_id": "c" }))
+            assert await receive(connection) == ("error", dict(message="message: missing required key 'target_request_id'", request_id="c"))
+
+            await connection.send("echo|" + json.dumps({ "request_id": "d", "value": 2 }))
+            assert (await receive(connection))[1]['result'] == 2
+
+        asyncio.run(run_with_client(client, plugin))
+
+    def test_worker_pool_deadline(self):
+        worker_pool = WorkerPool(create_test_handlers, worker_count=1)
+        client = LatexMathClient(worker_pool=worker_pool)
+
+        async def plugin(connection):
+            await connection.send("spin|" + json.dumps({ "request_id": "a", "deadline_ms": 200, "seconds": 60 }))
+            handler_key, payload = await receive(connection)
+
+            assert handler_key == "result"
+            assert payload['status'] == "timeout"
+            assert payload['request_id'] == "a"
+
+            # the runaway worker should have been replaced, so this is not stuck behind it.
+            await connection.send("echo|" + json.dumps({ "request_id": "b", "value": 2 }))
+            assert (await receive(connection))[1]['result'] == 2
+
+        try:
+            asyncio.run(run_with_client(client, plugin))
+        finally:
+            worker_pool.shutdown()
+
+    def test_streamed_result(self):
+        worker_pool = WorkerPool(create_test_handlers, worker_count=1)
+        client = LatexMathClient(worker_pool=worker_pool)
+        client.register_handler("count", CountHandler())
+
+        async def plugin(connection):
+            for handler_key in [ "count", "count-worker" ]:
+                await connection.send(handler_key + "|" + json.dumps({ "request_id": handler_key, "value": 3 }))
+
+                assert [ await receive(connection) for _ in range(4) ] == [
+                    ("partial", dict(result=0, metadata={}, status="success", request_id=handler_key)),
+                    ("partial", dict(result=1, metadata={}, status="success", request_id=handler_key)),
+                    ("partial", dict(result=2, metadata={}, status="success", request_id=handler_key)),
+                    ("result", dict(result=3, metadata={}, status="success", request_id=handler_key)),
+                ]
+
+        try:
+            asyncio.run(run_with_client(client, plugin))
+        finally:
+            worker_pool.shutdown()
+
+    def test_stats(self):
+        worker_pool = WorkerPool(create_test_handlers, worker_count=1)
+        client = LatexMathClient(worker_pool=worker_pool)
+        client.register_handler("echo", EchoHandler())
+
+        async def plugin(connection):
+            for i in range(3):
+                await connection.send("echo|" + json.dumps({ "value": i }))
+                await receive(connection)
+
+            await connection.send("raise|{}")
+            assert (await receive(connection))[0] == "error"
+
+            await connection.send("echo|" + json.dumps({ "request_id": "a", "value": 0 }))
+            await receive(connection)
+
+            await connection.send("stats|{}")
+            handler_key, payload = await receive(connection)
+
+            assert handler_key == "result"
+
+            handler_stats = payload['result']['handlers']
+
+            assert handler_stats['echo']['count'] == 4
+            assert handler_stats['echo']['error_count'] == 0
+            assert handler_stats['echo']['latency_ms']['samples'] == 4
+            assert 0 <= handler_stats['echo']['latency_ms']['p50'] <= handler_stats['echo']['latency_ms']['p99']
+
+            assert handler_stats['raise']['count'] == 1
+            assert handler_stats['raise']['error_count'] == 1
+
+            processes = payload['result']['processes']
+
+            assert [ process['role'] for process in processes ] == [ "client", "worker" ]
+            assert processes[0]['pid'] != processes[1]['pid']
+            assert processes[1]['rss_bytes'] > 0
+
+        try:
+            asyncio.run(run_with_client(client, plugin))
+        finally:
+            worker_pool.shutdown()
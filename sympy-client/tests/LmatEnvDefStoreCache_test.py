@@ -0,0 +1,101 @@
+from sympy import Function, Interval, Symbol, symbols
+from sympy.physics.units.systems import SI
+from sympy.physics.units.systems.mks import MKS
+from sympy_client.command_handlers.EvalHandler import EvalHandler
+from sympy_client.command_handlers.FactorHandler import FactorHandler
+from sympy_client.grammar.LatexParser import LatexParser
+from sympy_client.grammar.LmatEnvDefStoreCache import LmatEnvDefStoreCache
+
+
+## Tests the cache of definition stores shared between handlers.
+class TestLmatEnvDefStoreCache:
+    parser = LatexParser()
+
+    def test_store_reuse(self):
+        store_cache = LmatEnvDefStoreCache(self.parser)
+        environment = { "symbols": { "x": [ "real", "positive" ] }, "variables": { "a": "x^2 - 1" } }
+
+        eval_handler = EvalHandler(self.parser, store_cache)
+        factor_handler = FactorHandler(self.parser, store_cache)
+
+        assert eval_handler.handle({ "expression": "a", "environment": environment }).getPayload()['result'] == "x^{2} - 1"
+        assert factor_handler.handle({ "expression": "a", "environment": environment }).getPayload()['result'] == r"\left(x - 1\right) \, \left(x + 1\right)"
+
+        # the order of the tables, and of the assumptions, does not change the environment.
+        with store_cache.definitions_store({ "variables": { "a": "x^2 - 1" }, "symbols": { "x": [ "positive", "real" ] } }) as definitions_store:
+            # the variable was resolved by the first command.
+            assert definitions_store._resolver.is_resolved(Symbol("a"))
+            assert definitions_store.deserialize_symbol("x").is_positive
+
+        assert store_cache.get_stats() == dict(size=1, max_size=16, hits=2, misses=1)
+
+    def test_eviction(self):
+        store_cache = LmatEnvDefStoreCache(self.parser, max_size=2)
+
+        for value in [ 1, 2, 1, 3, 2 ]:
+            with store_cache.definitions_store({ "variables": { "a": str(value) } }):
+                pass
+
+        # 2 is evicted by 3, as 1 was used after it.
+        assert store_cache.get_stats() == dict(size=2, max_size=2, hits=1, misses=4)
+
+    def test_store_in_use(self):
+        store_cache = LmatEnvDefStoreCache(self.parser)
+        environment = { "variables": { "a": "2" } }
+
+        with store_cache.definitions_store(environment) as outer_store:
+            with store_cache.definitions_store(environment) as inner_store:
+                assert inner_store is not outer_store
+
+        with store_cache.definitions_store(environment) as definitions_store:
+            assert definitions_store is outer_store
+
+    def test_session_store(self):
+        store_cache = LmatEnvDefStoreCache(self.parser)
+        b, c = symbols('b c')
+
+        environment = { "variables": { "a": "1", "b": "a + 1", "c": "2" }, "functions": { "f": { "args": [ "x" ], "expr": "x + c" } } }
+
+        with store_cache.definitions_store(environment, "note") as session_store:
+            assert self.parser.parse("b + f(c)", session_store) == 6
+
+        # changing a only invalidates b, the store is kept, and c and f are not resolved again.
+        with store_cache.definitions_store(dict(environment, variables=dict(environment['variables'], a="5")), "note") as definitions_store:
+            assert definitions_store is session_store
+            assert not definitions_store._resolver.is_resolved(b)
+            assert definitions_store._resolver.is_resolved(c)
+            assert definitions_store._resolver.is_resolved(Function("f"))
+
+            assert self.parser.parse("b + f(c)", definitions_store) == 10
+
+        # symbols change every symbol of the store, so a new store is built.
+        with store_cache.definitions_store(dict(environment, symbols={ "x": [ "real" ] }), "note") as definitions_store:
+            assert definitions_store is not session_store
+            assert self.parser.parse("b", definitions_store) == 2
+
+        assert store_cache.get_stats() == dict(size=1, max_size=16, hits=1, misses=2)
+
+        # the store of a closed session is evicted.
+        store_cache.evict_session("note")
+        assert store_cache.get_stats()['size'] == 0
+
+    def test_uncached(self):
+        store_cache = LmatEnvDefStoreCache(self.parser, max_size=0)
+
+        with store_cache.definitions_store({}) as first_store:
+            pass
+
+        with store_cache.definitions_store({}) as second_store:
+            assert second_store is not first_store
+
+        assert store_cache.get_stats()['size'] == 0
+
+    def test_domain_and_unit_system(self):
+        store_cache = LmatEnvDefStoreCache(self.parser)
+
+        with store_cache.definitions_store({ "domain": "Interval(0, 1)", "unit_system": "MKS" }) as definitions_store:
+            assert definitions_store.domain == Interval(0, 1)
+            assert definitions_store.unit_system is MKS
+
+        with store_cache.definitions_store({}) as definitions_store:
+            assert definitions_store.unit_system is SI
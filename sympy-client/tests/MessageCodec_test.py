@@ -0,0 +1,56 @@
+import pytest
+from sympy_client import MessageCodec
+from sympy_client.command_handlers.CommandHandler import handle_message
+from sympy_client.command_handlers.EvalHandler import EvalHandler
+from sympy_client.command_handlers.EvalHandlerBase import EvaluateMessage
+from sympy_client.command_handlers.SolveHandler import (SolveHandler,
+                                                        SolveModeMessage)
+from sympy_client.grammar.LatexParser import LatexParser
+from sympy_client.MessageCodec import MessageValidationError
+
+
+class TestMessageCodec:
+
+    def test_round_trip(self):
+        message = {
+            "expression": r"\frac{a}{b}",
+            "environment": {
+                "symbols": { "a": [ "real" ] },
+                "variables": { "b": "2" },
+                "functions": { "f": { "args": [ "x" ], "expr": "x^2" } },
+                "unit_system": "SI",
+            },
+        }
+
+        assert MessageCodec.decode(MessageCodec.encode(message), EvaluateMessage) == message
+
+    def test_optional_and_unknown_keys(self):
+        # environment keys are all optional, and unknown keys are ignored.
+        assert MessageCodec.decode('{"expression": "x", "environment": {}, "extra": 1}', EvaluateMessage)['extra'] == 1
+        assert MessageCodec.decode('{"expression": "x", "environment": {}, "symbols": ["x"]}', SolveModeMessage)['symbols'] == [ "x" ]
+
+    def test_null_settings(self):
+        # a null unit system or domain is the same as leaving it out.
+        payload = '{"expression": "x^2 = 1", "environment": {"unit_system": null, "domain": null}, "symbols": ["x"]}'
+
+        message = MessageCodec.decode(payload, EvaluateMessage)
+        assert message['environment'] == { "unit_system": None, "domain": None }
+
+        solve_handler = SolveHandler(LatexParser())
+        assert handle_message(solve_handler, MessageCodec.decode(payload, SolveModeMessage)) == handle_message(solve_handler, { "expression": "x^2 = 1", "environment": {}, "symbols": [ "x" ] })
+
+        eval_handler = EvalHandler(LatexParser())
+        assert handle_message(eval_handler, { "expression": "{km} + {m}", "environment": { "unit_system": None } })['result'] == handle_message(eval_handler, { "expression": "{km} + {m}", "environment": {} })['result']
+
+    def test_invalid_messages(self):
+        with pytest.raises(MessageValidationError, match="missing required key 'expression'"):
+            MessageCodec.decode('{"environment": {}}', EvaluateMessage)
+
+        with pytest.raises(MessageValidationError, match=r"message\.environment\.variables\.b"):
+            MessageCodec.decode('{"expression": "x", "environment": {"variables": {"b": 2}}}', EvaluateMessage)
+
+        with pytest.raises(MessageValidationError, match=r"message\.symbols\[1\]"):
+            MessageCodec.decode('{"expression": "x", "environment": {}, "symbols": ["x", null]}', SolveModeMessage)
+
+        with pytest.raises(MessageValidationError, match=r"args"):
+            MessageCodec.decode('{"expression": "x", "environment": {"functions": {"f": {"args": "x", "expr": "x"}}}}', EvaluateMessage)
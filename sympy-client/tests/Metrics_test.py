@@ -0,0 +1,46 @@
+import sympy_client.Metrics as Metrics
+from sympy_client.Metrics import (MetricsRegistry, process_stats,
+                                  register_cache_stats)
+
+
+## Tests the metrics recorded for the stats handler.
+class TestMetrics:
+
+    def test_latency_percentiles(self):
+        metrics = MetricsRegistry()
+
+        for i in range(1, 101):
+            metrics.record("eval", "success", i / 1000)
+
+        stats = metrics.get_stats()["eval"]
+
+        assert stats['count'] == 100
+        assert stats['error_count'] == 0
+        assert stats['latency_ms'] == dict(p50=50, p95=95, p99=99, max=100, samples=100)
+
+    def test_rolling_window(self):
+        metrics = MetricsRegistry(window_size=10)
+
+        for _ in range(100):
+            metrics.record("eval", "success", 1)
+
+        for _ in range(10):
+            metrics.record("eval", "error", 0.001)
+
+        stats = metrics.get_stats()["eval"]
+
+        # the counts cover every request, while the latencies only cover the last window.
+        assert stats['count'] == 110
+        assert stats['error_count'] == 10
+        assert stats['status_counts'] == dict(success=100, error=10)
+        assert stats['latency_ms']['max'] == 1
+
+    def test_process_stats(self, monkeypatch):
+        monkeypatch.setattr(Metrics, "_cache_stats_providers", {})
+        register_cache_stats("test-cache", lambda: dict(size=1))
+
+        stats = process_stats()
+
+        assert stats['rss_bytes'] > 0
+        assert stats['caches']['test-cache'] == dict(size=1)
+        assert set(stats['caches']['sympy'].keys()) == { "size", "hits", "misses" }
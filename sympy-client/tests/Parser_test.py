@@ -1,8 +1,15 @@
+import os
+import shutil
+
+import pytest
+
 from sympy import *
+from sympy.core.cache import clear_cache
 from sympy_client.grammar.LatexParser import LatexParser
 from sympy_client import LmatEnvironment
 from sympy_client.grammar.SystemOfExpr import SystemOfExpr
 from sympy_client.grammar.LmatEnvDefStore import LmatEnvDefStore
+from sympy_client.grammar.DefinitionResolver import CyclicDefinitionError
 
 
 class TestParse:
@@ -222,6 +229,22 @@ i & 2 i
         
         assert result == s_a + s_b * s_c + sqrt(s_e**s_f) + s_d**-1
 
+    def test_interned_symbols(self):
+        parser = LatexParser()
+        environment = { "symbols": { "x": [ "real" ] } }
+        
+        first_store = LmatEnvDefStore(parser, environment)
+        second_store = LmatEnvDefStore(parser, environment)
+        
+        # stores with the same assumptions deserialize the same instances, even after sympy's cache is cleared.
+        assert first_store.deserialize_symbol("x") is first_store.deserialize_symbol("x")
+        clear_cache()
+        assert second_store.deserialize_symbol("x") is first_store.deserialize_symbol("x")
+        assert second_store.deserialize_symbol("y") is first_store.deserialize_symbol("y")
+        
+        assert first_store.deserialize_symbol("x").is_real
+        assert LmatEnvDefStore(parser, {}).deserialize_symbol("x") is not first_store.deserialize_symbol("x")
+    
     def test_symbol_definitions(self):
         result = self._parse_expr(r"x", { "symbols": { "x": [ "real" ] } })
         assert result == symbols("x", real=True)
@@ -267,4 +290,219 @@ i & 2 i
     def test_percent_permille(self):
         result = self._parse_expr(r"25\% - 5\textperthousand")
         
-        assert abs(result - (0.25 - 0.005)) <= 1e-14
\ No newline at end of file
+        assert abs(result - (0.25 - 0.005)) <= 1e-14        
+    
+    def test_deeply_nested_scopes(self):
+        latex_str = "x"
+        
+        # deeper than the recursion limit, which the post lexer should not be bounded by.
+        for i in range(1500):
+            latex_str = rf"\left( {i} + {latex_str} \right)"
+        
+        assert self.parser.parser.parse(latex_str) is not None
+        
+        result = self._parse_expr(r"\frac{1}{1 + \frac{2}{|\left( 2 - |x| \right)|}}")
+        
+        assert result == 1 / (1 + 2 / Abs(2 - Abs(Symbol('x'))))
+    
+    def test_long_sums_and_products(self):
+        x, y = symbols('x y')
+        
+        result = self._parse_expr(" + ".join(rf"{i} x^{{{i}}}" for i in range(1, 2001)) + " - 0.1 - 0.2")
+        
+        assert result == Add(*[ i * x**i for i in range(1, 2001) ]) - 0.1 - 0.2
+        
+        result = self._parse_expr(r" \cdot ".join(rf"x_{{{i}}}^{{{i}}}" for i in range(1, 1001)))
+        
+        assert result == Mul(*[ Symbol(f"x_{{{i}}}")**i for i in range(1, 1001) ])
+        
+        # numbers are distributed over sums, as if the factors were multiplied one at a time.
+        assert self._parse_expr(r"2 (x + 1) y") == y * (2 * x + 2)
+        assert self._parse_expr(r"x (x + 1) / 2.5 x / 1.1 y") == (x * (x + 1)) / (2.5 * x) / (1.1 * y)
+        # and numbers divided by numbers are rounded the same way.
+        assert self._parse_expr(r"0.3 / 0.1 \cdot x") == (Float(0.3) / Float(0.1)) * x
+        
+        matrix = self._parse_expr(r"2 \begin{bmatrix} 1 & 2 \end{bmatrix} \cdot 3 + \begin{bmatrix} 1 & 1 \end{bmatrix} + \begin{bmatrix} x & y \end{bmatrix}")
+        
+        assert matrix == Matrix([[ 7 + x, 13 + y ]])
+    
+    def test_function_template(self):
+        parser = LatexParser()
+        x, y = symbols('x y')
+        
+        environment = {
+            "functions": {
+                "f": { "args": [ "x" ], "expr": r"x^2 + \sin(x)" },
+                "g": { "args": [ "x", "n" ], "expr": r"\sin^{n}(x) + |x|" },
+            }
+        }
+        
+        # the body of f is parsed once into each of its templates, and then substituted into for every call.
+        assert parser.parse("f(1) + f(2) + f(y)", LmatEnvDefStore(parser, environment)) == 5 + sin(1) + sin(2) + y**2 + sin(y)
+        
+        stats = parser.get_parse_cache_stats()
+        assert stats["hits"] + stats["misses"] == 3
+        
+        # an exponent of -1 gives the inverse function, and |x| of a matrix is its determinant,
+        # so these depend on the values of the arguments, and are parsed with them instead.
+        assert parser.parse("g(y, -1)", LmatEnvDefStore(parser, environment)) == asin(y) + Abs(y)
+        assert parser.parse(r"g(\begin{bmatrix} 1 & 2 \\ 3 & 4 \end{bmatrix}, 1)", LmatEnvDefStore(parser, environment)) == sin(Matrix([[1, 2], [3, 4]])) - 2
+    
+    def test_function_template_singularities(self):
+        parser = LatexParser()
+        y = Symbol('y')
+        
+        environment = {
+            "functions": {
+                "f": { "args": [ "x" ], "expr": r"\frac{x}{x}" },
+                "g": { "args": [ "x" ], "expr": r"0 \cdot \frac{1}{x}" },
+                "h": { "args": [ "x" ], "expr": r"x - x" },
+            }
+        }
+        
+        # the evaluated template of f is 1, but calling it with 0 should be 0 / 0, as if its body was parsed with the value.
+        assert parser.parse("f(0)", LmatEnvDefStore(parser, environment)) is S.NaN
+        assert parser.parse("g(0)", LmatEnvDefStore(parser, environment)) is S.NaN
+        assert parser.parse(r"h(\infty)", LmatEnvDefStore(parser, environment)) is S.NaN
+        
+        assert parser.parse("f(2) + g(2) + f(y) + g(y)", LmatEnvDefStore(parser, environment)) == 2
+    
+    def test_definition_resolution(self):
+        parser = LatexParser()
+        x, y = symbols('x y')
+        
+        definitions_store = LmatEnvDefStore(parser, {
+            "variables": { "a": "x + 1", "b": "a^2", "c": "a + b", "d": "y" },
+            "functions": { "f": { "args": [ "y" ], "expr": "y + b" } },
+        })
+        
+        # every variable is parsed once, even though a is used by b, c and f, whose body is parsed into both of its templates.
+        assert parser.parse("c + f(2)", definitions_store) == 2 * (x + 1)**2 + x + 3
+        
+        stats = parser.get_parse_cache_stats()
+        assert stats["hits"] + stats["misses"] == 6
+        
+        # only the definitions depending on a are resolved again.
+        assert definitions_store.set_variable("a", "2") == { Symbol("b"), Symbol("c"), Function("f") }
+        assert definitions_store.set_variable("e", "3") == set()
+        assert parser.parse("c + f(2) + d", definitions_store) == 12 + y
+        
+        # defining a symbol invalidates the definitions using it as a plain symbol.
+        assert definitions_store.set_variable("y", "5") == { Symbol("d") }
+        assert definitions_store.set_function("f", None) == set()
+        assert parser.parse("d + f(2)", definitions_store) == 5 + Function("f")(2)
+    
+    def test_cyclic_definitions(self):
+        parser = LatexParser()
+        
+        definitions_store = LmatEnvDefStore(parser, {
+            "variables": { "a": "b + 1", "b": "c", "c": "2 a" },
+            "functions": { "f": { "args": [ "x" ], "expr": "f(x - 1)" } },
+        })
+        
+        with pytest.raises(CyclicDefinitionError) as error:
+            parser.parse("a", definitions_store)
+        
+        assert [ str(key) for key in error.value.cycle ] == [ "a", "b", "c", "a" ]
+        
+        with pytest.raises(CyclicDefinitionError):
+            parser.parse("f(1)", definitions_store)
+        
+        # the cycle is broken by redefining one of its variables.
+        definitions_store.set_variable("c", "2")
+        assert parser.parse("a", definitions_store) == 3
+    
+    def test_cyclic_definitions_reparsed(self):
+        parser = LatexParser()
+        
+        environment = {
+            "functions": {
+                "f": { "args": [ "x" ], "expr": "f(x) + 1" },
+                "g": { "args": [ "x" ], "expr": "h(x)" },
+                "h": { "args": [ "x" ], "expr": "g(x)" },
+            }
+        }
+        
+        # the second parse transforms the cached parse tree of each body, which must report the cycle the same way.
+        for _ in range(2):
+            with pytest.raises(CyclicDefinitionError) as error:
+                parser.parse("f(1)", LmatEnvDefStore(parser, environment))
+            
+            assert [ str(key) for key in error.value.cycle ] == [ "f", "f" ]
+            
+            with pytest.raises(CyclicDefinitionError) as error:
+                parser.parse("g(1)", LmatEnvDefStore(parser, environment))
+            
+            assert [ str(key) for key in error.value.cycle ] == [ "g", "h", "g" ]
+    
+    def test_parse_cache(self):
+        parser = LatexParser(parse_cache_size=2)
+        a, b = symbols('a b')
+        
+        # "a + b" is first parsed tree-less, then into a cached tree,
+        # which should be transformed in the environment of each parse.
+        assert parser.parse("a + b", LmatEnvDefStore(parser, { "variables": { "a": "2" } })) == b + 2
+        assert parser.parse("a + b", LmatEnvDefStore(parser, { "variables": { "a": "3" } })) == b + 3
+        assert parser.parse("a + b", LmatEnvDefStore(parser, {})) == a + b
+        
+        stats = parser.get_parse_cache_stats()
+        
+        assert stats["max_size"] == 2
+        assert stats["size"] == 2
+        # "a + b" twice, and "2" and "3" once.
+        assert stats["misses"] == 4
+        assert stats["hits"] == 1
+        
+        parser.parse("a", LmatEnvDefStore(parser, {}))
+        parser.parse("a - b", LmatEnvDefStore(parser, {}))
+        
+        assert parser.get_parse_cache_stats()["size"] == 2
+        
+        parser.clear_parse_cache()
+        
+        assert parser.get_parse_cache_stats() == dict(size=0, max_size=2, hits=0, misses=0)
+    
+    def test_treeless_parse(self):
+        parser = LatexParser()
+        
+        latex_strs = [
+            r"\frac{a_{1} + b}{\sqrt{x^2 + 1}} \cdot \sin(x)^2 + \int_0^1 t^2 d t",
+            r"f(2) + |x - 1|",
+            r"\begin{bmatrix} 1 & 2 \\ 3 & 4 \end{bmatrix}^T \cdot \begin{bmatrix} 1 \\ 0 \end{bmatrix}",
+            r"x^2 + 1 = 0",
+            # systems of relations need positions, so they are parsed into a tree instead.
+            r"a < b < c",
+            r"\begin{cases} x + y = 1 \\ x - y = 0 \end{cases}",
+        ]
+        
+        environment = { "variables": { "a_{1}": "2" }, "functions": { "f": { "args": [ "x" ], "expr": "x^2" } } }
+        
+        for latex_str in latex_strs:
+            treeless_result = parser.parse(latex_str, LmatEnvDefStore(parser, environment))
+            tree_result = parser.parse(latex_str, LmatEnvDefStore(parser, environment))
+            
+            if isinstance(tree_result, SystemOfExpr):
+                assert treeless_result.get_all_expr() == tree_result.get_all_expr()
+                assert treeless_result.get_all_locations() == tree_result.get_all_locations()
+            else:
+                assert treeless_result == tree_result
+    
+    def test_parser_cache_file(self, tmp_path):
+        assert os.path.isfile(LatexParser.get_parser_cache_file(LatexParser.DEFAULT_GRAMMAR_FILE))
+        
+        grammar_dir = os.path.dirname(LatexParser.DEFAULT_GRAMMAR_FILE)
+        
+        for grammar_file in [ "latex_math_grammar.lark", "greek_symbols.lark" ]:
+            shutil.copy(os.path.join(grammar_dir, grammar_file), tmp_path)
+        
+        grammar_file = str(tmp_path / "latex_math_grammar.lark")
+        parser_cache_file = LatexParser.get_parser_cache_file(grammar_file)
+        
+        assert os.path.dirname(parser_cache_file) == str(tmp_path)
+        assert LatexParser.get_parser_cache_file(grammar_file) == parser_cache_file
+        
+        # editing an imported grammar file should also result in a new parser.
+        with open(tmp_path / "greek_symbols.lark", "a") as f:
+            f.write("\n")
+            
+        assert LatexParser.get_parser_cache_file(grammar_file) != parser_cache_file
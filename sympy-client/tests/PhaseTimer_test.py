@@ -0,0 +1,51 @@
+from sympy_client.command_handlers.CommandHandler import handle_message
+from sympy_client.command_handlers.EvalHandler import *
+from sympy_client.grammar.LatexParser import LatexParser
+from sympy_client.PhaseTimer import PhaseTimer, timed_phase
+
+
+## Tests the per phase timing of requests.
+class TestPhaseTimer:
+    parser = LatexParser()
+
+    def test_eval_timing(self):
+        payload = handle_message(EvalHandler(self.parser), {
+            "expression": "a + b",
+            "environment": { "variables": { "a": "2", "b": "a + 1" } },
+            "timing": True,
+        })
+
+        assert payload['result'] == "5"
+
+        timing = payload['metadata']['timing']
+
+        # the expression is parsed for the first time, so it is transformed while parsing, instead of in a separate transform phase.
+        assert set(timing.keys()) == { "definitions", "parse", "evaluate", "convert_units", "print", "total" }
+
+        for phase_time in timing.values():
+            assert phase_time['wall_ms'] >= 0
+            assert phase_time['cpu_ms'] >= 0
+
+        assert sum(t['wall_ms'] for p, t in timing.items() if p != "total") <= timing['total']['wall_ms'] + 0.01
+
+    def test_no_timing_by_default(self):
+        payload = handle_message(EvalHandler(self.parser), { "expression": "1 + 1", "environment": {} })
+
+        assert payload['result'] == "2"
+        assert "timing" not in payload['metadata']
+
+    def test_nested_phases(self):
+        timer = PhaseTimer()
+
+        with timer.activate():
+            with timed_phase("outer"):
+                with timed_phase("inner"):
+                    pass
+
+        assert set(timer.get_metadata().keys()) == { "outer", "total" }
+
+        # phases outside an active timer are not recorded anywhere.
+        with timed_phase("outer"):
+            pass
+
+        assert set(timer.get_metadata().keys()) == { "outer", "total" }
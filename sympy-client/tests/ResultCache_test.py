@@ -0,0 +1,179 @@
+import asyncio
+import json
+import multiprocessing
+import threading
+from typing import override
+
+from sympy_client import ResultCache as ResultCacheModule
+from sympy_client.command_handlers.CommandHandler import (CommandHandler,
+                                                          CommandResult)
+from sympy_client.LatexMathClient import LatexMathClient
+from sympy_client.ResultCache import ResultCache
+
+from .LatexMathClient_test import receive, run_with_client
+
+
+class CountResult(CommandResult):
+    def __init__(self, count: int):
+        super().__init__()
+        self.count = count
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(self.count)
+
+# Returns the number of messages it has handled.
+class CountingHandler(CommandHandler):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self._lock = threading.Lock()
+
+    @override
+    def handle(self, message: dict) -> CountResult:
+        with self._lock:
+            self.count += 1
+            return CountResult(self.count)
+
+# Stores the given number of payloads in the result cache of the given file.
+def put_results(database_file: str, process_index: int, result_count: int):
+    result_cache = ResultCache(database_file, [ "eval" ])
+
+    for i in range(result_count):
+        result_cache.put(result_cache.get_key("eval", { "expression": f"{process_index} + {i}" }), dict(result=i))
+
+    result_cache.close()
+
+
+## Tests the persistent cache of handler results.
+class TestResultCache:
+
+    def test_get_put(self, tmp_path):
+        result_cache = ResultCache(str(tmp_path / "results.db"), [ "eval" ])
+        message = { "expression": "x + x", "environment": { "variables": { "x": "2" } } }
+
+        key = result_cache.get_key("eval", message)
+        assert result_cache.get(key) is None
+
+        result_cache.put(key, dict(result="4", status="success"))
+        assert result_cache.get(key) == dict(result="4", status="success")
+
+        # the key is independent of the order of the message keys, and of its session.
+        assert result_cache.get_key("eval", { "environment": message['environment'], "expression": "x + x", "session_id": "note" }) == key
+        assert result_cache.get_key("eval", { **message, "environment": {} }) != key
+
+        # timed messages and handlers which are not cached are never stored.
+        assert result_cache.get_key("eval", { **message, "timing": True }) is None
+        assert result_cache.get_key("solve", message) is None
+
+        stats = result_cache.get_stats()
+        assert (stats['size'], stats['hits'], stats['misses']) == (1, 1, 1)
+
+        assert result_cache.clear() == 1
+        assert result_cache.get(key) is None
+
+        result_cache.close()
+
+    def test_version_stamp(self, tmp_path, monkeypatch):
+        database_file = str(tmp_path / "results.db")
+
+        result_cache = ResultCache(database_file, [ "eval" ])
+        key = result_cache.get_key("eval", { "expression": "1" })
+        result_cache.put(key, dict(result="1"))
+        result_cache.close()
+
+        result_cache = ResultCache(database_file, [ "eval" ])
+        assert result_cache.get(key) == dict(result="1")
+        result_cache.close()
+
+        # results of other versions are deleted when the cache is opened.
+        monkeypatch.setattr(ResultCacheModule, "RESULT_CACHE_VERSION", ResultCacheModule.RESULT_CACHE_VERSION + 1)
+
+        result_cache = ResultCache(database_file, [ "eval" ])
+        assert result_cache.get_stats()['size'] == 0
+        assert result_cache.get_key("eval", { "expression": "1" }) != key
+        result_cache.close()
+
+    def test_version_stamp_sources(self, tmp_path, monkeypatch):
+        source_dir = tmp_path / "sympy_client"
+        (source_dir / "grammar").mkdir(parents=True)
+        (source_dir / "Handler.py").write_text("result = 1\n")
+        (source_dir / "grammar" / "latex_math.lark").write_text("start: NUMBER\n")
+        monkeypatch.setattr(ResultCacheModule, "SOURCE_DIR", str(source_dir))
+
+        version_stamp = ResultCache.get_version_stamp()
+        assert ResultCache.get_version_stamp() == version_stamp
+
+        # a change of the client code, or of the grammar, changes the stamp.
+        (source_dir / "Handler.py").write_text("result = 2\n")
+        handler_stamp = ResultCache.get_version_stamp()
+        assert handler_stamp != version_stamp
+
+        (source_dir / "grammar" / "latex_math.lark").write_text("start: NAME\n")
+        assert ResultCache.get_version_stamp() not in (version_stamp, handler_stamp)
+
+        # files other than sources, e.g. compiled modules, do not.
+        grammar_stamp = ResultCache.get_version_stamp()
+        (source_dir / "Handler.pyc").write_bytes(b"\0")
+        assert ResultCache.get_version_stamp() == grammar_stamp
+
+    def test_eviction(self, tmp_path):
+        payload_size = len(json.dumps(dict(result="0")))
+        result_cache = ResultCache(str(tmp_path / "results.db"), [ "eval" ], max_bytes=3 * payload_size)
+
+        keys = [ result_cache.get_key("eval", { "expression": str(i) }) for i in range(4) ]
+
+        for i, key in enumerate(keys[:3]):
+            result_cache.put(key, dict(result=str(i)))
+
+        # using the first result makes the second one the least recently used.
+        assert result_cache.get(keys[0]) is not None
+        result_cache.put(keys[3], dict(result="3"))
+
+        assert [ result_cache.get(key) is not None for key in keys ] == [ True, False, True, True ]
+        assert result_cache.get_stats()['bytes'] == 3 * payload_size
+
+        result_cache.close()
+
+    def test_concurrent_processes(self, tmp_path):
+        database_file = str(tmp_path / "results.db")
+        ResultCache(database_file, [ "eval" ]).close()
+
+        processes = [ multiprocessing.Process(target=put_results, args=(database_file, i, 50)) for i in range(4) ]
+
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join(timeout=30)
+            assert process.exitcode == 0
+
+        result_cache = ResultCache(database_file, [ "eval" ])
+        assert result_cache.get_stats()['size'] == 200
+        result_cache.close()
+
+    def test_client(self, tmp_path):
+        handler = CountingHandler()
+        result_cache = ResultCache(str(tmp_path / "results.db"), [ "count" ])
+
+        client = LatexMathClient(result_cache=result_cache)
+        client.register_handler("count", handler)
+
+        async def plugin(connection):
+            for _ in range(2):
+                await connection.send("count|" + json.dumps({ "expression": "x" }))
+                assert (await receive(connection))[1]['result'] == 1
+
+            await connection.send("count|" + json.dumps({ "expression": "x", "timing": True }))
+            assert (await receive(connection))[1]['result'] == 2
+
+            await connection.send("cache-clear|{}")
+            assert (await receive(connection))[1]['result'] == dict(cleared=1)
+
+            await connection.send("count|" + json.dumps({ "expression": "x" }))
+            assert (await receive(connection))[1]['result'] == 3
+
+        asyncio.run(run_with_client(client, plugin))
+        result_cache.close()
+
+        assert handler.count == 3
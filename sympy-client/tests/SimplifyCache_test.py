@@ -0,0 +1,65 @@
+from sympy import Matrix, Symbol, cos, sin, sqrt
+from sympy_client.command_handlers.EvalHandler import EvalHandler
+from sympy_client.command_handlers.FactorHandler import FactorHandler
+from sympy_client.grammar.LatexParser import LatexParser
+from sympy_client.SimplifyCache import SimplifyCache
+
+
+## Tests the cache of simplified expressions shared between the eval, expand, factor and apart handlers.
+class TestSimplifyCache:
+    parser = LatexParser()
+
+    def test_shared_between_handlers(self):
+        simplify_cache = SimplifyCache()
+        eval_handler = EvalHandler(self.parser, simplified_exprs=simplify_cache)
+        factor_handler = FactorHandler(self.parser, simplified_exprs=simplify_cache)
+
+        message = { "expression": r"\sin^2(x) + \cos^2(x) + x^2 - 2", "environment": {} }
+
+        assert eval_handler.handle(message).getPayload()['result'] == "x^{2} - 1"
+        assert factor_handler.handle(message).getPayload()['result'] == r"\left(x - 1\right) \, \left(x + 1\right)"
+
+        stats = simplify_cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['size']) == (1, 1, 1)
+
+    def test_assumptions(self):
+        simplify_cache = SimplifyCache()
+        x = Symbol('x')
+        x_positive = Symbol('x', positive=True)
+
+        # the assumptions of the symbols are part of the key, so the results do not leak between environments.
+        assert simplify_cache.simplify(sqrt(x**2)) == sqrt(x**2)
+        assert simplify_cache.simplify(sqrt(x_positive**2)) == x_positive
+        assert simplify_cache.get_stats()['misses'] == 2
+
+    def test_eviction(self):
+        x = Symbol('x')
+        expressions = [ sin(x)**2 + cos(x)**2 + i for i in range(4) ]
+
+        simplify_cache = SimplifyCache(max_entries=2)
+
+        for expression in expressions:
+            simplify_cache.simplify(expression)
+
+        assert simplify_cache.get_stats()['size'] == 2
+
+        # each entry is the expression and its simplified form, 10 and 1 nodes.
+        simplify_cache = SimplifyCache(max_nodes=25)
+
+        for expression in expressions:
+            simplify_cache.simplify(expression)
+
+        assert simplify_cache.get_stats()['size'] == 2
+        assert simplify_cache.get_stats()['nodes'] == 22
+
+        simplify_cache.simplify(expressions[-1])
+        simplify_cache.simplify(expressions[0])
+        assert (simplify_cache.get_stats()['hits'], simplify_cache.get_stats()['misses']) == (1, 5)
+
+    def test_matrices(self):
+        simplify_cache = SimplifyCache()
+        x = Symbol('x')
+
+        # mutable matrices are simplified, but not cached.
+        assert simplify_cache.simplify(Matrix([ sin(x)**2 + cos(x)**2 ])) == Matrix([ 1 ])
+        assert simplify_cache.get_stats()['size'] == 0
@@ -5,6 +5,8 @@ from sympy_client.command_handlers.SolveHandler import *
 
 from sympy import *
 import sympy.physics.units as units
+from sympy_client.UnitAliases import UNIT_ALIASES
+from sympy_client.UnitsUtils import _alias_to_unit, str_to_unit
 
 
 ## Tests the unit conversions.
@@ -84,4 +86,24 @@ class TestUnitConversion:
         handler = EvalHandler(self.parser)
         result = handler.handle({"expression": r"5 {gee} \cdot (10 {minutes})^2", "environment": {}})
         assert result.sympy_expr == 17651970.0 * units.meters
-        
\ No newline at end of file
+        
+    def test_unit_aliases_up_to_date(self):
+        import GenUnitAliases
+        
+        assert GenUnitAliases.build_unit_aliases() == UNIT_ALIASES, "UnitAliases.py is out of date, regenerate it with GenUnitAliases.py"
+        
+    def test_str_to_unit(self):
+        assert str_to_unit("km") is str_to_unit("km")
+        assert str_to_unit("km") == units.kilometer
+        assert str_to_unit("km")._latex_repr == "km"
+        assert str_to_unit("kilometers")._latex_repr == "kilometers"
+        assert str_to_unit("NotAUnit") is None
+        
+        # strings which are not units are not memoized, so looking them up does not grow the cache.
+        cache_size = _alias_to_unit.cache_info().currsize
+        
+        for i in range(100):
+            assert str_to_unit(f"NotAUnit{i}") is None
+        
+        assert _alias_to_unit.cache_info().currsize == cache_size
+        assert _alias_to_unit.cache_info().maxsize == len(UNIT_ALIASES)
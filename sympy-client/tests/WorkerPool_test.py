@@ -0,0 +1,344 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import override
+
+import pytest
+from sympy_client.command_handlers.CommandHandler import (CommandHandler,
+                                                          CommandResult,
+                                                          StreamedResult)
+from sympy_client.EnvironmentSessions import (SESSION_DELTA_HISTORY,
+                                              EnvironmentSessions, SessionSync,
+                                              register_session_evictor)
+from sympy_client.WorkerPool import (WorkerError, WorkerKilledError,
+                                     WorkerPool)
+
+
+class ValueResult(CommandResult):
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(self.value)
+
+class EchoHandler(CommandHandler):
+    @override
+    def handle(self, message: dict) -> ValueResult:
+        return ValueResult(message['value'])
+
+# Busy loops until the deadline in its message, simulating a runaway evaluation.
+class SpinHandler(CommandHandler):
+    @override
+    def handle(self, message: dict) -> ValueResult:
+        spin_until = time.time() + message['seconds']
+        while time.time() < spin_until:
+            pass
+        return ValueResult("spun")
+
+class PidHandler(CommandHandler):
+    @override
+    def handle(self, message: dict) -> ValueResult:
+        return ValueResult(os.getpid())
+
+class RaisingHandler(CommandHandler):
+    @override
+    def handle(self, message: dict) -> ValueResult:
+        raise ValueError("handler failed")
+
+class CountResult(StreamedResult):
+    def __init__(self, count: int):
+        super().__init__()
+        self.count = count
+
+    @override
+    def stream(self):
+        for i in range(self.count):
+            yield CommandResult.result(i)
+
+    @override
+    def getPayload(self) -> dict:
+        return CommandResult.result(self.count)
+
+# Streams the numbers from 0 up to the 'value' key of its message.
+class CountHandler(CommandHandler):
+    @override
+    def handle(self, message: dict) -> CountResult:
+        return CountResult(message['value'])
+
+# Counts how many times it has handled a message in the current process.
+class TallyHandler(CommandHandler):
+    tally = 0
+
+    @override
+    def handle(self, message: dict) -> ValueResult:
+        TallyHandler.tally += 1
+        return ValueResult(TallyHandler.tally)
+
+# Echoes the environment of its message.
+class EnvironmentHandler(CommandHandler):
+    @override
+    def handle(self, message: dict) -> ValueResult:
+        return ValueResult(message['environment'])
+
+# The ids of the sessions closed in the current process.
+closed_session_ids = []
+
+class ClosedSessionsHandler(CommandHandler):
+    @override
+    def handle(self, message: dict) -> ValueResult:
+        return ValueResult(closed_session_ids)
+
+# Must be module level, so worker processes can import it.
+def create_test_handlers() -> dict[str, CommandHandler]:
+    register_session_evictor('test', closed_session_ids.append)
+
+    return {
+        "echo": EchoHandler(),
+        "spin": SpinHandler(),
+        "raise": RaisingHandler(),
+        "count-worker": CountHandler(),
+        "pid": PidHandler(),
+        "tally": TallyHandler(),
+        "environment": EnvironmentHandler(),
+        "closed-sessions": ClosedSessionsHandler(),
+    }
+
+SYMPY_CLIENT_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+# Starts a worker, prints its pid, and exits while the worker is busy, without running any cleanup.
+PARENT_SCRIPT = """
+import os, threading, time
+from sympy_client.WorkerPool import WorkerPool
+from tests.WorkerPool_test import create_test_handlers
+
+if __name__ == "__main__":
+    pool = WorkerPool(create_test_handlers, worker_count=1)
+    print(pool.run(0, "pid", {})['result'], flush=True)
+    threading.Thread(target=pool.run, args=(1, "spin", { "seconds": 60 }), daemon=True).start()
+    time.sleep(0.5)
+    os._exit(0)
+"""
+
+# Whether the process with the given pid is still running, an exited process which has not been reaped is not.
+def is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split()[2] != "Z"
+    except FileNotFoundError:
+        return True
+
+# Wait up to the given number of seconds for the process with the given pid to exit, returns whether it did.
+def wait_exited(pid: int, timeout: float = 10) -> bool:
+    deadline = time.time() + timeout
+
+    while time.time() < deadline and is_running(pid):
+        time.sleep(0.05)
+
+    return not is_running(pid)
+
+
+class TestWorkerPool:
+
+    def test_run(self):
+        pool = WorkerPool(create_test_handlers, worker_count=1)
+
+        try:
+            assert sorted(pool.handler_keys) == ["closed-sessions", "count-worker", "echo", "environment", "pid", "raise", "spin", "tally"]
+            assert pool.run(0, "echo", { "value": 5 }) == CommandResult.result(5)
+
+            with pytest.raises(WorkerError, match="handler failed"):
+                pool.run(1, "raise", {})
+
+            # the worker should still be usable after a handler error.
+            assert pool.run(2, "echo", { "value": 6 }) == CommandResult.result(6)
+        finally:
+            pool.shutdown()
+
+    def test_cancel_respawns_worker(self):
+        pool = WorkerPool(create_test_handlers, worker_count=1)
+
+        try:
+            pool.wait_ready()
+
+            spin_error = []
+
+            def run_spin():
+                try:
+                    pool.run("spin", "spin", { "seconds": 60 })
+                except WorkerKilledError as e:
+                    spin_error.append(e)
+
+            spin_thread = threading.Thread(target=run_spin)
+            spin_thread.start()
+
+            # wait for the spin request to be picked up by the worker.
+            while not pool.cancel("spin"):
+                time.sleep(0.01)
+
+            spin_thread.join(timeout=10)
+
+            assert not spin_thread.is_alive()
+            assert len(spin_error) == 1
+
+            assert not pool.cancel("spin")
+            assert pool.run("echo", "echo", { "value": 1 }) == CommandResult.result(1)
+        finally:
+            pool.shutdown()
+
+    def test_parallel_workers(self):
+        pool = WorkerPool(create_test_handlers, worker_count=2)
+
+        try:
+            pool.wait_ready()
+
+            spin_results = []
+            spin_threads = [ threading.Thread(target=lambda i=i: spin_results.append(pool.run(i, "spin", { "seconds": 1 }))) for i in range(2) ]
+
+            start_time = time.time()
+
+            for spin_thread in spin_threads:
+                spin_thread.start()
+
+            for spin_thread in spin_threads:
+                spin_thread.join()
+
+            # both spins should run at the same time, on separate workers.
+            assert time.time() - start_time < 1.9
+            assert len(spin_results) == 2
+        finally:
+            pool.shutdown()
+
+    def test_shutdown_busy_worker(self):
+        pool = WorkerPool(create_test_handlers, worker_count=1)
+        worker_pid = pool.run(0, "pid", {})['result']
+        spin_error = []
+
+        def run_spin():
+            try:
+                pool.run(1, "spin", { "seconds": 60 })
+            except WorkerKilledError as e:
+                spin_error.append(e)
+
+        spin_thread = threading.Thread(target=run_spin)
+        spin_thread.start()
+
+        # wait for the spin request to be picked up by the worker.
+        while 1 not in pool._busy_workers:
+            time.sleep(0.01)
+
+        pool.shutdown()
+        spin_thread.join(timeout=10)
+
+        assert len(spin_error) == 1
+        assert not is_running(worker_pid)
+
+    def test_exit_with_parent(self):
+        # the parent is killed while its worker is busy, so neither the pool nor multiprocessing can stop the worker.
+        parent_process = subprocess.run(
+            [ sys.executable, "-c", PARENT_SCRIPT ],
+            cwd=SYMPY_CLIENT_DIR, capture_output=True, text=True
+        )
+
+        assert wait_exited(int(parent_process.stdout.strip()))
+
+    def test_max_tasks_per_worker(self):
+        pool = WorkerPool(create_test_handlers, worker_count=1, max_tasks_per_worker=2)
+
+        try:
+            pids = [ pool.run(i, "pid", {})['result'] for i in range(4) ]
+
+            assert pids[0] == pids[1]
+            assert pids[1] != pids[2]
+            assert pids[2] == pids[3]
+        finally:
+            pool.shutdown()
+
+    def test_warmup(self):
+        # the failing message should not stop the remaining warmup.
+        pool = WorkerPool(create_test_handlers, worker_count=1, warmup_messages=[ ("tally", {}), ("raise", {}), ("unknown", {}), ("tally", {}) ])
+
+        try:
+            pool.wait_ready()
+            time.sleep(0.5)
+
+            # the warmup only starts once start_warmup is called.
+            assert pool.run(0, "tally", {}) == CommandResult.result(1)
+
+            pool.start_warmup()
+            time.sleep(0.5)
+
+            assert pool.run(1, "tally", {}) == CommandResult.result(4)
+        finally:
+            pool.shutdown()
+
+    def test_warmup_preempted(self):
+        pool = WorkerPool(create_test_handlers, worker_count=1, warmup_messages=[ ("spin", { "seconds": 0.2 }) ] * 50)
+
+        try:
+            pool.wait_ready()
+            pool.start_warmup()
+            time.sleep(0.5)
+
+            # the request only waits for the current warmup message, not the entire warmup.
+            start_time = time.time()
+            assert pool.run(0, "echo", { "value": 1 }) == CommandResult.result(1)
+            assert time.time() - start_time < 1
+        finally:
+            pool.shutdown()
+
+    def test_sessions(self):
+        pool = WorkerPool(create_test_handlers, worker_count=1)
+        sessions = EnvironmentSessions(on_close=pool.close_session)
+
+        try:
+            sessions.open("note", { "variables": { "a": "1" } })
+            opened_state = sessions.get_state("note")
+
+            assert pool.run(0, "environment", { "session_id": "note" }, session=opened_state)['result'] == { "variables": { "a": "1" } }
+
+            # the worker knows the opened session, so it only receives the delta.
+            delta = { "variables": { "a": None, "b": "2" } }
+            sessions.update("note", delta)
+            updated_state = sessions.get_state("note")
+
+            assert updated_state.get_sync(opened_state.version) == SessionSync("note", updated_state.version, None, ((opened_state.version, delta),))
+            assert pool.run(1, "environment", { "session_id": "note" }, session=updated_state)['result'] == { "variables": { "b": "2" } }
+
+            # processes further behind than the kept deltas receive the entire environment.
+            for i in range(SESSION_DELTA_HISTORY):
+                sessions.update("note", { "variables": { "b": str(i) } })
+
+            assert sessions.get_state("note").get_sync(opened_state.version).environment == { "variables": { "b": str(SESSION_DELTA_HISTORY - 1) } }
+            assert pool.run(2, "environment", { "session_id": "note" }, session=sessions.get_state("note"))['result'] == { "variables": { "b": str(SESSION_DELTA_HISTORY - 1) } }
+
+            # closing the session evicts it in the worker, before it handles its next message.
+            sessions.close("note")
+            assert pool.run(3, "closed-sessions", {})['result'] == [ "note" ]
+        finally:
+            pool.shutdown()
+
+    def test_worker_stats(self):
+        pool = WorkerPool(create_test_handlers, worker_count=2)
+
+        try:
+            pool.wait_ready()
+
+            # the stats are collected from the idle workers when asked for, not with every reply.
+            worker_stats = pool.worker_stats()
+
+            assert len({ stats['pid'] for stats in worker_stats }) == 2
+            assert all(stats['rss_bytes'] > 0 for stats in worker_stats)
+
+            # the workers are returned to the pool afterwards.
+            assert { pool.run(i, "pid", {})['result'] for i in range(4) } <= { stats['pid'] for stats in worker_stats }
+        finally:
+            pool.shutdown()